@@ -26,21 +26,28 @@ If not, see http://www.gnu.org/licenses . See also top-level README
 and LICENSE files.
 """
 
-# Handle versioneer
-from ._version import get_versions
-
-versions = get_versions()
-__version__ = versions["version"]
-__git_revision__ = versions["full-revisionid"]
-del get_versions, versions
-
-import glob
-import os
-import pathlib
-
-from . import engine
-from .dem import *
-from .engine.simple.input_simple import HertzMindlin, SpringDashpot, ThorntonNing
+import importlib
+
+__all__ = [
+    "DEM",
+    "HertzMindlin",
+    "SpringDashpot",
+    "ThorntonNing",
+    "engines",
+    "models",
+]
+
+# Submodules and objects are resolved on first access (PEP 562) so that a plain
+# "import pygran_sim" does not pay for mpi4py, scipy, or the engine discovery.
+# Each MPI rank in a short batch job would otherwise import all of them upfront.
+_lazy_modules = ("base", "dem", "engine", "tools")
+
+_lazy_objects = {
+    "DEM": (".dem", "DEM"),
+    "HertzMindlin": (".engine.simple.input_simple", "HertzMindlin"),
+    "SpringDashpot": (".engine.simple.input_simple", "SpringDashpot"),
+    "ThorntonNing": (".engine.simple.input_simple", "ThorntonNing"),
+}
 
 
 class _findEngines:
@@ -50,6 +57,10 @@ class _findEngines:
     as DEM.simulation.engines.foo."""
 
     def __init__(self):
+        import glob
+        import os
+        import pathlib
+
         _dir, _ = __file__.split("__init__.py")
         engine_paths = glob.glob(os.path.join(_dir, "engine", "*"))
 
@@ -60,15 +71,61 @@ class _findEngines:
                 setattr(self, name, f"pygran_sim.engine.{name}.engine_{name}")
 
 
-engines = _findEngines()
-
-# for legacy/old version compatible API
-models = type(
-    "contact_models",
-    (),
-    {
-        "HertzMindlin": HertzMindlin,
-        "ThorntonNing": ThorntonNing,
-        "SpringDashpot": SpringDashpot,
-    },
-)
+def _versions():
+    # Handle versioneer: get_versions may call git, so it is deferred as well
+    from ._version import get_versions
+
+    versions = get_versions()
+    return {
+        "__version__": versions["version"],
+        "__git_revision__": versions["full-revisionid"],
+    }
+
+
+def _models():
+    # for legacy/old version compatible API
+    from .engine.simple.input_simple import HertzMindlin, SpringDashpot, ThorntonNing
+
+    return type(
+        "contact_models",
+        (),
+        {
+            "HertzMindlin": HertzMindlin,
+            "ThorntonNing": ThorntonNing,
+            "SpringDashpot": SpringDashpot,
+        },
+    )
+
+
+def __getattr__(name):
+    """Imports submodules, contact models, and the engine registry on first use.
+    Resolved values are cached in the module namespace so that subsequent lookups
+    bypass this function altogether."""
+
+    if name in _lazy_modules:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _lazy_objects:
+        module, attr = _lazy_objects[name]
+        value = getattr(importlib.import_module(module, __name__), attr)
+    elif name in ("__version__", "__git_revision__"):
+        versions = _versions()
+        globals().update(versions)
+        return versions[name]
+    elif name == "engines":
+        value = _findEngines()
+    elif name == "models":
+        value = _models()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals())
+        | set(__all__)
+        | set(_lazy_modules)
+        | {"__version__", "__git_revision__"}
+    )
@@ -0,0 +1,101 @@
+"""
+A module for managing reusable NumPy buffers exchanged with DEM engines
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import numpy
+
+__all__ = ["BufferPool"]
+
+
+class BufferPool:
+    """A pool of NumPy arrays reused across calls that exchange data with an engine (e.g. gathering
+    positions every few hundred steps), so that no memory is allocated per call. Each buffer is keyed
+    by the caller, e.g. by (name, type, count), and is reallocated only when more rows are requested
+    than it holds.
+
+    :param growth: factor by which a buffer is over-allocated when it grows, so that steadily
+        increasing sizes (e.g. during insertion) do not trigger a reallocation on every call
+    :type growth: float
+
+    :Example:
+      pool = BufferPool()
+      coords = pool.get(("x", 1, 3), (natoms, 3), numpy.float64)
+    """
+
+    def __init__(self, growth=1.25):
+        self.growth = growth
+        self._buffers = {}
+
+    def get(self, key, shape, dtype):
+        """Returns a C-contiguous array of the requested shape that is reused by later calls with the same key.
+        Its content is undefined, and is overwritten by the next user of the same key.
+
+        :param key: buffer key
+        :type key: hashable
+
+        :param shape: shape of the array, the first dim of which can vary between calls
+        :type shape: tuple
+
+        :param dtype: data type of the array
+        :type dtype: numpy.dtype
+
+        :rtype: numpy.ndarray
+        """
+        buffer = self._buffers.get(key)
+        nrows = shape[0]
+
+        if (
+            buffer is None
+            or buffer.shape[0] < nrows
+            or buffer.shape[1:] != tuple(shape[1:])
+            or buffer.dtype != dtype
+        ):
+            if buffer is not None and buffer.shape[1:] == tuple(shape[1:]):
+                nrows = max(nrows, int(buffer.shape[0] * self.growth))
+
+            buffer = numpy.empty((nrows,) + tuple(shape[1:]), dtype=dtype)
+            self._buffers[key] = buffer
+
+        return buffer[: shape[0]]
+
+    def clear(self):
+        """Releases all buffers"""
+        self._buffers.clear()
+
+    @property
+    def nbytes(self):
+        """Total memory held by the pool in bytes"""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def __len__(self):
+        return len(self._buffers)
+
+    def __repr__(self):
+        return "BufferPool({} buffers, {} bytes)".format(len(self), self.nbytes)
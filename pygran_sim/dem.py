@@ -35,7 +35,6 @@ except Exception:
     MPI = None
 
 import importlib
-import logging
 import os
 import shutil
 import sys
@@ -43,11 +42,25 @@ import warnings
 from datetime import datetime
 
 from . import __version__
+from .profiling import StartupProfile
+from .logger import closeLogger, getLogger
 from .tools import _setConfig
 
 __all__ = ["DEM"]
 
 
+def _delegate(method):
+    """Marks a DEM method as a plain pass-through to the engine. Upon instantiation, such methods
+    are replaced by the engine's own bound methods (see :meth:`DEM._bind`)."""
+    method._delegate = True
+    return method
+
+
+def _idle(*args, **kwargs):
+    """No-op used in place of engine methods on procs that do not run any simulation"""
+    return None
+
+
 class DEM:
     """A generic class that handles communication for a DEM object in a way that
     is independent of the engine used."""
@@ -59,6 +72,41 @@ class DEM:
         :param model: contact mechanical model (default SpringDashpot)
         :type model: model
 
+        :param library: path to the engine's shared library (default: read from ~/.config/PyGran or discovered)
+        :type library: str
+
+        :param library_roots: additional directories in which to look for the engine's shared library
+        :type library_roots: list
+
+        :param library_search: recursively search (depth-limited) for the shared library if not found elsewhere
+        :type library_search: bool or int
+
+        :param log: where log records are written: 'root' (default: rank 0 of each simulation writes pygran.log in the
+            output dir), 'rank' (every proc writes its own pygran.<rank>.log), or None (no logging)
+        :type log: str
+
+        :param log_level: verbosity of the log ('DEBUG', 'INFO' (default), 'WARNING', etc.)
+        :type log_level: str
+
+        :param reuse: keep the engine's library and instance alive after :meth:`close` for the next DEM object
+            created in this process (default False, LIGGGHTS only)
+        :type reuse: bool
+
+        :param thermo: sample the thermo quantities of 'print' into :attr:`thermo` every this many steps during runs,
+            optionally with the number of samples kept: every or (every, capacity) (default None: no sampling)
+        :type thermo: int or tuple
+
+        :param profile: record the calls (count, total and max wall time) to each engine method and each command
+            verb into :attr:`profile`, written to profile.json in the output dir on close (default False)
+        :type profile: bool
+
+        :param timing: record the timing breakdown of every run into :attr:`timings` (default False)
+        :type timing: bool
+
+        :param memory: report the memory footprint of every proc into :attr:`memory_reports` after every run,
+            and if a number, warn when the resident set size of any proc exceeds this many bytes (default None)
+        :type memory: bool or float
+
         .. todo:: Provide a description of each arg in pargs
         """
         kwargs["engine"] = kwargs.get(
@@ -77,8 +125,12 @@ class DEM:
                 eng_path + ".input_" + eng_name
             ).SpringDashpot
 
+        # Time each phase of the startup: see self.startup_profile
+        self.startup_profile = StartupProfile()
+
         # Overwrite kwargs from the contact model's params
-        pargs = kwargs["model"](**kwargs).kwargs
+        with self.startup_profile.phase("model"):
+            pargs = kwargs["model"](**kwargs).kwargs
 
         if MPI:
             self.comm = MPI.COMM_WORLD
@@ -93,55 +145,33 @@ class DEM:
         self.model = str(pargs["model"]).split("'")[1].split(".")[-1]
         self.pargs = pargs
         self.library = None
+        library = self.pargs.pop("library", None)  # user-specified library path
+        log = self.pargs.pop("log", "root")
+        log_level = self.pargs.pop("log_level", "INFO")
         self._dir, _ = os.path.abspath(__file__).split(os.path.basename(__file__))
 
-        # Check if .config files eixsts else create it
-        # Only one process needs to do this
-        if not self.rank:
-            if kwargs["engine"] == "pygran_sim.engine.liggghts.engine_liggghts":
-                self.library, src, version = _setConfig(
-                    wdir=self._dir, engine=self.pargs["engine"].split("engine_")[1]
-                )
-            else:
-                self.library, src, version = None, None, None
-
-            if version:
-                self.pargs["__version__"] = version
-
-            if src:
-                self.pargs["liggghts_src"] = src
-
-            for slave in range(1, self.tProcs):
-                self.comm.send(self.library, dest=slave, tag=0)
-                self.comm.send("__version__" in self.pargs, dest=slave, tag=1)
-
-                if "__version__" in self.pargs:
-                    self.comm.send(self.pargs["__version__"], dest=slave, tag=2)
-        else:
-            self.library = self.comm.recv(source=0, tag=0)
-            if self.comm.recv(source=0, tag=1):
-                self.pargs["__version__"] = self.comm.recv(source=0, tag=2)
+        # Check if .config files eixsts else create it. Only one process needs to do this: the library path,
+        # its version, and the output name are packed in a single bundle that is broadcast to all procs.
+        bundle = {}
 
-        if "output" not in self.pargs:
-            # The idea is to create a unique output name that depends on the current time. Since the processes are not in sunc, it's safer
-            # to create the output name on the master processor and then send it to the slaves.
+        with self.startup_profile.phase("configure"):
             if not self.rank:
-                time = datetime.now()
-                self.pargs["output"] = "out-{}-{}:{}:{}-{}.{}.{}".format(
-                    self.model,
-                    time.hour,
-                    time.minute,
-                    time.second,
-                    time.day,
-                    time.month,
-                    time.year,
-                )
-
-                for slave in range(1, self.tProcs):
-                    self.comm.send(self.pargs["output"], dest=slave, tag=3)
+                try:
+                    bundle = self._configure(library)
+                except Exception as err:
+                    bundle = {"error": "{}: {}".format(type(err).__name__, err)}
+
+            if self.comm:
+                bundle = self.comm.bcast(bundle, root=0)
+
+        # Any failure on the root proc aborts all procs the same way instead of leaving them hanging
+        if "error" in bundle:
+            raise RuntimeError(
+                "DEM configuration failed on rank 0: {}".format(bundle["error"])
+            )
 
-            else:
-                self.pargs["output"] = self.comm.recv(source=0, tag=3)
+        self.library = bundle["library"]
+        self.pargs.update(bundle["pargs"])
 
         if self.nSim > self.tProcs:
             print(
@@ -161,14 +191,24 @@ class DEM:
                 # In case of odd number of procs, place the one left on the last communicator
                 self.color = self.nSim
 
-        if self.comm:
-            self.split = self.comm.Split(color=self.color, key=self.rank)
-            # update rank locally for each comm
-            self.rank = self.split.Get_rank()
-        else:
-            self.split = self.comm
+        with self.startup_profile.phase("split"):
+            if self.comm:
+                self.split = self.comm.Split(color=self.color, key=self.rank)
+                # update rank locally for each comm
+                self.rank = self.split.Get_rank()
+            else:
+                self.split = self.comm
+
+        # Resolve once which simulation (if any) this proc drives, based on its local rank: public
+        # methods are then bound directly to the engine instead of looping over all colors on every call.
+        self._index = next(
+            (i for i in range(self.nSim) if self.rank < self.pProcs * (i + 1)), None
+        )
+        self._active = self._index is not None
+        self._closed = False
 
-        module = importlib.import_module(self.pargs["engine"])
+        with self.startup_profile.phase("import"):
+            module = importlib.import_module(self.pargs["engine"])
 
         output = (
             self.pargs["output"]
@@ -176,6 +216,10 @@ class DEM:
             else (self.pargs["output"] + "-multi-mode-" + str(self.color))
         )
 
+        # All I/O paths are absolute and bound to this object: the working dir is never changed, so that
+        # several DEM objects can coexist (or run concurrently) in one process
+        output = os.path.abspath(output)
+
         if not self.split.Get_rank():
             if os.path.exists(output):
                 warnings.warn(f"output dir {output} already exists. Proceeding ...")
@@ -185,32 +229,41 @@ class DEM:
         # Make sure output in self.pargs is updated before instantiating dem class
         self.pargs["output"] = output
 
-        self.split.barrier()  # Synchronize all procs
+        if "traj" in self.pargs:
+            self.pargs["traj"]["dir"] = os.path.join(output, self.pargs["traj"]["dir"])
 
-        os.chdir(self.pargs["output"])
+        if self.pargs.get("restart"):
+            restart = list(self.pargs["restart"])
+            restart[1] = os.path.join(output, restart[1])
+            self.pargs["restart"] = tuple(restart)
 
-        logging.basicConfig(
-            filename="pygran.log",
-            format="%(asctime)s:%(levelname)s: %(message)s",
-            level=logging.DEBUG,
-        )
+        self.split.barrier()  # Synchronize all procs
 
-        self.dem = module.__engine__(
-            split=self.split, library=self.library, **self.pargs
-        )
+        # Records are queued and written to file by a background thread: see pygran_sim.logger
+        self.logger = getLogger(output, self.rank, sink=log, level=log_level)
+
+        with self.startup_profile.phase("engine"):
+            self.dem = module.__engine__(
+                split=self.split,
+                library=self.library,
+                startup_profile=self.startup_profile,
+                logger=self.logger,
+                **self.pargs,
+            )
+            self._bind()
 
         if not self.rank:
 
-            logging.info(
-                "Initializing simulation with PyGranSim version {}".format(__version__)
+            self.logger.info(
+                "Initializing simulation with PyGranSim version %s", __version__
             )
-            logging.info("Initializing MPI for a total of {} cores".format(self.tProcs))
+            self.logger.info("Initializing MPI for a total of %d cores", self.tProcs)
 
             if self.nSim > 1:
-                logging.info("Running {} simulations: multi-mode on".format(self.nSim))
+                self.logger.info("Running %d simulations: multi-mode on", self.nSim)
 
             if self.pProcs > 0:
-                logging.info("Using {} cores per simulation".format(self.pProcs))
+                self.logger.info("Using %d cores per simulation", self.pProcs)
 
             from sys import argv
 
@@ -220,107 +273,323 @@ class DEM:
                 "__main__.py"
             ):  # user is importing their script as a module, dont back up:
                 if scriptFile.endswith(".py"):
-                    logging.debug("Attempting to backup {} file".format(scriptFile))
+                    self.logger.debug("Attempting to backup %s file", scriptFile)
                     try:
                         shutil.copyfile(
-                            os.path.join(os.getcwd(), "..", scriptFile),
-                            "{}".format(scriptFile.split(".")[0] + "-bk.py"),
+                            os.path.abspath(scriptFile),
+                            os.path.join(
+                                output,
+                                os.path.basename(scriptFile).split(".")[0] + "-bk.py",
+                            ),
                         )
                     except Exception:
-                        logging.debug("Backup failed")
+                        self.logger.debug("Backup failed")
 
             else:
-                logging.info("Input script run as a module. Not backing up file")
+                self.logger.info("Input script run as a module. Not backing up file")
+
+        # Setup commands are buffered and submitted to the engine in one call (queries submit them earlier)
+        with self.dem.batch() as batch:
+            # All I/O done ~ phew! Now initialize DEM
+            # Import and setup all meshes as rigid walls
+            with self.startup_profile.phase("initialize"):
+                self.initialize()
+
+            # Setup material properties
+            with self.startup_profile.phase("createProperty"):
+                if "materials" in self.pargs:
+                    for item in self.pargs["materials"].keys():
+                        # Overloaded function 'createProperty' will partition material propreties based on MPI's coloring split scheme
+                        # Do we even need this?
+                        if isinstance(
+                            self.pargs["materials"][item], tuple
+                        ):  # Make sure we're not reading user-defined scalars (e.g. density)
+                            self.createProperty(item, *self.pargs["materials"][item])
+
+            with self.startup_profile.phase("setupPrint"):
+                self.setupPrint()
+
+            if batch is not None:
+                with self.startup_profile.phase("commands"):
+                    batch.flush()
 
-        # All I/O done ~ phew! Now initialize DEM
-        # Import and setup all meshes as rigid walls
-        self.initialize()
+        # Create links to the particle/mesh files (easily accessible to the user)
+        self._link()
 
-        # Setup material properties
-        if "materials" in self.pargs:
-            for item in self.pargs["materials"].keys():
-                # Overloaded function 'createProperty' will partition material propreties based on MPI's coloring split scheme
-                # Do we even need this?
-                if isinstance(
-                    self.pargs["materials"][item], tuple
-                ):  # Make sure we're not reading user-defined scalars (e.g. density)
-                    self.createProperty(item, *self.pargs["materials"][item])
+        # Reduce startup timings across all procs of this simulation (min/max/mean per phase)
+        self.startup_profile.reduce(self.split)
 
-        self.setupPrint()
+        if not self.rank:
+            self.startup_profile.write(os.path.join(output, "startup.json"))
 
-        # Create links to the particle/mesh files (easily accessible to the user)
-        if "pfile" in self.pargs["traj"]:
-            if self.pargs["traj"]["pfile"]:
-                self.pfile = os.path.join(
-                    self.pargs["output"], "traj", self.pargs["traj"]["pfile"]
-                )
-                self.pargs["traj"]["pfile"] = os.path.abspath(self.pfile)
-            else:
-                self.pfile = None
+    def _configure(self, library=None):
+        """Internal function that looks up the engine library and its version, and sets up
+        the output name. Must be called on the root proc only.
+
+        :param library: user-specified library path
+        :type library: str
+
+        :return: library path and the pargs to update on all procs
+        :rtype: dict
+        """
+        pargs = {}
+
+        if self.pargs["engine"] == "pygran_sim.engine.liggghts.engine_liggghts":
+            library, src, version = _setConfig(
+                wdir=self._dir,
+                engine=self.pargs["engine"].split("engine_")[1],
+                library=library,
+                roots=self.pargs.get("library_roots"),
+                search=self.pargs.get("library_search", False),
+            )
+        else:
+            library, src, version = None, None, None
+
+        if version:
+            pargs["__version__"] = version
+
+        if src:
+            pargs["liggghts_src"] = src
+
+        if "output" not in self.pargs:
+            # The idea is to create a unique output name that depends on the current time. Since the processes are not in sunc, it's safer
+            # to create the output name on the master processor and then send it to the slaves.
+            time = datetime.now()
+            pargs["output"] = "out-{}-{}:{}:{}-{}.{}.{}".format(
+                self.model,
+                time.hour,
+                time.minute,
+                time.second,
+                time.day,
+                time.month,
+                time.year,
+            )
 
-        if "mfile" in self.pargs["traj"]:
-            if self.pargs["traj"]["mfile"]:
-                self.mfile = os.path.join(
-                    self.pargs["output"], "traj", self.pargs["traj"]["mfile"]
+        return {"library": library, "pargs": pargs}
+
+    def _link(self):
+        """Internal function that sets the absolute paths of the particle/mesh trajectory files (pfile/mfile)"""
+        traj = self.pargs["traj"]
+
+        for key in ("pfile", "mfile"):
+            if key in traj:
+                setattr(
+                    self,
+                    key,
+                    os.path.join(traj["dir"], traj[key]) if traj[key] else None,
                 )
-                self.pargs["traj"]["mfile"] = os.path.abspath(self.mfile)
-            else:
-                self.mfile = None
 
+    def __getattr__(self, name):
+        """Delegates any public engine method/attribute not exposed by this class (e.g. extract_variable)
+        to the engine of this proc's color. The resolved attribute is cached on the instance.
+        """
+        if name.startswith("_") or "dem" not in self.__dict__:
+            raise AttributeError(
+                "{!r} object has no attribute {!r}".format(type(self).__name__, name)
+            )
+
+        attr = getattr(self.dem, name) if self._active else _idle
+        setattr(self, name, attr)
+
+        return attr
+
+    def _bind(self):
+        """Internal function that binds all pass-through methods (see :func:`_delegate`) directly
+        to the engine's bound methods, so that calls through this class cost the same as calling
+        the engine itself. Procs that do not run any simulation are bound to a no-op."""
+        for name, method in vars(DEM).items():
+            if getattr(method, "_delegate", False) and hasattr(self.dem, name):
+                setattr(self, name, getattr(self.dem, name) if self._active else _idle)
+
+    @_delegate
     def scatter_atoms(self, name, type, count, data):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.scatter_atoms(name, type, count, data)
+        return self.dem.scatter_atoms(name, type, count, data)
 
+    @_delegate
     def createParticles(self, type, style, *args):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.createParticles(type, style, *args)
-                break
+        return self.dem.createParticles(type, style, *args)
 
+    @_delegate
     def createGroup(self, *group):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.createGroup(*group)
-                break
+        return self.dem.createGroup(*group)
 
+    @_delegate
     def set(self, *args):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.set(*args)
-                break
+        return self.dem.set(*args)
 
+    @_delegate
     def gather_atoms(self, name, type, count):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.gather_atoms(name, type, count)
+        return self.dem.gather_atoms(name, type, count)
 
+    @_delegate
+    def gather_atoms_array(self, name, type, count, out=None):
+        """
+        Gathers a per-atom property of all particles, ordered by atom ID, into a NumPy array of shape (natoms, count).
+        Unless `out` is supplied, the array is reused (overwritten) by the next call with the same args.
+
+        :param name: name of the property (x, v, f, omega, radius, type, id, etc.)
+        :type name: str
+        :param type: 0 for integer properties, 1 for double properties
+        :type type: int
+        :param count: number of values per atom
+        :type count: int
+        :param out: preallocated array to gather into
+        :type out: numpy.ndarray
+        :rtype: numpy.ndarray
+        """
+        return self.dem.gather_atoms_array(name, type, count, out)
+
+    @_delegate
+    def scatter_atoms_array(self, name, type, count, data):
+        """
+        Scatters a per-atom property of all particles, ordered by atom ID, from a NumPy array.
+
+        :param name: name of the property (x, v, f, omega, radius, type, id, etc.)
+        :type name: str
+        :param type: 0 for integer properties, 1 for double properties
+        :type type: int
+        :param count: number of values per atom
+        :type count: int
+        :param data: array of natoms * count values
+        :type data: numpy.ndarray
+        """
+        return self.dem.scatter_atoms_array(name, type, count, data)
+
+    @_delegate
     def get_natoms(self):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.get_natoms()
+        return self.dem.get_natoms()
 
+    @_delegate
     def extract_global(self, name, type):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.extract_global(name, type)
+        return self.dem.extract_global(name, type)
 
+    @_delegate
     def extract_compute(self, id, style, type):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.extract_compute(id, style, type)
+        return self.dem.extract_compute(id, style, type)
 
+    @_delegate
     def extract_fix(self, id, style, type, i=0, j=0):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.extract_fix(id, style, type, i, j)
+        return self.dem.extract_fix(id, style, type, i, j)
+
+    @_delegate
+    def extract_atom_array(self, name, ghost=False):
+        """
+        Returns a per-atom property (x, v, f, omega, radius, rmass, type, id, mask) of the particles owned by
+        this proc as a NumPy array that shares memory with the engine (no copy).
+
+        :param name: name of the property
+        :type name: str
+
+        :param ghost: include ghost particles
+        :type ghost: bool
+
+        :rtype: numpy.ndarray
+
+        .. warning:: The array is invalid after any run, insertion/deletion of particles, or reneighboring.
+        """
+        return self.dem.extract_atom_array(name, ghost)
+
+    @property
+    def thermo(self):
+        """
+        In-memory time series of the thermo quantities (step, followed by the keywords of 'print'), sampled every
+        so many steps during runs (see the DEM keyword 'thermo') into a ring buffer, e.g. sim.thermo['atoms'].
+        None if the keyword is not set.
+
+        :rtype: pygran_sim.engine.liggghts.thermo.ThermoRecorder
+        """
+        return self.dem.thermo if self._active else None
+
+    @property
+    def timings(self):
+        """
+        History of timing breakdowns, one per run if the DEM keyword 'timing' is set: steps, natoms, wall time
+        across procs (min/avg/max), imbalance (max/avg), steps_per_s, particle_steps_per_s, and the loop time and
+        steps reported by LIGGGHTS (loop_time, loop_steps, summed over the chunks of a chunked run) along with
+        the time per section (Pair, Neigh, Comm, Output, Modify, Other) of its last chunk (sections).
+
+        :rtype: list of dict
+        """
+        return self.dem.timings if self._active else None
+
+    @property
+    def memory_reports(self):
+        """
+        History of memory reports, one per run if the DEM keyword 'memory' is set (see :meth:`memory_report`)
+
+        :rtype: list of dict
+        """
+        return self.dem.memory_reports if self._active else None
+
+    @property
+    def profile(self):
+        """
+        Call counts and wall times per engine method and per command verb, recorded when the DEM keyword
+        'profile' is set (None otherwise).
+
+        :rtype: pygran_sim.profiling.CallProfile
+        """
+        return self.dem.profile if self._active else None
+
+    @_delegate
+    def batch(self):
+        """
+        Context manager that buffers the commands issued within it and submits them to the engine in one call
+        on exit (LIGGGHTS: one lammps_file call on a temporary script in the output dir). Queries such as
+        extract_global or gather_atoms submit the buffered commands first.
+
+        :Example:
+          with sim.batch():
+              for name in names:
+                  sim.command("variable {} equal 0".format(name))
+        """
+        return self.dem.batch()
+
+    @_delegate
+    def memory_report(self, warn=None):
+        """
+        Reports the memory footprint of every proc of this simulation: resident set size (rss), Python-side
+        buffers, owned (nlocal) and ghost (nghost) particles, each as min/avg/max/total and the rank of the max
+        across procs, along with the neighbor list statistics of the last run and the memory LIGGGHTS allocated
+        per proc. Collective: call it on all procs.
+
+        :param warn: log a warning if the RSS of any proc exceeds this many bytes (default: the DEM keyword 'memory')
+        :type warn: float
+
+        :rtype: dict
+
+        :Example:
+          report = sim.memory_report(warn=2e9)
+          print(report["rss"]["max"], report["nghost"]["max"], report["neighbors"])
+        """
+        return self.dem.memory_report(warn)
+
+    @_delegate
+    def extract_local(self, name, group=None, species=None):
+        """
+        Extracts a per-atom property of the (selected) particles owned by this proc along with their global IDs,
+        without any communication. Use the reductions in :mod:`pygran_sim.parallel` to combine the results
+        across procs, e.g. parallel.histogram(values, bins=50, comm=sim.split).
+
+        :param name: name of the property (x, v, f, omega, radius, rmass, type, id, mask)
+        :type name: str
+
+        :param group: extract only particles in this group
+        :type group: str
 
+        :param species: extract only particles of this species (1, 2, ...)
+        :type species: int
+
+        :return: (ids, values) in local order
+        :rtype: tuple of numpy.ndarray
+        """
+        return self.dem.extract_local(name, group, species)
+
+    @_delegate
     def initialize(self):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.initialize()
-                break
+        return self.dem.initialize()
 
+    @_delegate
     def velocity(self, *args):
         """Assigns velocity to selected particles.
 
@@ -330,12 +599,9 @@ class DEM:
         :note: See `link <https://www.cfdem.com/media/DEM/docu/velocity.html>`_
                for info on keywords and their associated values.
         """
+        return self.dem.velocity(*args)
 
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.velocity(*args)
-                break
-
+    @_delegate
     def addViscous(self, **args):
         """Adds a viscous damping force :math:`F` proportional
         to each particle's velocity :math:`v`:
@@ -349,41 +615,94 @@ class DEM:
         :param scale: (species, ratio) tuple to scale gamma with
         :type scale: tuple
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.addViscous(**args)
+        return self.dem.addViscous(**args)
 
+    @_delegate
     def insert(self, species, value, **args):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.insert(species, value, **args)
+        return self.dem.insert(species, value, **args)
 
-    def run(self, nsteps, dt=None, itype=None):
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.run(nsteps, dt, itype)
+    @_delegate
+    def run(self, nsteps, dt=None, itype=None, every=None, callback=None):
+        """
+        Runs the simulation for a number of steps, optionally calling a Python function every few steps.
+        A chunked run costs about the same as a single run: LIGGGHTS sets up the run only once, unless
+        the callback modifies the system.
+
+        :param nsteps: number of steps
+        :type nsteps: int
+
+        :param dt: timestep
+        :type dt: float
+
+        :param itype: integrator type
+        :type itype: str
+
+        :param every: call `callback` every this many steps
+        :type every: int
+
+        :param callback: function called as callback(step, atoms), where atoms maps per-atom property names
+            (x, v, f, ...) to zero-copy arrays of the particles owned by this proc. Return True after writing
+            to the arrays.
+        :type callback: callable
+
+        :Example:
+          def report(step, atoms):
+              print(step, atoms["v"].max())
+
+          sim.run(10**5, every=1000, callback=report)
+        """
+        return self.dem.run(nsteps, dt, itype, every, callback)
+
+    @_delegate
+    def run_async(self, nsteps, dt=None, itype=None, every=None, callback=None):
+        """
+        Starts a run on a worker thread and returns its future immediately, so that Python code (analysis of
+        previous results, file transfers, other simulations) can overlap with the run. Only one run can be in
+        flight at a time; until its future is done, any call into the engine from this thread raises a
+        RuntimeError, and zero-copy arrays extracted before the run must not be used (see the engine's
+        run_async for the full rules).
+
+        :param nsteps: number of steps
+        :type nsteps: int
+
+        :param dt: timestep
+        :type dt: float
 
+        :param itype: integrator type
+        :type itype: str
+
+        :param every: call `callback` every this many steps (see :meth:`run`)
+        :type every: int
+
+        :param callback: function called as callback(step, atoms) on the worker thread
+        :type callback: callable
+
+        :rtype: concurrent.futures.Future
+
+        :Example:
+          coords = sim.extract_local("x")
+          future = sim.run_async(10**5)
+          analyze(coords)
+          future.result()
+        """
+        return self.dem.run_async(nsteps, dt, itype, every, callback)
+
+    @_delegate
     def setupParticles(self):
         """Internal function used to create particles in LIGGGHTS"""
-
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.setupParticles()
-                break
+        return self.dem.setupParticles()
 
     def createProperty(self, name, *args):
         """
         Internal function used to create material and interaction properties
         """
+        if self._active:
+            if isinstance(args[0], tuple):
+                self.dem.createProperty(name, *args[self._index])
+            else:
+                self.dem.createProperty(name, *args)
 
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                if isinstance(args[0], tuple):
-                    self.dem.createProperty(name, *args[i])
-                else:
-                    self.dem.createProperty(name, *args)
-                break
-
+    @_delegate
     def importMeshes(self, name=None):
         """
         An internal function that is called during DEM initialization for importing meshes.
@@ -395,10 +714,7 @@ class DEM:
 
         :note: Can import only one mesh specified by the `name` keyword.
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.importMeshes(name)
-                break
+        return self.dem.importMeshes(name)
 
     def importMesh(self, name, file, mtype, **kwargs):
         """
@@ -418,11 +734,10 @@ class DEM:
         """
         mfile = os.path.abspath(file)
 
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.importMesh(name, mfile, mtype, **kwargs)
-                break
+        if self._active:
+            self.dem.importMesh(name, mfile, mtype, **kwargs)
 
+    @_delegate
     def setupWall(self, wtype, species=None, plane=None, peq=None):
         """
         Creates a primitive (virtual) or surface (mesh) wall
@@ -442,19 +757,15 @@ class DEM:
           primitiveWall = setupWall(species=1, wtype='primitive', plane = 'zplane', peq = 0.0)
 
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.setupWall(wtype, species, plane, peq)
+        return self.dem.setupWall(wtype, species, plane, peq)
 
+    @_delegate
     def setupPrint(self):
         """
         Updates the print setup used to set which variables to write to file,
         and their format.
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.setupPrint()
-                break
+        return self.dem.setupPrint()
 
     def setupWrite(self, only_mesh=False, name=None):
         """
@@ -469,28 +780,16 @@ class DEM:
         :rtype: str or list(str)
 
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                dumpID = self.dem.setupWrite(only_mesh, name)
+        if self._active:
+            dumpID = self.dem.setupWrite(only_mesh, name)
 
-                # Create or update links to the particle/mesh files (easily accessible to the user)
-                if "pfile" in self.lmp.pargs["traj"]:
-                    self.pfile = os.path.join(
-                        self.lmp.pargs["output"],
-                        "traj",
-                        self.lmp.pargs["traj"]["pfile"],
-                    )
+            # Create or update links to the particle/mesh files (easily accessible to the user)
+            self._link()
 
-                if "mfile" in self.lmp.pargs["traj"]:
-                    self.mfile = os.path.join(
-                        self.lmp.pargs["output"],
-                        "traj",
-                        self.lmp.pargs["traj"]["mfile"],
-                    )
+            return dumpID
 
-                return dumpID
-
-    def setupIntegrate(self, itype="nve/sphere", group="all"):
+    @_delegate
+    def setupIntegrate(self, itype=None, group=None):
         """
         Controls how Newton's eqs are integrated in time.
 
@@ -500,12 +799,10 @@ class DEM:
         :type group: str
 
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.setupIntegrate(name, itype, group)
-                break
+        return self.dem.setupIntegrate(itype, group)
 
-    def integrate(self, steps, dt):
+    @_delegate
+    def integrate(self, steps, dt=None, every=None, callback=None):
         """
         Advance system in time.
 
@@ -513,13 +810,15 @@ class DEM:
         :type steps: int
         :param dt: timestep
         :type dt: float
+        :param every: call `callback` every this many steps (see :meth:`run`)
+        :type every: int
+        :param callback: function called as callback(step, atoms) after every chunk of `every` steps
+        :type callback: callable
 
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.integrate(steps, dt, itype)
-                break
+        return self.dem.integrate(steps, dt, every, callback)
 
+    @_delegate
     def remove(self, name):
         """
         Delete variable/object by name.
@@ -527,45 +826,41 @@ class DEM:
         :param name: name of variable/object to unfix
         :type name: str
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.remove(name)
-                break
+        return self.dem.remove(name)
 
+    @_delegate
     def monitor(self, **args):
         """
-        Not yet documented
+        Computes the time average of a global quantity (e.g. kinetic energy) and writes it to a file.
+
+        :return: reader of the file, updated incrementally after every run: its data attribute is the (nrows, 2)
+            array of steps and averages written so far
+        :rtype: pygran_sim.engine.liggghts.monitor.MonitorReader
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.monitor(**args)
+        return self.dem.monitor(**args)
 
+    @_delegate
     def plot(self, fname, xlabel, ylabel, output=None, xscale=None):
         """
         Not yet documented
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.plot(fname, xlabel, ylabel, output, xscale)
-                break
+        return self.dem.plot(fname, xlabel, ylabel, output, xscale)
 
+    @_delegate
     def moveMesh(self, name, **args):
         """
         Not yet documented
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                return self.dem.moveMesh(name, **args)
+        return self.dem.moveMesh(name, **args)
 
+    @_delegate
     def saveas(self, name, fname):
         """
         Not yet documented
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.saveas(name, fname)
-                break
+        return self.dem.saveas(name, fname)
 
+    @_delegate
     def command(self, cmd):
         """
         Pass a command to DEM engine.
@@ -573,26 +868,24 @@ class DEM:
         :param cmd: command specific to the DEM engine
         :type cmd: str
         """
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.command(cmd)
-                break
+        return self.dem.command(cmd)
 
     def close(self):
         """
-        Internal function that frees allocated memory and changes directory back to current working directory.
+        Internal function that frees allocated memory. Calling it more than once has no effect.
         """
         # Dont call this since the user might be running multiple simulations in one script
         # MPI.Finalize()
-        for i in range(self.nSim):
-            if self.rank < self.pProcs * (i + 1):
-                self.dem.close()
-                break
+        if self._active and not self._closed:
+            self.dem.close()
+
+        if "logger" in self.__dict__:
+            closeLogger(self.logger)
 
-        os.chdir("..")
+        self._closed = True
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        os.chdir("..")
+        self.close()
@@ -43,6 +43,7 @@ See the README file in the top-level LAMMPS directory.
 
 """
 
+import contextlib
 import glob
 import logging
 import os
@@ -50,6 +51,8 @@ import sys
 import traceback
 from typing import List
 
+from ..profiling import CallProfile, StartupProfile
+
 
 class EngineAPI:
     """A class that implements a python interface for DEM computations
@@ -84,6 +87,16 @@ class EngineAPI:
     :param boundary: setup boundary conditions (see `ref <https://www.cfdem.com/media/DEM/docu/boundary.html>`_), e.g. ('p', 'p', 'p') -> periodic boundaries in 3D.
     :type boundary: tuple
 
+    :param startup_profile: records the time spent in each startup phase (see :class:`pygran_sim.profiling.StartupProfile`)
+    :type startup_profile: StartupProfile
+
+    :param logger: logger to write to (default: the 'pygran_sim' logger). See :func:`pygran_sim.logger.getLogger`.
+    :type logger: logging.Logger
+
+    :param profile: record call counts and latencies of every public method and command verb
+        (see :class:`pygran_sim.profiling.CallProfile`), written to profile.json in the output dir at close (default False)
+    :type profile: bool
+
     .. todo:: This class should be generic (not specific to liggghts), must handle all I/O, garbage collection, etc. and then moved to DEM.py
     """
 
@@ -96,43 +109,70 @@ class EngineAPI:
         comm=None,
         dim=3,
         units="si",
+        startup_profile=None,
+        logger=None,
+        profile=False,
         **kwargs,
     ):
         """Initialize some settings and specifications"""
 
+        # Opt-in timing of engine calls: methods are wrapped on this instance only if enabled
+        self.profile = CallProfile() if profile else None
+
+        if self.profile is not None:
+            self.profile.attach(self)
+
+        # Per-phase startup timings, shared with the DEM object that instantiated this engine
+        self.startup_profile = startup_profile or StartupProfile()
+
+        # Logger of the DEM object that instantiated this engine (see pygran_sim.logger.getLogger)
+        self.logger = logger or logging.getLogger("pygran_sim")
+
         if kwargs.get("rank"):
             raise NotImplementedError
 
         rank = comm.Get_rank() if comm is not None else 0
 
-        if not rank and library:
-            logging.info("Using " + library + " for DEM computations")
+        if library:
+            self.logger.info("Using %s for DEM computations", library)
 
         try:
-            self.lib = self.load_library(library)
+            with self.startup_profile.phase("load_library"):
+                self.lib = self.load_library(library)
         except RuntimeError:
             etype, value, tb = sys.exc_info()
             traceback.print_exception(etype, value, tb)
             raise RuntimeError(f"Could not load dynamic library: {library}")
 
         self.kwargs = kwargs
-        path = os.getcwd()
+
+        # Output dir: relative I/O paths are resolved against it, never against the current working dir
+        self.path = os.path.abspath(kwargs.get("output", os.getcwd()))
 
         if "__version__" in kwargs:
             self.__version__ = kwargs["__version__"]
 
+        self.logger.info("Working in %s", self.path)
+
         if not rank:
-            logging.info("Working in {}".format(path))
-            logging.info("Creating i/o directories")
+            self.logger.info("Creating i/o directories")
 
-            if not os.path.exists(kwargs["traj"]["dir"]):
-                os.makedirs(kwargs["traj"]["dir"])
+            os.makedirs(self._abspath(kwargs["traj"]["dir"]), exist_ok=True)
 
             if kwargs["restart"]:
-                if not os.path.exists(kwargs["restart"][1]):
-                    os.makedirs(kwargs["restart"][1])
+                os.makedirs(self._abspath(kwargs["restart"][1]), exist_ok=True)
+
+        self.logger.info("Instantiated DEMPy object")
 
-            logging.info("Instantiated DEMPy object")
+    def _abspath(self, fname):
+        """Resolves a filename relative to the output dir of this engine
+
+        :param fname: filename (absolute filenames are returned unchanged)
+        :type fname: str
+
+        :rtype: str
+        """
+        return os.path.join(self.path, fname)
 
     def load_library(self, library):
         """Function for loading library file.
@@ -161,12 +201,24 @@ class EngineAPI:
         """
         raise NotImplementedError
 
+    def batch(self):
+        """Context manager that submits the commands issued within it in one call to the engine,
+        if the engine supports it
+
+        :rtype: context manager
+        """
+        return contextlib.nullcontext()
+
     def get_variable(self, name):
         raise NotImplementedError
 
     def set_variable(self, name, value):
         raise NotImplementedError
 
+    def extract_variables(self, names, group="all", out=None):
+        """Extracts the values of several atom-style variables for the particles owned by this proc"""
+        raise NotImplementedError
+
     def get_natoms(self):
         raise NotImplementedError
 
@@ -176,6 +228,14 @@ class EngineAPI:
     def gather_atoms(self, name, type, count):
         return self.lmp.gather_atoms(name, type, count)
 
+    def gather_atoms_array(self, name, type, count, out=None):
+        """Gathers a per-atom property of all particles, ordered by atom ID, into a (reusable) NumPy array"""
+        raise NotImplementedError
+
+    def scatter_atoms_array(self, name, type, count, data):
+        """Scatters a per-atom property of all particles, ordered by atom ID, from a NumPy array"""
+        raise NotImplementedError
+
     def insert(self, species, value, **kwargs) -> str:
         """
         This function inserts particles, and assigns particle velocities if requested by the user. If species is 'all',
@@ -276,8 +336,7 @@ class EngineAPI:
         """
         Specify which variables to write to file, and their format
         """
-        if not self.rank:
-            logging.info("Setting up printing options")
+        self.logger.info("Setting up printing options")
 
     def setupWrite(self, only_mesh=False, name=None):
         """
@@ -302,7 +361,7 @@ class EngineAPI:
         raise NotImplementedError
 
     ### Dynamical methods
-    def run(self, nsteps, dt=None, itype=None):
+    def run(self, nsteps, dt=None, itype=None, every=None, callback=None):
         """Runs a simulation for number of steps specified by the user
 
         :param nsteps: number of steps the integrator should take
@@ -313,6 +372,12 @@ class EngineAPI:
 
         :param dt: timestep
         :type dt: float
+
+        :param every: call `callback` every this many steps
+        :type every: int
+
+        :param callback: function called as callback(step, atoms) after every chunk of `every` steps
+        :type callback: callable
         """
 
         name = self.setupIntegrate(itype=itype)
@@ -325,15 +390,18 @@ class EngineAPI:
                     print("Could not find dt in user-supplied dictionary. Aborting ...")
                 sys.exit()
 
-        self.integrate(nsteps, dt)
+        self.integrate(nsteps, dt, every, callback)
 
-        # See if any variables were set to be monitered by the user
-        if self._monitor:
-            for vname, fname in self._monitor:
-                getattr(self, vname).append(np.loadtxt(fname))
+        # Read the rows written to the files of monitored variables during this run
+        for reader in self._monitor:
+            reader.read()
 
         return name
 
+    def run_async(self, nsteps, dt=None, itype=None, every=None, callback=None):
+        """Starts a run on a worker thread and returns its concurrent.futures.Future"""
+        raise NotImplementedError
+
     def moveMesh(self, name, **args):
         """Control how a mesh (specified by name) moves in time
 
@@ -359,12 +427,14 @@ class EngineAPI:
         """
         raise NotImplementedError
 
-    def integrate(self, steps, dt=None):
+    def integrate(self, steps, dt=None, every=None, callback=None):
         """
         Run simulation in time
         """
-        if not self.rank:
-            logging.info("Integrating the system for {} steps".format(steps))
+        if callback is not None:
+            raise NotImplementedError("Run callbacks are not supported by this engine.")
+
+        self.logger.info("Integrating the system for %d steps", steps)
 
         for tup in self.monitorList:
             self.lmp.command("compute {} {} {}".format(*tup))
@@ -375,21 +445,42 @@ class EngineAPI:
         self.lmp.command("run {}".format(steps))
 
     ### Extraction methods
-    def extractCoords(self):
+    def extract_atom_array(self, name, ghost=False):
+        """
+        Returns a per-atom property of the particles owned by this proc as a NumPy array that
+        shares memory with the engine (no copy)
+        """
+        raise NotImplementedError
+
+    def extract_local(self, name, group=None, species=None):
+        """
+        Extracts a per-atom property of the (selected) particles owned by this proc, with their
+        global IDs, as a tuple of NumPy arrays (ids, values)
         """
-        Extracts atomic positions from a certian frame and adds it to coords
+        raise NotImplementedError
+
+    def memory_report(self, warn=None):
+        """
+        Reports the memory footprint (resident set size, owned and ghost particles, Python-side buffers)
+        of every proc of this simulation, warning if any proc uses more than `warn` bytes
         """
         raise NotImplementedError
 
-    def extractVelocities(self):
+    def extractCoords(self, group=None, species=None):
         """
-        Extracts atomic positions from a certian frame and adds it to coords
+        Extracts the positions of all (or selected) particles, ordered by atom ID, as an (N, 3) array
         """
         raise NotImplementedError
 
-    def extractForces(self):
+    def extractVelocities(self, group=None, species=None):
         """
-        Extracts atomic positions from a certian frame and adds it to coords
+        Extracts the velocities of all (or selected) particles, ordered by atom ID, as an (N, 3) array
+        """
+        raise NotImplementedError
+
+    def extractForces(self, group=None, species=None):
+        """
+        Extracts the forces acting on all (or selected) particles, ordered by atom ID, as an (N, 3) array
         """
         raise NotImplementedError
 
@@ -398,7 +489,17 @@ class EngineAPI:
         raise NotImplementedError
 
     def close(self):
-        pass
+        self._export_profile()
+
+    def _export_profile(self):
+        """Writes the call profile, if any, to profile.json in the output dir (on the root proc), and logs it"""
+        if self.profile is None:
+            return
+
+        if not getattr(self, "rank", 0):
+            self.profile.write(self._abspath("profile.json"))
+
+        self.logger.info("Engine call profile:\n%s", self.profile)
 
     def __del__(self):
         """Destructor"""
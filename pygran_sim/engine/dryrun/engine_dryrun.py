@@ -0,0 +1,173 @@
+"""
+A dry-run DEM engine that compiles the LIGGGHTS command stream without loading the library
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import os
+
+from ..api import EngineAPI
+from ..liggghts.engine_liggghts import AtomViews, LiggghtsAPI
+
+__all__ = ["DryRunAPI"]
+
+
+class DryRunAPI(LiggghtsAPI):
+    """An engine that runs the same input expansion and setup methods as :class:`LiggghtsAPI`, but
+    records every command into a LIGGGHTS input script instead of executing it. Neither the LIGGGHTS
+    library nor an instance of it is needed, so parameter dictionaries (species, meshes, PSDs, insertion, etc.)
+    can be validated or diffed cheaply, and the script can be replayed in batch jobs with the plain
+    LIGGGHTS executable from within the output dir, e.g. lmp_auto -in in.liggghts.
+
+    :param script: filename of the recorded input script, relative to the output dir (default 'in.liggghts')
+    :type script: str
+
+    :param __version__: LIGGGHTS version to generate commands for (default 3.8)
+    :type __version__: float
+
+    .. note:: Methods that query the state of the system (extract_*, gather_atoms, etc.) are not
+       available in dry-run mode. The number of atoms is always 0. The step and timestep are tracked from
+       the recorded commands, so that runs in chunks (callbacks, thermo sampling) are recorded as they
+       would be issued, and global scalars (computes, equal-style variables) read as NaN. Memory reports
+       cover the Python side only (RSS and buffers), with neither particles nor LIGGGHTS statistics.
+    """
+
+    def __init__(self, *, split, library=None, script="in.liggghts", **pargs):
+
+        pargs["__version__"] = pargs.get("__version__", 3.8)
+
+        self.commands = []  # every command issued so far, in order
+        self._globals = {"ntimestep": 0, "dt": float("nan"), "nlocal": 0, "nghost": 0}
+        self.script = os.path.join(os.path.abspath(pargs["output"]), script)
+        self._script = open(self.script, "w") if not split.Get_rank() else None
+
+        super().__init__(split=split, library=library, **pargs)
+
+    def load_library(self, library):
+        return None
+
+    def _open(self, comm, cmdargs=[], ptr=None):
+        self.logger.info("Dry-run mode: recording commands to %s", self.script)
+
+        self.lmp = None
+        self.opened = False
+
+    def command(self, cmd):
+        """Records a LIGGGHTS command in the input script, unless it changes nothing
+        (see :class:`pygran_sim.engine.liggghts.commands.CommandState`)
+
+        :param cmd: input LIGGGHTS command
+        :type cmd: str
+        """
+        for cmd in self.state.update(cmd):
+            self.commands.append(cmd)
+            self._advance(cmd)
+
+            if self._script:
+                self._script.write(cmd + "\n")
+                self._script.flush()
+
+    def _advance(self, cmd):
+        """Updates the step and timestep the recorded commands lead to"""
+        words = cmd.split()
+
+        if not words:
+            return
+
+        if words[0] == "run":
+            if "upto" in words[2:]:
+                self._globals["ntimestep"] = int(words[1])
+            else:
+                self._globals["ntimestep"] += int(words[1])
+        elif words[0] == "reset_timestep":
+            self._globals["ntimestep"] = int(words[1])
+        elif words[0] == "timestep":
+            self._globals["dt"] = float(words[1])
+
+    def load_file(self, filename):
+        """Records the inclusion of a LIGGGHTS input script
+
+        :param filename: input filename
+        :type file: str
+        """
+        self.command("include {}".format(os.path.abspath(filename)))
+
+    def get_natoms(self):
+        return 0
+
+    # Commands are recorded as they are issued: nothing to batch
+    batch = EngineAPI.batch
+
+    def _callback(self, callback, step):
+        """Calls a run callback, and returns True if it recorded commands or returned a truthy value"""
+        ncommands = len(self.commands)
+        modified = callback(step, AtomViews(self))
+
+        return bool(modified) or len(self.commands) > ncommands
+
+    def _unavailable(self, *args, **kwargs):
+        raise RuntimeError("System state cannot be queried in dry-run mode.")
+
+    scatter_atoms = gather_atoms = _unavailable
+    scatter_atoms_array = gather_atoms_array = _unavailable
+    extract_fix = extract_variables = _unavailable
+    extract_atom = extract_atom_array = extract_local = set_variable = _unavailable
+
+    def extract_global(self, name, type):
+        """Returns the step ('ntimestep') or timestep ('dt') the recorded commands lead to, or the number of
+        owned/ghost particles ('nlocal', 'nghost': 0)"""
+        if name not in self._globals:
+            self._unavailable()
+
+        return self._globals[name]
+
+    def extract_compute(self, id, style, type):
+        """Returns NaN for the global scalar of a compute (style 0, type 0)"""
+        if style or type:
+            self._unavailable()
+
+        return float("nan")
+
+    def extract_variable(self, name, group, type):
+        """Returns NaN for an equal-style variable (type 0)"""
+        if type:
+            self._unavailable()
+
+        return float("nan")
+
+    def close(self):
+        self.worker.shutdown()
+
+        if self._script:
+            self._script.close()
+            self._script = None
+
+        self._export_profile()
+
+
+__engine__ = DryRunAPI
@@ -0,0 +1,129 @@
+"""
+Typed ctypes prototypes for the LIGGGHTS C library interface
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+
+This file was modified from the LAMMPS source code.
+
+LAMMPS - Large-scale Atomic/Molecular Massively Parallel Simulator
+http://lammps.sandia.gov, Sandia National Laboratories
+Steve Plimpton, sjplimp@sandia.gov
+
+Copyright (2003) Sandia Corporation.  Under the terms of Contract
+DE-AC04-94AL85000 with Sandia Corporation, the U.S. Government retains
+certain rights in this software.  This software is distributed under
+the GNU General Public License.
+
+See the README file in the top-level LAMMPS directory.
+
+"""
+
+import ctypes
+
+__all__ = ["Bindings"]
+
+c_int_p = ctypes.POINTER(ctypes.c_int)
+c_int_pp = ctypes.POINTER(c_int_p)
+c_double_p = ctypes.POINTER(ctypes.c_double)
+c_double_pp = ctypes.POINTER(c_double_p)
+
+_ptr, _str, _int = ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int
+
+# Prototypes of the LIGGGHTS C API (see src/library.h): attribute -> (symbol, restype, argtypes).
+# Functions returning void* are declared once per return type, so that each typed accessor is
+# a separate function object whose restype is never changed after load_library.
+PROTOTYPES = {
+    "close": ("lammps_close", None, (_ptr,)),
+    "file": ("lammps_file", None, (_ptr, _str)),
+    "command": ("lammps_command", _ptr, (_ptr, _str)),
+    "free": ("lammps_free", None, (_ptr,)),
+    "extract_global_int": ("lammps_extract_global", c_int_p, (_ptr, _str)),
+    "extract_global_double": ("lammps_extract_global", c_double_p, (_ptr, _str)),
+    "extract_global_bigint": (
+        "lammps_extract_global",
+        ctypes.POINTER(ctypes.c_int64),
+        (_ptr, _str),
+    ),
+    "extract_atom_int": ("lammps_extract_atom", c_int_p, (_ptr, _str)),
+    "extract_atom_int2": ("lammps_extract_atom", c_int_pp, (_ptr, _str)),
+    "extract_atom_double": ("lammps_extract_atom", c_double_p, (_ptr, _str)),
+    "extract_atom_double2": ("lammps_extract_atom", c_double_pp, (_ptr, _str)),
+    "extract_compute_double": (
+        "lammps_extract_compute",
+        c_double_p,
+        (_ptr, _str, _int, _int),
+    ),
+    "extract_compute_double2": (
+        "lammps_extract_compute",
+        c_double_pp,
+        (_ptr, _str, _int, _int),
+    ),
+    "extract_fix_double": (
+        "lammps_extract_fix",
+        c_double_p,
+        (_ptr, _str, _int, _int, _int, _int),
+    ),
+    "extract_fix_double2": (
+        "lammps_extract_fix",
+        c_double_pp,
+        (_ptr, _str, _int, _int, _int, _int),
+    ),
+    "extract_variable": ("lammps_extract_variable", c_double_p, (_ptr, _str, _str)),
+    "set_variable": ("lammps_set_variable", _int, (_ptr, _str, _str)),
+    "get_natoms": ("lammps_get_natoms", _int, (_ptr,)),
+    "gather_atoms": ("lammps_gather_atoms", None, (_ptr, _str, _int, _int, _ptr)),
+    "scatter_atoms": ("lammps_scatter_atoms", None, (_ptr, _str, _int, _int, _ptr)),
+}
+
+
+class Bindings:
+    """Typed function objects for the LIGGGHTS C API, declared once when the library is loaded
+    with full argtypes and restype. Unlike the functions of a ctypes.CDLL, which are shared objects
+    whose restype must be set before each call, every accessor here has a fixed signature, so calls
+    cost less and are safe from multiple threads.
+
+    :param lib: LIGGGHTS shared library
+    :type lib: ctypes.CDLL
+
+    :Example:
+      api = Bindings(lib)
+      nlocal = api.extract_global_int(lmp, b"nlocal")[0]
+
+    .. note:: Symbols missing from the library (e.g. in older LIGGGHTS versions) are set to None.
+    """
+
+    def __init__(self, lib):
+        self.lib = lib
+
+        for name, (symbol, restype, argtypes) in PROTOTYPES.items():
+            try:
+                func = ctypes.CFUNCTYPE(restype, *argtypes)((symbol, lib))
+            except AttributeError:
+                func = None
+
+            setattr(self, name, func)
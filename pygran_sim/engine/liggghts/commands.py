@@ -0,0 +1,329 @@
+"""
+Batched submission and state tracking of LIGGGHTS commands
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import copy
+import os
+import sys
+import tempfile
+
+__all__ = ["CommandBatch", "CommandState"]
+
+# Frames skipped when looking for the origin of a command: the plumbing that passes a command on to a batch,
+# i.e. LiggghtsAPI.command, this module, and the wrappers of profiled engine methods (see
+# pygran_sim.profiling.CallProfile)
+_HERE = os.path.abspath(__file__)
+_LIGGGHTS = os.path.join(os.path.dirname(_HERE), "engine_liggghts.py")
+_PROFILING = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(_HERE))), "profiling.py"
+)
+
+
+def _plumbing(code):
+    fname = os.path.abspath(code.co_filename)
+    return fname in (_HERE, _PROFILING) or (
+        fname == _LIGGGHTS and code.co_name == "command"
+    )
+
+
+def _origin():
+    """Returns the innermost frame of the caller's stack that does not merely pass a command on, e.g. the
+    engine method (createDomain, setupParticles, ...) or user code that issued it"""
+    frame = sys._getframe(1)
+
+    while frame.f_back and _plumbing(frame.f_code):
+        frame = frame.f_back
+
+    return frame
+
+
+class CommandBatch:
+    """Buffers LIGGGHTS commands and submits them in one lammps_file call on a temporary script, instead of
+    one lammps_command call per command. A batch stands in for the :class:`Bindings` of an engine
+    (see :meth:`LiggghtsAPI.batch`): commands are buffered, and any other call into the C API
+    (extract_*, gather_atoms, get_natoms, etc.) first submits the buffered commands, so that queries
+    always see the state set up by the commands issued before them.
+
+    Every command is preceded in the script by a comment naming the Python call that issued it, i.e. the
+    innermost caller of :meth:`LiggghtsAPI.command` (e.g. :meth:`LiggghtsAPI.setupParticles`). Since
+    LIGGGHTS echoes the script to its log file, an error is reported right after the origin of the failing
+    command. The script is removed once LIGGGHTS has run it, i.e. it is kept only if LIGGGHTS aborted.
+
+    Changes to the engine's :class:`CommandState` made by the buffered commands are staged (see :attr:`staged`),
+    and committed only once LIGGGHTS ran the script. If it fails, they are discarded.
+
+    :param api: typed accessors of the C API
+    :type api: pygran_sim.engine.liggghts.bindings.Bindings
+
+    :param lmp: LIGGGHTS instance
+    :type lmp: ctypes.c_void_p
+
+    :param path: dir in which the temporary script is written
+    :type path: str
+
+    :param root: True on the proc that reads the script, i.e. rank 0 of the LIGGGHTS communicator
+    :type root: bool
+
+    :param logger: logger of the engine
+    :type logger: logging.Logger
+
+    :param state: state of the engine, updated once the buffered commands ran
+    :type state: CommandState
+    """
+
+    def __init__(self, api, lmp, path, root=True, logger=None, state=None):
+        self.api = api
+        self.lmp = lmp
+        self.path = path
+        self.root = root
+        self.logger = logger
+        self.state = state
+        # state including the buffered commands
+        self.staged = state.copy() if state is not None else None
+        self.nflushed = 0  # total number of commands submitted
+        self._commands = []
+        self._origins = []
+        self._changes = []  # changes to the state made by the buffered commands
+
+    def stage(self, change):
+        """Applies a change to the staged state (see :meth:`CommandState.prepare`), to be committed to the
+        engine's state once the buffered commands ran"""
+        self.staged.commit(change)
+        self._changes.append(change)
+
+    def command(self, lmp, cmd):
+        """Buffers a command (encoded as bytes), in place of Bindings.command"""
+        frame = _origin()
+        self._commands.append(cmd)
+        self._origins.append((frame.f_code, frame.f_lineno))
+
+    def script(self):
+        """Returns the script of the buffered commands, each preceded by its origin
+
+        :rtype: bytes
+        """
+        lines = []
+
+        for cmd, (code, lineno) in zip(self._commands, self._origins):
+            origin = "# {} ({}:{})".format(
+                code.co_name, os.path.basename(code.co_filename), lineno
+            )
+            lines += [origin.encode(), cmd]
+
+        return b"\n".join(lines) + b"\n"
+
+    def flush(self):
+        """Submits the buffered commands to LIGGGHTS (collective call on the LIGGGHTS communicator)"""
+        if not self._commands:
+            return
+
+        fname = ""
+
+        # LIGGGHTS reads the script on its root proc only, and broadcasts the commands to the others
+        if self.root:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self.path, prefix="in.batch-", delete=False
+            ) as fp:
+                fp.write(self.script())
+                fname = fp.name
+
+        if self.logger:
+            self.logger.debug("Submitting %d commands", len(self._commands))
+
+        ncommands, changes = len(self._commands), self._changes
+        self._commands, self._origins, self._changes = [], [], []
+
+        try:
+            self.api.file(self.lmp, fname.encode())
+        except BaseException:
+            # none of the buffered commands is considered applied
+            if self.state is not None:
+                self.staged = self.state.copy()
+            raise
+
+        if self.state is not None:
+            for change in changes:
+                self.state.commit(change)
+
+            self.state.nskipped = self.staged.nskipped
+
+        self.nflushed += ncommands
+
+        if self.root:
+            os.remove(fname)
+
+    def __len__(self):
+        return len(self._commands)
+
+    def __getattr__(self, name):
+        # Any other call into the C API must see the effect of the buffered commands
+        self.flush()
+        return getattr(self.api, name)
+
+
+class CommandState:
+    """Tracks the computes, fixes, and dumps defined in a LIGGGHTS instance, along with scalar settings
+    (timestep, thermo, etc.), from the commands issued to it. Commands that would not change anything, e.g.
+    the same timestep or an identical compute on every run, are dropped, and redefinitions are turned
+    into the commands LIGGGHTS needs (e.g. 'uncompute ID' before 'compute ID ...').
+
+    :Example:
+      state = CommandState()
+      state.update("timestep 1e-6")  # ['timestep 1e-6']
+      state.update("timestep 1e-6")  # []
+
+    .. note:: Only commands passed to :meth:`update` are tracked: definitions made by input scripts
+        (LiggghtsAPI.load_file) are unknown. To re-create an identical fix (e.g. to restart an insertion),
+        unfix it first.
+    """
+
+    # Commands whose last value is the only one that matters
+    SETTINGS = ("timestep", "thermo", "thermo_style", "neighbor", "run_style")
+
+    # Commands that define an entity by ID, and the commands that delete it
+    DEFINITIONS = {"compute": "uncompute", "fix": "unfix", "dump": "undump"}
+    DELETIONS = {"uncompute": "compute", "unfix": "fix", "undump": "dump"}
+
+    def __init__(self):
+        self.settings = {}  # setting -> args
+        self.defined = {kind: {} for kind in self.DEFINITIONS}  # kind -> ID -> command
+        self.modifiers = {}  # dump ID -> dump_modify commands
+        self.nskipped = 0  # number of commands dropped so far
+
+    def update(self, cmd):
+        """Records a command, and returns the commands that must be issued to LIGGGHTS for it
+
+        :param cmd: LIGGGHTS command
+        :type cmd: str
+
+        :return: no command if `cmd` changes nothing, `cmd` itself, or `cmd` preceded by the deletion
+            of the entity it redefines
+        :rtype: list of str
+        """
+        commands, change = self.prepare(cmd)
+        self.commit(change)
+        return commands
+
+    def copy(self):
+        """Returns an independent copy of this state
+
+        :rtype: CommandState
+        """
+        return copy.deepcopy(self)
+
+    def prepare(self, cmd):
+        """Returns the commands that must be issued to LIGGGHTS for a command (see :meth:`update`), along
+        with the change to the state they make. The state is left as is until the change is committed,
+        i.e. once LIGGGHTS ran the commands, so that a command that failed is not considered applied.
+
+        :param cmd: LIGGGHTS command
+        :type cmd: str
+
+        :return: commands, and change to pass to :meth:`commit`
+        :rtype: tuple
+        """
+        words = cmd.split()
+
+        if len(words) < 2:
+            return [cmd], ("clear",) if words == ["clear"] else None
+
+        key, id = words[0], words[1]
+        line = " ".join(words)
+
+        if key in self.SETTINGS:
+            if self.settings.get(key) == line:
+                return self._skip(), None
+            return [cmd], ("setting", key, line)
+
+        if key in self.DEFINITIONS:
+            previous = self.defined[key].get(id)
+
+            if previous == line:
+                return self._skip(), None
+
+            change = ("define", key, id, line)
+
+            # A fix can be replaced by one of the same style, but computes and dumps must be deleted first
+            if previous and (key != "fix" or previous.split()[3:4] != words[3:4]):
+                return ["{} {}".format(self.DEFINITIONS[key], id), cmd], change
+
+            return [cmd], change
+
+        if key in self.DELETIONS:
+            return [cmd], ("delete", self.DELETIONS[key], id)
+
+        if key == "dump_modify":
+            if line in self.modifiers.get(id, ()):
+                return self._skip(), None
+            return [cmd], ("modify", id, line)
+
+        return [cmd], None
+
+    def commit(self, change):
+        """Applies a change returned by :meth:`prepare` to the state
+
+        :param change: change to apply (None for no change)
+        :type change: tuple
+        """
+        if change is None:
+            return
+
+        action = change[0]
+
+        if action == "clear":
+            self.clear()
+        elif action == "setting":
+            self.settings[change[1]] = change[2]
+        elif action == "define":
+            kind, id, line = change[1:]
+            self.defined[kind][id] = line
+
+            if kind == "dump":
+                self.modifiers.pop(id, None)
+        elif action == "delete":
+            kind, id = change[1:]
+            self.defined[kind].pop(id, None)
+
+            if kind == "dump":
+                self.modifiers.pop(id, None)
+        elif action == "modify":
+            self.modifiers.setdefault(change[1], set()).add(change[2])
+
+    def _skip(self):
+        self.nskipped += 1
+        return []
+
+    def clear(self):
+        """Forgets all definitions and settings, e.g. after a 'clear' command"""
+        self.settings.clear()
+        self.modifiers.clear()
+
+        for defined in self.defined.values():
+            defined.clear()
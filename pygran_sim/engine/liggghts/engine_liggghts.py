@@ -46,15 +46,27 @@ See the README file in the top-level LAMMPS directory.
 import ctypes
 import glob
 import itertools
-import logging
+import math
 import os
 import sys
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
 
 import numpy
 
-from pygran_sim.tools import dictToTuple, find
+from pygran_sim.buffers import BufferPool
+from pygran_sim.tools import _libraryVersion, dictToTuple
 
 from ..api import EngineAPI
+from . import memory
+from .bindings import Bindings
+from .commands import CommandBatch, CommandState
+from .monitor import MonitorReader
+from .pool import pool
+from .thermo import ThermoRecorder
+from .timing import TimingLog
+from .worker import Worker
 
 try:
     from mpi4py import MPI
@@ -64,6 +76,11 @@ except Exception:
 __all__ = ["LiggghtsAPI"]
 
 
+def _encode(name):
+    """Encodes a name (str or bytes) passed to the LIGGGHTS C API as a char*"""
+    return name.encode() if isinstance(name, str) else name
+
+
 class RandPrime:
     """
     Random prime number generator with memory. The idea is to generate a unique prime number
@@ -90,6 +107,31 @@ class RandPrime:
         return randn
 
 
+class AtomViews(Mapping):
+    """Read-write mapping of per-atom property names (see :attr:`LiggghtsAPI.atom_arrays`) to zero-copy NumPy
+    views of the particles owned by this proc, handed to run callbacks. Views are extracted on first access,
+    and are valid until the next run.
+
+    :param engine: engine the views are extracted from
+    :type engine: LiggghtsAPI
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._views = {}
+
+    def __getitem__(self, name):
+        if name not in self._views:
+            self._views[name] = self._engine.extract_atom_array(name)
+        return self._views[name]
+
+    def __iter__(self):
+        return iter(self._engine.atom_arrays)
+
+    def __len__(self):
+        return len(self._engine.atom_arrays)
+
+
 class LiggghtsAPI(EngineAPI):
     """A class that implements a python interface for DEM computations
 
@@ -125,8 +167,26 @@ class LiggghtsAPI(EngineAPI):
 
     :param dim: simulation box dimension (default 3)
     :type dim: int
+
+    :param reuse: keep the library handle and LIGGGHTS instance alive after :meth:`close` so that the next
+        simulation run in this process with the same library, cmdargs, and an equivalent communicator picks them up
+        instead of reloading the library and calling lammps_open (default False). See :class:`pygran_sim.engine.liggghts.pool.EnginePool`.
+    :type reuse: bool
     """
 
+    # Per-atom properties that can be extracted as NumPy arrays: name -> (C type, number of columns)
+    atom_arrays = {
+        "x": (ctypes.c_double, 3),
+        "v": (ctypes.c_double, 3),
+        "f": (ctypes.c_double, 3),
+        "omega": (ctypes.c_double, 3),
+        "radius": (ctypes.c_double, 1),
+        "rmass": (ctypes.c_double, 1),
+        "type": (ctypes.c_int, 1),
+        "id": (ctypes.c_int, 1),
+        "mask": (ctypes.c_int, 1),
+    }
+
     def __init__(
         self,
         *,
@@ -136,6 +196,9 @@ class LiggghtsAPI(EngineAPI):
         path=None,
         cmdargs=[],
         ptr=None,
+        startup_profile=None,
+        logger=None,
+        reuse=False,
         **pargs
     ):
         """Initialize some settings and specifications"""
@@ -150,19 +213,40 @@ class LiggghtsAPI(EngineAPI):
         self.rank = split.Get_rank()
         self.split = split
         self.pargs = pargs
+        self.state = CommandState()  # computes, fixes, dumps, and settings issued
         self.monitorList = []
         self.vars = {}
-        self.path = os.getcwd()
+        self.path = os.path.abspath(self.pargs["output"])
         self.nSS = len(self.pargs["species"])
         self.output = self.pargs["output"]
         self._configdir = os.path.join(os.path.expanduser("~"), ".config", "PyGran")
-        self._monitor = []  # a list of tuples of (varname, filename) to monitor
+        self._monitor = []  # MonitorReader of each monitored variable
+        self.buffers = BufferPool()  # reusable arrays for gather_atoms_array
+        self.reuse = reuse
+        self.library = library
+        self._instance = None  # pooled instance, if reused
+        self.worker = Worker(self)  # thread for run_async
+        self.thermo = None  # in-memory thermo time series, see setupPrint
+        self.timings = []  # timing breakdown of every run, see integrate
+        self._timed = bool(pargs.get("timing"))  # DEM keyword 'timing'
+        self._timing_log = None  # reader of the LIGGGHTS log
+        self._summary = None  # summary of the last run parsed from the log
+        self.memory_reports = []  # memory footprint after every run, see memory_report
+        # DEM keyword 'memory': True, or a threshold in bytes (0 included)
+        self._memory = pargs.get("memory")
 
         super().__init__(
-            split=split, library=library, style=style, path=self.path, **self.pargs
+            split=split,
+            library=library,
+            style=style,
+            path=self.path,
+            startup_profile=startup_profile,
+            logger=logger,
+            **self.pargs
         )
 
         comm = pargs["comm"]
+        self.comm = comm  # communicator of the LIGGGHTS instance
 
         if "__version__" in pargs:
             self.__version__ = self.pargs["__version__"]
@@ -172,17 +256,56 @@ class LiggghtsAPI(EngineAPI):
                 "You must have mpi4py and an MPI library installed to use LIGGGHTS."
             )
 
-        if library:
-            if not comm.Get_rank():
-                logging.info(
-                    "Using " + library + " as a shared library for DEM computations"
-                )
-        else:
-            if not comm.Get_rank():
-                print("No library supplied. Exiting")
+        self.logger.info("Using %s as a shared library for DEM computations", library)
 
-            sys.exit()
+        self._open(comm, cmdargs, ptr)
+
+        self.logger.info("Setting up problem dimensions and boundaries")
+
+        self.command("units {}".format(self.pargs["units"]))
+
+        if not hasattr(self, "__version__"):
+            # Probe the version on the root proc only: the result is cached per library build in liggghts.ini
+            version = _libraryVersion(library) if not self.rank else None
+            self.__version__, self.__liggghts__ = split.bcast(version, root=0)
+
+            if self.__version__ is None:
+                if not self.rank:
+                    print("Could not find LIGGGHTS version. Proceeding ... ")
+                self.__version__ = "unknown"
+                self.__liggghts__ = "n/a"
+
+        if isinstance(self.__version__, float) and self.__version__ >= 3.6:
+            self.command("hard_particles yes")
+
+        self.command("dimension {}".format(self.pargs["dim"]))
+        self.command("atom_style {}".format(style))
+        self.command(
+            "atom_modify map array"
+        )  # array is faster than hash in looking up atomic IDs, but the former takes more memory
+        self.command(
+            "boundary " + ("{} " * len(pargs["boundary"])).format(*pargs["boundary"])
+        )
+        self.command(
+            "newton off"
+        )  # turn off newton's 3rd law ~ should lead to better scalability
+        self.command(
+            "communicate single vel yes"
+        )  # have no idea what this does, but it's imp for ghost atoms
+        self.command("processors * * *")  # let LIGGGHTS handle DD
+
+    def _open(self, comm, cmdargs=[], ptr=None):
+        """Creates an instance of LIGGGHTS (stored in self.lmp) running on communicator `comm`
+
+        :param comm: MPI communicator
+        :type comm: MPI Intracomm
 
+        :param cmdargs: command-line arguments passed to LIGGGHTS
+        :type cmdargs: list
+
+        :param ptr: pointer to an existing LIGGGHTS instance (when embedding Python in LIGGGHTS)
+        :type ptr: PyCapsule
+        """
         # if no ptr provided, create an instance of LIGGGHTS
         # don't know how to pass an MPI communicator from PyPar
         # but we can pass an MPI communicator from mpi4py v2.0.0 and later
@@ -197,6 +320,25 @@ class LiggghtsAPI(EngineAPI):
         else:
             MPI_Comm = ctypes.c_void_p
 
+        args = tuple(cmdargs)  # as supplied by the user, before encoding
+
+        if self.reuse and not ptr:
+            self._instance = pool.acquire(self.library, comm, args)
+
+            if self._instance:
+                self.logger.info("Reusing an idle LIGGGHTS instance")
+
+                self.lmp = self._instance.lmp
+                self.opened = True
+
+                # The log file of a pooled instance still points to the previous simulation's output
+                logfile = self._logfile(args)
+                if logfile:
+                    self.command("log {}".format(logfile))
+                    self._timing_log = TimingLog(logfile)
+
+                return
+
         if not ptr:
             # with mpi4py v2, can pass MPI communicator to LIGGGHTS
             # need to adjust for type of MPI communicator object
@@ -205,8 +347,12 @@ class LiggghtsAPI(EngineAPI):
             narg = 0
             cargs = 0
 
+            cmdargs = self._cmdargs(args)
+            logfile = self._logfile(args)
+            self._timing_log = TimingLog(logfile) if logfile else None
+
             if cmdargs:
-                cmdargs.insert(0, "liggghts.py")
+                cmdargs = ["liggghts.py"] + cmdargs
                 narg = len(cmdargs)
                 for i in range(narg):
                     if isinstance(cmdargs[i], str):
@@ -232,9 +378,16 @@ class LiggghtsAPI(EngineAPI):
             self.lmp = ctypes.c_void_p()
             comm_ptr = MPI._addressof(comm)
             comm_val = MPI_Comm.from_address(comm_ptr)
-            self.lib.lammps_open(narg, cargs, comm_val, ctypes.byref(self.lmp))
+
+            with self.startup_profile.phase("lammps_open"):
+                self.lib.lammps_open(narg, cargs, comm_val, ctypes.byref(self.lmp))
 
             self.opened = True
+
+            if self.reuse:
+                self._instance = pool.track(
+                    self.lib, self.lmp, self.library, comm, args
+                )
         else:
             self.opened = False
 
@@ -254,107 +407,171 @@ class LiggghtsAPI(EngineAPI):
                 ctypes.pythonapi.PyCObject_AsVoidPtr.argtypes = [ctypes.py_object]
                 self.lmp = ctypes.c_void_p(ctypes.pythonapi.PyCObject_AsVoidPtr(ptr))
 
-        if not self.rank:
-            logging.info("Setting up problem dimensions and boundaries")
+    def _logfile(self, cmdargs=[]):
+        """Returns the absolute path of the LIGGGHTS log file for the given command-line args,
+        or None if logging is turned off"""
+        cmdargs = list(cmdargs)
+        logfile = "log.liggghts"
 
-        self.command("units {}".format(self.pargs["units"]))
+        for flag in ("-log", "-l"):
+            if flag in cmdargs[:-1]:
+                logfile = cmdargs[cmdargs.index(flag) + 1]
 
-        if hasattr(self, "__version__"):
-            if self.__version__ >= 3.6:
-                self.command("hard_particles yes")
-        else:
-            # Get version from version_liggghts.txt. TODO: find a faster way to do this
-            # by reading version from stdout, and move this to tools!
-            try:
-                version_txt = find("version_liggghts.txt", "/")
-                self.__liggghts__ = version_txt.split("version_liggghts.txt")[0]
+        if logfile == "none":
+            return None
 
-                with open(version_txt, "r+") as fp:
-                    major, minor, _ = fp.readline().rstrip().split(".")
-                    self.__version__ = float(major + "." + minor)
-            except Exception:
-                if not self.rank:
-                    print("Could not find LIGGGHTS version. Proceeding ... ")
-                self.__version__ = "unknown"
-                self.__liggghts__ = "n/a"
+        return self._abspath(logfile)
 
-            # Write version + src dir to config file if it exists
-            if not self.rank:
-                liggghts_ini = os.path.join(self._configdir, "liggghts.ini")
-                if os.path.isfile(liggghts_ini):
-                    with open(liggghts_ini, "a+") as fp:
-                        fp.write("\nsrc={}".format(self.__liggghts__))
-                        fp.write("\nversion={}".format(self.__version__))
-            if self.__version__ >= 3.6:
-                self.command("hard_particles yes")
+    def _cmdargs(self, cmdargs=[]):
+        """Returns a copy of the command-line args with the LIGGGHTS log file set to an absolute path
+        in the output dir, since LIGGGHTS would otherwise write it to the current working dir
+        """
+        logfile = self._logfile(cmdargs)
+        cmdargs = list(cmdargs)
 
-        self.command("dimension {}".format(self.pargs["dim"]))
-        self.command("atom_style {}".format(style))
-        self.command(
-            "atom_modify map array"
-        )  # array is faster than hash in looking up atomic IDs, but the former takes more memory
-        self.command(
-            "boundary " + ("{} " * len(pargs["boundary"])).format(*pargs["boundary"])
-        )
-        self.command(
-            "newton off"
-        )  # turn off newton's 3rd law ~ should lead to better scalability
-        self.command(
-            "communicate single vel yes"
-        )  # have no idea what this does, but it's imp for ghost atoms
-        self.command("processors * * *")  # let LIGGGHTS handle DD
+        for flag in ("-log", "-l"):
+            while flag in cmdargs[:-1]:
+                i = cmdargs.index(flag)
+                del cmdargs[i : i + 2]
+
+        return cmdargs + ["-log", logfile or "none"]
 
     def load_library(self, library):
-        return ctypes.CDLL(library, ctypes.RTLD_GLOBAL)
+        if not library:
+            raise RuntimeError("No library supplied")
+
+        if self.reuse:
+            lib = pool.library(library)
+        else:
+            lib = ctypes.CDLL(library, ctypes.RTLD_GLOBAL)
+
+        # Typed accessors of the C API, declared once: see pygran_sim.engine.liggghts.bindings
+        self.api = Bindings(lib)
+
+        return lib
 
     # scatter vector of atom properties across procs, ordered by atom ID
     # assume vector is of correct type and length, as created by gather_atoms()
     def scatter_atoms(self, name, type, count, data):
-        return self.lib.lammps_scatter_atoms(self.lmp, name, type, count, data)
+        return self.api.scatter_atoms(self.lmp, _encode(name), type, count, data)
 
     # return total number of atoms in system
     def get_natoms(self):
-        return self.lib.lammps_get_natoms(self.lmp)
+        return self.api.get_natoms(self.lmp)
 
     # return vector of atom properties gathered across procs, ordered by atom ID
     def gather_atoms(self, name, type, count):
-        natoms = self.lib.lammps_get_natoms(self.lmp)
+        natoms = self.api.get_natoms(self.lmp)
         if type == 0:
             data = ((count * natoms) * ctypes.c_int)()
-            self.lib.lammps_gather_atoms(self.lmp, name, type, count, data)
+            self.api.gather_atoms(self.lmp, _encode(name), type, count, data)
         elif type == 1:
             data = ((count * natoms) * ctypes.c_double)()
-            self.lib.lammps_gather_atoms(self.lmp, name, type, count, data)
+            self.api.gather_atoms(self.lmp, _encode(name), type, count, data)
         else:
             return None
         return data
 
+    def gather_atoms_array(self, name, type, count, out=None):
+        """Gathers a per-atom property of all particles across procs, ordered by atom ID, into a NumPy array.
+        Unless `out` is supplied, the array is taken from a pool of buffers (see :attr:`buffers`) that is
+        reused by the next call with the same (name, type, count), and reallocated only when the number
+        of atoms grows.
+
+        :param name: name of the property (x, v, f, omega, radius, type, id, etc.)
+        :type name: str
+
+        :param type: 0 for integer properties, 1 for double properties
+        :type type: int
+
+        :param count: number of values per atom (e.g. 3 for x, 1 for radius)
+        :type count: int
+
+        :param out: preallocated C-contiguous array of shape (natoms, count), or (natoms,) if count is 1
+        :type out: numpy.ndarray
+
+        :return: gathered property
+        :rtype: numpy.ndarray
+
+        .. note:: Copy the returned (pooled) array to keep its values beyond the next call.
+        """
+        natoms = self.get_natoms()
+        shape, dtype = self._atoms_shape(natoms, type, count)
+
+        if out is None:
+            out = self.buffers.get((name, type, count), shape, dtype)
+        elif out.shape != shape or out.dtype != dtype or not out.flags.c_contiguous:
+            raise ValueError(
+                "out must be a C-contiguous {} array of shape {}".format(dtype, shape)
+            )
+
+        self.api.gather_atoms(self.lmp, _encode(name), type, count, out.ctypes.data)
+
+        return out
+
+    def scatter_atoms_array(self, name, type, count, data):
+        """Scatters a per-atom property of all particles, ordered by atom ID, from a NumPy array
+        (e.g. one returned by :meth:`gather_atoms_array`) to all procs. The array is passed to the
+        engine as is when it is C-contiguous and of the right type, otherwise it is converted first.
+
+        :param name: name of the property (x, v, f, omega, radius, type, id, etc.)
+        :type name: str
+
+        :param type: 0 for integer properties, 1 for double properties
+        :type type: int
+
+        :param count: number of values per atom (e.g. 3 for x, 1 for radius)
+        :type count: int
+
+        :param data: array of natoms * count values
+        :type data: numpy.ndarray
+        """
+        natoms = self.get_natoms()
+        _, dtype = self._atoms_shape(natoms, type, count)
+        data = numpy.ascontiguousarray(data, dtype=dtype)
+
+        if data.size != natoms * count:
+            raise ValueError(
+                "data must hold {} values ({} atoms x {}), not {}".format(
+                    natoms * count, natoms, count, data.size
+                )
+            )
+
+        self.api.scatter_atoms(self.lmp, _encode(name), type, count, data.ctypes.data)
+
+    @staticmethod
+    def _atoms_shape(natoms, type, count):
+        """Returns the shape and dtype of an array holding `count` values of `type` per atom"""
+        if type not in (0, 1):
+            raise ValueError("type must be 0 (integer) or 1 (double)")
+
+        shape = (natoms, count) if count > 1 else (natoms,)
+        return shape, numpy.int32 if type == 0 else numpy.float64
+
     def extract_global(self, name, type):
+        """Returns a global property of LIGGGHTS, e.g. 'nlocal' (type 0: int), 'dt' (type 1: double),
+        or 'ntimestep' (type 2: 64-bit int, LIGGGHTS' bigint)"""
         if type == 0:
-            self.lib.lammps_extract_global.restype = ctypes.POINTER(ctypes.c_int)
+            ptr = self.api.extract_global_int(self.lmp, _encode(name))
         elif type == 1:
-            self.lib.lammps_extract_global.restype = ctypes.POINTER(ctypes.c_double)
+            ptr = self.api.extract_global_double(self.lmp, _encode(name))
+        elif type == 2:
+            ptr = self.api.extract_global_bigint(self.lmp, _encode(name))
         else:
             return None
-        ptr = self.lib.lammps_extract_global(self.lmp, name)
         return ptr[0]
 
     def extract_compute(self, id, style, type):
         if type == 0:
             if style > 0:
                 return None
-            self.lib.lammps_extract_compute.restype = ctypes.POINTER(ctypes.c_double)
-            ptr = self.lib.lammps_extract_compute(self.lmp, id, style, type)
+            ptr = self.api.extract_compute_double(self.lmp, _encode(id), style, type)
             return ptr[0]
         if type == 1:
-            self.lib.lammps_extract_compute.restype = ctypes.POINTER(ctypes.c_double)
-            ptr = self.lib.lammps_extract_compute(self.lmp, id, style, type)
+            ptr = self.api.extract_compute_double(self.lmp, _encode(id), style, type)
             return ptr
         if type == 2:
-            self.lib.lammps_extract_compute.restype = ctypes.POINTER(
-                ctypes.POINTER(ctypes.c_double)
-            )
-            ptr = self.lib.lammps_extract_compute(self.lmp, id, style, type)
+            ptr = self.api.extract_compute_double2(self.lmp, _encode(id), style, type)
             return ptr
         return None
 
@@ -364,29 +581,25 @@ class LiggghtsAPI(EngineAPI):
         double was allocated by library interface function
         """
         if style == 0:
-            self.lib.lammps_extract_fix.restype = ctypes.POINTER(ctypes.c_double)
-            ptr = self.lib.lammps_extract_fix(self.lmp, id, style, type, i, j)
+            ptr = self.api.extract_fix_double(self.lmp, _encode(id), style, type, i, j)
             result = ptr[0]
-            self.lib.lammps_free(ptr)
+            self.api.free(ptr)
             return result
         elif (style == 1) or (style == 2):
             if type == 1:
-                self.lib.lammps_extract_fix.restype = ctypes.POINTER(ctypes.c_double)
+                extract = self.api.extract_fix_double
             elif type == 2:
-                self.lib.lammps_extract_fix.restype = ctypes.POINTER(
-                    ctypes.POINTER(ctypes.c_double)
-                )
+                extract = self.api.extract_fix_double2
             else:
                 return None
-            ptr = self.lib.lammps_extract_fix(self.lmp, id, style, type, i, j)
+            ptr = extract(self.lmp, _encode(id), style, type, i, j)
             return ptr
         else:
             return None
 
     def createDomain(self):
         """Define the domain of the simulation"""
-        if not self.rank:
-            logging.info("Creating domain")
+        self.logger.info("Creating domain")
 
         if "box" in self.pargs:
             self.command(
@@ -404,54 +617,139 @@ class LiggghtsAPI(EngineAPI):
         self.command("create_box {} domain".format(self.pargs["nSS"]))
 
     # free memory for 1 double or 1 vector of doubles via lammps_free()
-    # for vector, must copy nlocal returned values to local c_double vector
+    # for vector, the nlocal values are copied in bulk to a NumPy array
     # memory was allocated by library interface function
 
     def extract_variable(self, name, group, type):
+        """Extracts the value of an equal-style (type 0) variable, or the values of an atom-style
+        (type 1) variable for the particles owned by this proc
+
+        :param name: variable name
+        :type name: str
+
+        :param group: group of atoms for which an atom-style variable is evaluated (0 for the others)
+        :type group: str
+
+        :param type: 0 for equal-style, 1 for atom-style variables
+        :type type: int
+
+        :return: value (type 0) or array of shape (nlocal,) (type 1)
+        :rtype: float or numpy.ndarray
+        """
         if type == 0:
-            self.lib.lammps_extract_variable.restype = ctypes.POINTER(ctypes.c_double)
-            ptr = self.lib.lammps_extract_variable(self.lmp, name, group)
+            ptr = self.api.extract_variable(self.lmp, _encode(name), _encode(group))
             result = ptr[0]
-            self.lib.lammps_free(ptr)
+            self.api.free(ptr)
             return result
         if type == 1:
-            self.lib.lammps_extract_global.restype = ctypes.POINTER(ctypes.c_int)
-            nlocalptr = self.lib.lammps_extract_global(self.lmp, "nlocal")
-            nlocal = nlocalptr[0]
-            result = (ctypes.c_double * nlocal)()
-            self.lib.lammps_extract_variable.restype = ctypes.POINTER(ctypes.c_double)
-            ptr = self.lib.lammps_extract_variable(self.lmp, name, group)
-            for i in xrange(nlocal):
-                result[i] = ptr[i]
-            self.lib.lammps_free(ptr)
-            return result
+            return self._atom_variable(name, group)
         return None
 
+    def extract_variables(self, names, group="all", out=None):
+        """Extracts the values of several atom-style variables (e.g. custom per-particle diagnostics) for
+        the particles owned by this proc in one call, with one bulk copy per variable
+
+        :param names: variable names
+        :type names: list
+
+        :param group: group of atoms for which the variables are evaluated (0 for the others)
+        :type group: str
+
+        :param out: preallocated C-contiguous array of shape (len(names), nlocal)
+        :type out: numpy.ndarray
+
+        :return: one row per variable, e.g. a, b = extract_variables(['a', 'b'])
+        :rtype: numpy.ndarray of shape (len(names), nlocal)
+        """
+        nlocal = self.extract_global(b"nlocal", 0)
+        shape = (len(names), nlocal)
+
+        if out is None:
+            out = numpy.empty(shape)
+        elif (
+            out.shape != shape
+            or out.dtype != numpy.float64
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                "out must be a C-contiguous float64 array of shape {}".format(shape)
+            )
+
+        for i, name in enumerate(names):
+            self._atom_variable(name, group, nlocal=nlocal, out=out[i])
+
+        return out
+
     def extract_atom(self, name, type):
         if type == 0:
-            self.lib.lammps_extract_atom.restype = ctypes.POINTER(ctypes.c_int)
+            extract = self.api.extract_atom_int
         elif type == 1:
-            self.lib.lammps_extract_atom.restype = ctypes.POINTER(
-                ctypes.POINTER(ctypes.c_int)
-            )
+            extract = self.api.extract_atom_int2
         elif type == 2:
-            self.lib.lammps_extract_atom.restype = ctypes.POINTER(ctypes.c_double)
+            extract = self.api.extract_atom_double
         elif type == 3:
-            self.lib.lammps_extract_atom.restype = ctypes.POINTER(
-                ctypes.POINTER(ctypes.c_double)
-            )
+            extract = self.api.extract_atom_double2
         else:
             return None
-        ptr = self.lib.lammps_extract_atom(self.lmp, name)
+        ptr = extract(self.lmp, _encode(name))
         return ptr
 
+    def extract_atom_array(self, name, ghost=False):
+        """Returns a per-atom property of the particles owned by this proc as a NumPy array that
+        shares memory with LIGGGHTS (no copy). Vectors (x, v, f, omega) are (nlocal, 3) arrays and
+        scalars (radius, rmass, type, id, mask) are (nlocal,) arrays. Writing to the array modifies
+        the property in LIGGGHTS.
+
+        :param name: name of the property (see :attr:`atom_arrays`)
+        :type name: str
+
+        :param ghost: include ghost particles, i.e. return nlocal + nghost rows
+        :type ghost: bool
+
+        :return: view of the property
+        :rtype: numpy.ndarray
+
+        .. warning:: The view is valid only until LIGGGHTS reallocates or reorders its per-atom arrays,
+            which can happen on any run (reneighboring, atom sorting, migration across procs), insertion
+            or deletion of particles, or a 'clear'. Extract a new view after each of these, and use
+            numpy.copy to keep the values.
+        """
+        if name not in self.atom_arrays:
+            raise ValueError(
+                "Unknown per-atom property {}: must be one of {}".format(
+                    name, ", ".join(self.atom_arrays)
+                )
+            )
+
+        ctype, ncols = self.atom_arrays[name]
+
+        natoms = self.api.extract_global_int(self.lmp, b"nlocal")[0]
+        if ghost:
+            natoms += self.api.extract_global_int(self.lmp, b"nghost")[0]
+
+        shape = (natoms, ncols) if ncols > 1 else (natoms,)
+        dtype = numpy.int32 if ctype is ctypes.c_int else numpy.float64
+
+        if not natoms:
+            return numpy.empty(shape, dtype=dtype)
+
+        if ncols > 1:
+            # 2D per-atom arrays are allocated as one contiguous block indexed by row pointers
+            ptr = self.api.extract_atom_double2(self.lmp, name.encode())[0]
+        elif ctype is ctypes.c_int:
+            ptr = self.api.extract_atom_int(self.lmp, name.encode())
+        else:
+            ptr = self.api.extract_atom_double(self.lmp, name.encode())
+
+        return numpy.ctypeslib.as_array(ptr, shape=shape)
+
     def set_variable(self, name, value):
         """
         set variable value
         value is converted to string
         returns 0 for success, -1 if failed
         """
-        return self.lib.lammps_set_variable(self.lmp, name, str(value))
+        return self.api.set_variable(self.lmp, _encode(name), str(value).encode())
 
     def setupParticles(self):
         """Setup particle for insertion if requested by the user"""
@@ -460,8 +758,7 @@ class LiggghtsAPI(EngineAPI):
 
             # Make sure we are setting up particles, not walls (so we check for id existence)
             if "id" in ss and "wall" not in ss:
-                if not self.rank:
-                    logging.info("Setting up particles for group{id}".format(**ss))
+                self.logger.debug("Setting up particles for group%s", ss["id"])
 
                 randName = numpy.random.randint(10**5, 10**8)
                 pddName = "pdd" + "{}".format(numpy.random.randint(10**5, 10**8))
@@ -649,8 +946,7 @@ class LiggghtsAPI(EngineAPI):
             .. todo:: Let the user override volume_limit.
             """
 
-            if not self.rank:
-                logging.info("Inserting particles for species {}".format(id + 1))
+            self.logger.info("Inserting particles for species %d", id + 1)
 
             seed = RandPrime().gen()
             name = numpy.random.randint(0, 1e8)
@@ -767,7 +1063,7 @@ class LiggghtsAPI(EngineAPI):
 
         return randName
 
-    def run(self, nsteps, dt=None, itype=None):
+    def run(self, nsteps, dt=None, itype=None, every=None, callback=None):
         """Runs a simulation for number of steps specified by the user
 
         :param nsteps: number of steps the integrator should take
@@ -778,6 +1074,12 @@ class LiggghtsAPI(EngineAPI):
 
         :param dt: timestep
         :type dt: float
+
+        :param every: call `callback` every this many steps (see :meth:`integrate`)
+        :type every: int
+
+        :param callback: function called as callback(step, atoms) after every chunk of `every` steps
+        :type callback: callable
         """
 
         name = self.setupIntegrate(itype=itype)
@@ -790,15 +1092,51 @@ class LiggghtsAPI(EngineAPI):
                     print("Could not find dt in user-supplied dictionary. Aborting ...")
                 sys.exit()
 
-        self.integrate(nsteps, dt)
+        self.integrate(nsteps, dt, every, callback)
 
-        # See if any variables were set to be monitered by the user
-        if self._monitor:
-            for vname, fname in self._monitor:
-                getattr(self, vname).append(numpy.loadtxt(fname))
+        # Read the rows written to the files of monitored variables during this run
+        for reader in self._monitor:
+            reader.read()
 
         return name
 
+    def run_async(self, nsteps, dt=None, itype=None, every=None, callback=None):
+        """Starts :meth:`run` on a worker thread and returns immediately, so that the calling thread can
+        post-process data, write files, etc. while LIGGGHTS integrates. Use asyncio.wrap_future to await
+        the run in a coroutine. Runs are not queued: only one can be in flight at a time.
+
+        While the run is in flight:
+
+        - Any call into LIGGGHTS (commands, extraction, gather/scatter, another run, close) from the calling
+          thread raises a RuntimeError. Wait for the future first.
+        - Zero-copy views (extract_atom_array) taken before the run change under the caller, and may be freed
+          by LIGGGHTS: copy the data beforehand (e.g. extract_local, gather_atoms_array(out=...)).
+        - Copies of the system state, Python-side attributes (pargs, logger), and other DEM objects are safe
+          to use. MPI calls on the simulation's communicator from the calling thread (e.g. the reductions
+          in :mod:`pygran_sim.parallel`) need MPI_THREAD_MULTIPLE.
+        - The callback of a chunked run runs on the worker thread, where calls into LIGGGHTS are allowed.
+
+        :param nsteps: number of steps the integrator should take
+        :type nsteps: int
+
+        :param dt: timestep
+        :type dt: float
+
+        :param itype: integrator type
+        :type itype: str
+
+        :param every: call `callback` every this many steps (see :meth:`integrate`)
+        :type every: int
+
+        :param callback: function called as callback(step, atoms) after every chunk of `every` steps
+        :type callback: callable
+
+        :return: future of the run, whose result() waits for it and returns the integrator names
+            (or raises the exception raised by the run)
+        :rtype: concurrent.futures.Future
+        """
+        return self.worker.submit(self.run, nsteps, dt, itype, every, callback)
+
     def moveMesh(self, name, **args):
         """Control how a mesh (specified by name) moves in time
 
@@ -870,8 +1208,7 @@ class LiggghtsAPI(EngineAPI):
         """
         args = dictToTuple(**args)
 
-        if not self.rank:
-            logging.info("Importing mesh from {}".format(file))
+        self.logger.debug("Importing mesh from %s", file)
 
         self.command(
             "fix {} all {} file {} type {} ".format(name, mtype, file, material)
@@ -993,8 +1330,7 @@ class LiggghtsAPI(EngineAPI):
 
     def createGroup(self, *group):
         """Create groups of atoms. If group is empty, groups{i} are created for every i species."""
-        if not self.rank:
-            logging.info("Creating atom group {}".format(group))
+        self.logger.debug("Creating atom group %s", group)
 
         if not len(group):
             for idSS in self.pargs["idSS"]:
@@ -1007,11 +1343,7 @@ class LiggghtsAPI(EngineAPI):
         Creates particles of type 'type' (1,2, ...) using style 'style' (box or region or single or random)
         @[args]: 'basis' or 'remap' or 'units' or 'all_in'
         """
-        if not self.rank:
-            logging.info(
-                "Creating particles {} with args".format(type)
-                + (" {}" * len(args)).format(*args)
-            )
+        self.logger.debug("Creating particles %s with args %s", type, args)
 
         # my code: self.command('create_atoms {} {}'.format(type, style) +  (' {}' * len(args)).format(*args))
         # new code below: ~ should be the same. Double check this.
@@ -1025,8 +1357,7 @@ class LiggghtsAPI(EngineAPI):
         """
         Sets up NNS list parameters
         """
-        if not self.rank:
-            logging.info("Setting up nearest neighbor searching parameters")
+        self.logger.info("Setting up nearest neighbor searching parameters")
 
         if "nns_freq" not in params:
             params["nns_freq"] = 10
@@ -1053,11 +1384,7 @@ class LiggghtsAPI(EngineAPI):
         """
         Material and interaction properties required
         """
-        if not self.rank:
-            logging.info(
-                "Creating property {} with args".format(name)
-                + (" {}" * len(args)).format(*args)
-            )
+        self.logger.debug("Creating property %s with args %s", name, args)
 
         self.command(
             "fix {} all property/global".format(name)
@@ -1068,8 +1395,7 @@ class LiggghtsAPI(EngineAPI):
         """
         Specify the interation forces
         """
-        if not self.rank:
-            logging.info("Setting up interaction parameters")
+        self.logger.info("Setting up interaction parameters")
 
         args = self.pargs["model-args"]
 
@@ -1110,47 +1436,68 @@ class LiggghtsAPI(EngineAPI):
         self.pddName = []
         self.integrator = []
 
+        phase = self.startup_profile.phase
+
         if not self.pargs["restart"][3] and not self.pargs["read_data"]:
 
-            self.createDomain()
+            with phase("createDomain"):
+                self.createDomain()
             # self.createGroup()
-            self.setupPhysics()
-            self.setupNeighbor(**self.pargs)
-            self.setupParticles()
-            self.setupGravity()
+            with phase("setupPhysics"):
+                self.setupPhysics()
+            with phase("setupNeighbor"):
+                self.setupNeighbor(**self.pargs)
+            with phase("setupParticles"):
+                self.setupParticles()
+            with phase("setupGravity"):
+                self.setupGravity()
 
         elif self.pargs["read_data"]:
-            self.createDomain()
-            self.readData()
-            self.setupPhysics()
-            self.setupNeighbor(**self.pargs)
-            self.setupParticles()
-            self.setupGravity()
+            with phase("createDomain"):
+                self.createDomain()
+            with phase("readData"):
+                self.readData()
+            with phase("setupPhysics"):
+                self.setupPhysics()
+            with phase("setupNeighbor"):
+                self.setupNeighbor(**self.pargs)
+            with phase("setupParticles"):
+                self.setupParticles()
+            with phase("setupGravity"):
+                self.setupGravity()
 
         else:
-            self.resume()
-            self.setupPhysics()
-            self.setupNeighbor(**self.pargs)
-            self.setupParticles()
-            self.setupGravity()
-
-        self.setupIntegrate()
-        self.importMeshes()
+            with phase("resume"):
+                self.resume()
+            with phase("setupPhysics"):
+                self.setupPhysics()
+            with phase("setupNeighbor"):
+                self.setupNeighbor(**self.pargs)
+            with phase("setupParticles"):
+                self.setupParticles()
+            with phase("setupGravity"):
+                self.setupGravity()
+
+        with phase("setupIntegrate"):
+            self.setupIntegrate()
+
+        with phase("importMeshes"):
+            self.importMeshes()
 
         # Write output to trajectory by default unless the user specifies otherwise
-        if "dump" in self.pargs:
-            if self.pargs["dump"] == True:
+        with phase("setupWrite"):
+            if "dump" in self.pargs:
+                if self.pargs["dump"] == True:
+                    self.setupWrite()
+            else:
                 self.setupWrite()
-        else:
-            self.setupWrite()
 
     def setupIntegrate(self, itype=None, group=None):
         """
         Specify how Newton's eqs are integrated in time. MUST BE EXECUTED ONLY ONCE.
         .. todo:: Extend this to super-quadric particles
         """
-        if not self.rank:
-            logging.info("Setting up integration scheme parameters")
+        self.logger.debug("Setting up integration scheme parameters")
 
         spheres = []
         multi = []
@@ -1208,12 +1555,42 @@ class LiggghtsAPI(EngineAPI):
 
         return self.integrator
 
-    def integrate(self, steps, dt=None):
+    def integrate(self, steps, dt=None, every=None, callback=None):
         """
-        Run simulation in time
+        Run simulation in time, optionally in chunks of `every` steps with a Python callback after each chunk
+
+        :param steps: number of steps
+        :type steps: int
+
+        :param dt: timestep
+        :type dt: float
+
+        :param every: number of steps per chunk
+        :type every: int
+
+        :param callback: function called as callback(step, atoms) after each chunk, where step is the number of
+            steps run so far and atoms is an :class:`AtomViews` mapping of zero-copy per-atom arrays. A truthy
+            return value signals that the system was modified (e.g. by writing to the arrays), so the next
+            chunk runs the full LIGGGHTS setup.
+        :type callback: callable
+
+        .. note:: All chunks make up a single run for LIGGGHTS ('run N start S stop S+steps'): the setup is
+            done for the first chunk only ('pre no'), and the run statistics are printed for the last chunk only
+            ('post no'). Commands issued by the callback are batched (see :meth:`batch`), and trigger a full
+            setup of the next chunk.
+
+        .. note:: If :attr:`thermo` samples every so many steps (DEM keyword 'thermo'), the run is chunked
+            as well, and chunks are as long as possible for both the callback and the sampling.
+
+        .. note:: If the DEM keyword 'timing' is set, the timing breakdown of every call (steps/s,
+            particle-steps/s, wall time across procs, and the time spent per section as reported by LIGGGHTS) is
+            appended to :attr:`timings`. Loop times are summed over all chunks, but the time per section is that
+            of the last chunk only.
+
+        .. note:: If the DEM keyword 'memory' is set, the memory footprint of every proc is appended to
+            :attr:`memory_reports` after every call (see :meth:`memory_report`).
         """
-        if not self.rank:
-            logging.info("Integrating the system for {} steps".format(steps))
+        self.logger.info("Integrating the system for %d steps", steps)
 
         for tup in self.monitorList:
             self.command("compute {} {} {}".format(*tup))
@@ -1221,14 +1598,193 @@ class LiggghtsAPI(EngineAPI):
         if dt is not None:
             self.command("timestep {}".format(dt))
 
-        self.command("run {}".format(steps))
+        # Python code run after every so many steps: the callback, and sampling of self.thermo
+        hooks = []
+        thermo = getattr(self, "thermo", None)
+
+        if callback is not None and every:
+            hooks.append((int(every), lambda step: self._callback(callback, step)))
+
+        if thermo is not None and thermo.every:
+            hooks.append((int(thermo.every), lambda step: thermo.sample()))
+
+        if self._timed:
+            wall = time.perf_counter()
+            self._run(steps, hooks)
+            self._timing(steps, time.perf_counter() - wall)
+        else:
+            self._run(steps, hooks)
+
+        if self._memory is not None and self._memory is not False:
+            self.memory_reports.append(self.memory_report())
+
+    def _run(self, steps, hooks):
+        """Issues a run of `steps` steps, in chunks if any hooks (every, function(step)) are supplied, in which
+        case each function is called every so many steps and returns True if it modified the system
+        """
+        if not hooks:
+            self.command("run {}".format(steps))
+            return
+
+        if isinstance(getattr(self, "api", None), CommandBatch):
+            raise RuntimeError("A run with a callback cannot be issued within a batch.")
+
+        steps, every = int(steps), math.gcd(*[every for every, _ in hooks])
+        start = self.extract_global("ntimestep", 2)
+        done, setup = 0, True
+
+        while done < steps:
+            nsteps = min(every, steps - done)
+            done += nsteps
+
+            self.command(
+                "run {} start {} stop {} pre {} post {}".format(
+                    nsteps,
+                    start,
+                    start + steps,
+                    "yes" if setup else "no",
+                    "yes" if done == steps else "no",
+                )
+            )
+
+            setup = False
+
+            for hook_every, hook in hooks:
+                if done % hook_every == 0 or done == steps:
+                    setup = bool(hook(done)) or setup
+
+    def _timing(self, steps, elapsed):
+        """Appends the timing breakdown of the last run (see :attr:`timings`) to the history"""
+        comm = self.comm
+        times = comm.allgather(elapsed) if comm is not None else [elapsed]
+        breakdown = self._read_log()
+
+        wall = {"min": min(times), "avg": sum(times) / len(times), "max": max(times)}
+        natoms = self.get_natoms()
+
+        record = {
+            "steps": steps,
+            "natoms": natoms,
+            "wall": wall,
+            "imbalance": wall["max"] / wall["avg"] if wall["avg"] else 1.0,
+            "steps_per_s": steps / wall["max"] if wall["max"] else None,
+            "particle_steps_per_s": (
+                natoms * steps / wall["max"] if wall["max"] else None
+            ),
+            "loop_time": None,
+            "loop_steps": None,
+            "sections": {},
+        }
+
+        if breakdown:
+            record["loop_time"] = breakdown["loop_time"]
+            record["loop_steps"] = breakdown["steps"]
+            record["sections"] = breakdown["sections"]
+
+        self.timings.append(record)
+
+        self.logger.debug(
+            "Ran %d steps in %.4g s (%.4g steps/s)",
+            steps,
+            wall["max"],
+            record["steps_per_s"] or 0,
+        )
+
+        return record
+
+    def _read_log(self):
+        """Returns the summary of the runs logged since the previous read (see :class:`timing.TimingLog`), or
+        None if there is none or LIGGGHTS does not write a log. Collective over the simulation's procs.
+        """
+        comm = self.comm
+        logfile = getattr(self, "_timing_log", None)
+        summary = None
+
+        if logfile is None:
+            return None
+
+        # Re-open the log, so that LIGGGHTS flushes the summary of the run to it
+        self.command("log {} append".format(logfile.fname))
+
+        if comm is None or not comm.Get_rank():
+            summary = logfile.read()
+
+        if comm is not None:
+            summary = comm.bcast(summary, root=0)
+
+        if summary:
+            self._summary = summary
+
+        return summary
+
+    def memory_report(self, warn=None):
+        """
+        Reports the memory footprint of every proc of this simulation: resident set size (RSS), number of owned
+        (nlocal) and ghost (nghost) particles, and memory held by Python-side buffers (:attr:`buffers`,
+        :attr:`thermo`, monitored variables), along with the neighbor list statistics and the memory allocated
+        by LIGGGHTS per proc as reported in the log for the last run. Collective over the simulation's procs.
+
+        :param warn: log a warning if the RSS of any proc exceeds this many bytes (default: the DEM keyword
+            'memory' if it is a number, else no warning)
+        :type warn: float
+
+        :return: report, see :func:`pygran_sim.engine.liggghts.memory.summarize`, with the step it was made at
+        :rtype: dict
+
+        .. note:: Ghost particles and neighbor lists grow with the neighbor skin (see :meth:`setupNeighbor`), and
+            'atom_modify map array' allocates a map of all particle IDs on every proc.
+        """
+        if not self._timed:
+            self._read_log()
+
+        buffers = self.buffers.nbytes + sum(reader.nbytes for reader in self._monitor)
+
+        if getattr(self, "thermo", None) is not None:
+            buffers += self.thermo.nbytes
+
+        local = {
+            "rss": memory.rss(),
+            "buffers": buffers,
+            "nlocal": self.extract_global("nlocal", 0),
+            "nghost": self.extract_global("nghost", 0),
+        }
+
+        ranks = self.split.allgather(local) if self.split is not None else [local]
+
+        report = memory.summarize(ranks, getattr(self, "_summary", None))
+        report["step"] = self.extract_global("ntimestep", 2)
+
+        if warn is None:
+            warn = None if isinstance(self._memory, bool) else self._memory
+
+        rss = report["rss"]
+
+        if warn is not None and rss is not None and rss["max"] > warn:
+            if self.split is None or not self.split.Get_rank():
+                self.logger.warning(
+                    "Memory usage of proc %d (%.1f MB RSS, %d owned + %d ghost particles) exceeds %.1f MB",
+                    rss["argmax"],
+                    rss["max"] / 2**20,
+                    ranks[rss["argmax"]]["nlocal"],
+                    ranks[rss["argmax"]]["nghost"],
+                    warn / 2**20,
+                )
+
+        return report
+
+    def _callback(self, callback, step):
+        """Calls a run callback with fresh views of the per-atom arrays, and returns True if the callback
+        modified the system, i.e. issued commands or returned a truthy value"""
+        with self.batch() as batch:
+            modified = callback(step, AtomViews(self))
+
+        return bool(modified) or batch.nflushed > 0
 
     def setupPrint(self):
         """
         Specify which variables to write to file, and their format
         """
-        if not self.rank:
-            logging.info("Setting up printing options")
+        self.logger.info("Setting up printing options")
 
         freq, args = self.pargs["print"][0], self.pargs["print"][1:]
 
@@ -1236,21 +1792,28 @@ class LiggghtsAPI(EngineAPI):
         self.command("thermo {}".format(freq))
         self.command("thermo_modify norm no lost ignore")
 
+        # In-memory time series of the same quantities (DEM keyword 'thermo': every or (every, capacity))
+        thermo = self.pargs.get("thermo")
+
+        if thermo:
+            every, capacity = (
+                thermo if isinstance(thermo, (tuple, list)) else (thermo, 10**4)
+            )
+            self.thermo = ThermoRecorder(self, args, every, capacity)
+        else:
+            self.thermo = None
+
     def setupWrite(self, only_mesh=False, name=None):
         """
         This creates dumps for particles and meshes in the system. In LIGGGHTS, all meshes must be declared once, so if a mesh is removed during
         the simulation, this function has to be called again, usually with only_mesh=True to keep the particle dump intact.
         """
-        if not self.rank:
-            logging.info("Setting up trajectory i/o")
+        self.logger.info("Setting up trajectory i/o")
 
         # Make sure the user did not request no particles be saved to a traj file, or we're not just re-initializing the meshes
         if not only_mesh and self.pargs["traj"]["pfile"]:
 
-            if hasattr(self, "dump"):
-                if self.dump:
-                    self.command("undump dump")
-
+            # An existing dump is re-defined only if its settings changed (see CommandState)
             if not name:
                 name = "dump"
 
@@ -1271,12 +1834,8 @@ class LiggghtsAPI(EngineAPI):
         self.pargs["traj"]["dump_mname"] = []
 
         # Make sure meshes are defined so we can dump them if requested (or not)
+        # Mesh dumps are named after their meshes, so that unchanged dumps are not re-defined (see CommandState)
         if "mesh" in self.pargs:
-            if hasattr(self, "dump"):
-                if self.dump:
-                    for dname in self.pargs["traj"]["dump_mname"]:
-                        self.command("undump " + dname)
-
             if "mfile" not in self.pargs["traj"]:
                 for mesh in self.pargs["mesh"].keys():
 
@@ -1287,7 +1846,7 @@ class LiggghtsAPI(EngineAPI):
                             args = self.pargs["traj"].copy()
                             args["mfile"] = mesh + "-*.vtk"
                             args["mName"] = mesh
-                            name = "dump" + str(numpy.random.randint(0, 1e8))
+                            name = "dump_" + mesh
                             self.pargs["traj"]["dump_mname"].append(name)
 
                             self.command(
@@ -1316,7 +1875,7 @@ class LiggghtsAPI(EngineAPI):
                         args["mfile"] = self.pargs["traj"]["mfile"]
                         args["mName"] = name
 
-                        dname = "dump" + str(numpy.random.randint(0, 1e8))
+                        dname = "dump_meshes"
                         self.pargs["traj"]["dump_mname"] = [dname]
 
                         self.command(
@@ -1334,31 +1893,145 @@ class LiggghtsAPI(EngineAPI):
 
     def getCoords(self):
         """
-        Extracts atomic positions from a certian frame and adds it to coords
+        Extracts atomic positions of all particles, ordered by atom ID (see :meth:`extractCoords`)
         """
-        if not self.rank:
-            logging.info("Extracting atomic poitions")
+        return self.extractCoords()
+
+    def extractCoords(self, group=None, species=None):
+        """
+        Extracts the positions of all particles (across all procs), ordered by atom ID
+
+        :param group: extract only particles in this group (e.g. 'group0')
+        :type group: str
+
+        :param species: extract only particles of this species (1, 2, ...)
+        :type species: int
+
+        :return: positions
+        :rtype: numpy.ndarray of shape (N, 3)
+        """
+        return self._extract("x", group, species)
+
+    def extractVelocities(self, group=None, species=None):
+        """
+        Extracts the velocities of all particles (across all procs), ordered by atom ID
+
+        :param group: extract only particles in this group (e.g. 'group0')
+        :type group: str
+
+        :param species: extract only particles of this species (1, 2, ...)
+        :type species: int
 
-        # Extract coordinates from liggghts
-        self.command("variable x atom x")
-        x = self.lmp.extract_variable("x", "group1", 1)
+        :return: velocities
+        :rtype: numpy.ndarray of shape (N, 3)
+        """
+        return self._extract("v", group, species)
 
-        self.command("variable y atom y")
-        y = self.lmp.extract_variable("y", "group1", 1)
+    def extractForces(self, group=None, species=None):
+        """
+        Extracts the forces acting on all particles (across all procs), ordered by atom ID
 
-        self.command("variable z atom z")
-        z = self.lmp.extract_variable("z", "group1", 1)
+        :param group: extract only particles in this group (e.g. 'group0')
+        :type group: str
+
+        :param species: extract only particles of this species (1, 2, ...)
+        :type species: int
 
-        coords = numpy.zeros((self.get_natoms(), 3))
+        :return: forces
+        :rtype: numpy.ndarray of shape (N, 3)
+        """
+        return self._extract("f", group, species)
+
+    def extract_local(self, name, group=None, species=None):
+        """
+        Extracts a per-atom property of the (selected) particles owned by this proc, along with their
+        global IDs. Unlike :meth:`extractCoords` or :meth:`gather_atoms_array`, nothing is communicated,
+        so memory per proc scales with the number of particles it owns. The arrays are copies, in local
+        (not ID) order; use the :mod:`pygran_sim.parallel` reductions to combine them across procs.
+
+        :param name: name of the property (see :attr:`atom_arrays`)
+        :type name: str
+
+        :param group: extract only particles in this group (e.g. 'group0')
+        :type group: str
+
+        :param species: extract only particles of this species (1, 2, ...)
+        :type species: int
+
+        :return: atom IDs of shape (n,) and values of shape (n, 3) or (n,)
+        :rtype: tuple of numpy.ndarray
+        """
+        ids = self.extract_atom_array("id")
+        values = self.extract_atom_array(name)
 
-        for i in range(self.get_natoms()):
-            coords[i, :] = x[i], y[i], z[i]
+        if group is None and species is None:
+            return ids.copy(), values.copy()
 
-        self.command("variable x delete")
-        self.command("variable y delete")
-        self.command("variable z delete")
+        selected = numpy.ones(len(ids), dtype=bool)
 
-        return coords
+        if species is not None:
+            selected &= self.extract_atom_array("type") == int(species)
+
+        if group is not None:
+            # 1 for atoms in group, 0 otherwise
+            self.command("variable pygran_select atom gmask({})".format(group))
+            selected &= self._atom_variable("pygran_select", nlocal=len(ids)) != 0
+            self.command("variable pygran_select delete")
+
+        return ids[selected], values[selected]
+
+    def _extract(self, name, group=None, species=None):
+        """Extracts a per-atom vector of all (selected) particles, ordered by atom ID, in bulk. Without
+        any selection, LIGGGHTS gathers and orders the values itself. Otherwise, every proc selects its own
+        particles, and the selected values are gathered over the simulation communicator and sorted by ID.
+        """
+        if group is None and species is None:
+            natoms = self.get_natoms()
+            return self.gather_atoms_array(name, 1, 3, out=numpy.empty((natoms, 3)))
+
+        ids, values = self.extract_local(name, group, species)
+
+        counts = numpy.array(self.split.allgather(len(ids)))
+        allids = numpy.empty(counts.sum(), dtype=ids.dtype)
+        allvalues = numpy.empty((counts.sum(), 3))
+
+        self.split.Allgatherv(ids, [allids, counts])
+        self.split.Allgatherv(values, [allvalues, counts * 3])
+
+        return allvalues[numpy.argsort(allids)]
+
+    def _atom_variable(self, name, group="all", nlocal=None, out=None):
+        """Returns the values of an atom-style variable for the particles owned by this proc
+        in one bulk copy
+
+        :param name: variable name
+        :type name: str
+
+        :param group: group of atoms for which the variable is evaluated (0 for the others)
+        :type group: str
+
+        :param nlocal: number of particles owned by this proc (extracted if not supplied)
+        :type nlocal: int
+
+        :param out: C-contiguous float64 array of shape (nlocal,) to copy the values into
+        :type out: numpy.ndarray
+
+        :rtype: numpy.ndarray of shape (nlocal,)
+        """
+        if nlocal is None:
+            nlocal = self.extract_global(b"nlocal", 0)
+
+        values = numpy.empty(nlocal) if out is None else out
+
+        ptr = self.api.extract_variable(self.lmp, _encode(name), _encode(group))
+
+        if nlocal:
+            ctypes.memmove(values.ctypes.data, ptr, values.nbytes)
+
+        # memory was allocated by the library interface function
+        self.api.free(ptr)
+
+        return values
 
     def monitor(self, **args):
         """
@@ -1370,7 +2043,8 @@ class LiggghtsAPI(EngineAPI):
         @[nrepeat: 1
         @[nfreq]: 1
 
-        returns the mean variable as a scalar
+        returns a :class:`MonitorReader` of the file the averages are written to, updated after every run
+        with the rows written during the run (reader.data is the (nrows, 2) array of steps and averages)
         """
         if "nevery" not in args:
             args["nevery"] = 1
@@ -1384,6 +2058,8 @@ class LiggghtsAPI(EngineAPI):
         if "name" not in args:
             args["name"] = args["vars"] + "-" + str(numpy.random.randint(0, 1e8))
 
+        args["file"] = self._abspath(args["file"])
+
         self.command("compute {name} {species} {var}".format(**args))
         self.command(
             "fix my{name} {species} ave/time {nevery} {nrepeat} {nfreq} c_{name} file {file}".format(
@@ -1391,11 +2067,12 @@ class LiggghtsAPI(EngineAPI):
             )
         )
 
-        setattr(self, "my{name}".format(**args), [])
+        reader = MonitorReader(args["file"])
+        setattr(self, "my{name}".format(**args), reader)
 
-        self._monitor.append(("my{name}".format(**args), args["file"]))
+        self._monitor.append(reader)
 
-        return getattr(self, "my{name}".format(**args))
+        return reader
 
     def addViscous(self, **args):
         """Adds a viscous damping force :math:`F` proportional
@@ -1436,7 +2113,7 @@ class LiggghtsAPI(EngineAPI):
         if not self.rank:
             try:
                 # plt.rc('text', usetex=True)
-                data = numpy.loadtxt(fname, comments="#")
+                data = numpy.loadtxt(self._abspath(fname), comments="#")
                 time = data[:, 0]
 
                 if xscale is not None:
@@ -1448,7 +2125,7 @@ class LiggghtsAPI(EngineAPI):
                     plt.grid()
 
                 if output:
-                    plt.savefig(output)
+                    plt.savefig(self._abspath(output))
             except Exception:
                 raise Exception("Unexpected error:", sys.exc_info()[0])
 
@@ -1457,7 +2134,7 @@ class LiggghtsAPI(EngineAPI):
         if not self.rank:
 
             try:
-                numpy.savetxt(fname, numpy.array(self.vars[name]))
+                numpy.savetxt(self._abspath(fname), numpy.array(self.vars[name]))
             except Exception:
                 raise Exception("Unexpected error:", sys.exc_info()[0])
 
@@ -1468,9 +2145,59 @@ class LiggghtsAPI(EngineAPI):
         :type cmd: str
 
         .. note:: For python 3, "cmd" is encoded as an 8 character utf
+
+        .. note:: Commands that change nothing (e.g. re-defining an identical compute, fix, or dump, or
+            setting the same timestep) are skipped, see :class:`CommandState`. A command is recorded
+            in :attr:`state` only once LIGGGHTS ran it, i.e. within a :meth:`batch`, once the batch is flushed.
+        """
+        # The state is shared with a run in flight on the worker thread, if any
+        self.worker.check("command")
+
+        batch = self.api if isinstance(self.api, CommandBatch) else None
+        state = self.state if batch is None else batch.staged
+        commands, change = state.prepare(cmd)
+
+        for cmd in commands:
+            self.api.command(self.lmp, cmd.encode("utf-8"))
+
+        if batch is None:
+            self.state.commit(change)
+        else:
+            batch.stage(change)
+
+    @contextmanager
+    def batch(self):
+        """Context manager that buffers the commands issued within it (by :meth:`command` and every method
+        that issues commands, e.g. setupParticles or importMeshes) and submits them to LIGGGHTS in one call
+        on exit, through a temporary script in the output dir. Queries (extract_*, gather_atoms, etc.) submit
+        the buffered commands first. Nested batches are merged into the outermost one.
+
+        :return: the batch, whose flush() method submits the commands buffered so far
+        :rtype: pygran_sim.engine.liggghts.commands.CommandBatch
+
+        :Example:
+          with engine.batch():
+              for i in range(nbins):
+                  engine.command(...)
+
+        .. note:: Each command is preceded in the script by a comment naming the Python call that issued it.
+            LIGGGHTS echoes the script to log.liggghts, where an error thus follows the origin of the failing command.
         """
+        if isinstance(self.api, CommandBatch):
+            yield self.api
+            return
+
+        root = self.comm is None or not self.comm.Get_rank()
+        batch = CommandBatch(
+            self.api, self.lmp, self.path, root, self.logger, self.state
+        )
+        self.api = batch
 
-        self.lib.lammps_command(self.lmp, cmd.encode("utf-8"))
+        try:
+            yield batch
+        finally:
+            self.api = batch.api
+            batch.flush()
 
     def resume(self):
         """..."""
@@ -1498,17 +2225,30 @@ class LiggghtsAPI(EngineAPI):
         .. note:: For python 3, "file" is encoded as an 8 character utf
 
         """
-        self.lib.lammps_file(self.lmp, filename.encode("utf-8"))
+        self.api.file(self.lmp, filename.encode("utf-8"))
 
     def __del__(self):
         """Destructor"""
         pass
 
     def close(self):
-        if hasattr(self, "lmp") and self.opened:
-            self.lib.lammps_close(self.lmp)
+        # Let a run in flight finish (see run_async) before releasing the instance
+        self.worker.shutdown()
+
+        if self._instance:
+            # Keep the instance alive for the next simulation: see pygran_sim.engine.liggghts.pool
+            pool.release(self._instance)
+            self._instance = None
+            self.lmp = None
+        elif hasattr(self, "lmp") and self.opened:
+            self.api.close(self.lmp)
             self.lmp = None
 
+        self.opened = False
+        self.buffers.clear()
+
+        self._export_profile()
+
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
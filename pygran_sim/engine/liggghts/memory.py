@@ -0,0 +1,106 @@
+"""
+Memory footprint of a LIGGGHTS simulation per proc
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+__all__ = ["rss", "summarize"]
+
+# Per-proc quantities of a memory report: resident set size and Python-side buffers (in bytes), and
+# number of owned and ghost particles
+FIELDS = ("rss", "buffers", "nlocal", "nghost")
+
+
+def rss():
+    """Returns the resident set size of this process in bytes: the current size on Linux, the peak
+    size on other Unix systems, and None if it cannot be determined
+
+    :rtype: int
+    """
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def summarize(ranks, summary=None):
+    """Combines the memory footprints of all procs into a report
+
+    :param ranks: footprint of each proc, ordered by rank: dictionaries of :data:`FIELDS`
+    :type ranks: list
+
+    :param summary: run summary parsed from the LIGGGHTS log (see :func:`timing.parse_timing`)
+    :type summary: dict
+
+    :return: report with keys ranks (the footprints), one dictionary of min, avg, max, total, and argmax
+        (rank) per field of :data:`FIELDS` (None if any proc could not determine it), and the neighbor list
+        statistics of the last run: neighbors (total number of pairs), neighbor_builds, neighs (min, avg,
+        max number of pairs per proc), and liggghts_memory (max Mbytes per proc allocated by LIGGGHTS)
+    :rtype: dict
+    """
+    report = {"ranks": ranks}
+
+    for field in FIELDS:
+        values = [rank.get(field) for rank in ranks]
+
+        if not values or any(value is None for value in values):
+            report[field] = None
+            continue
+
+        total = sum(values)
+        report[field] = {
+            "min": min(values),
+            "avg": total / len(values),
+            "max": max(values),
+            "total": total,
+            "argmax": values.index(max(values)),
+        }
+
+    summary = summary or {}
+
+    report["neighbors"] = summary.get("neighbors")
+    report["neighbor_builds"] = summary.get("neighbor_builds")
+    report["neighs"] = summary.get("counts", {}).get("Neighs")
+    report["liggghts_memory"] = summary.get("memory")
+
+    return report
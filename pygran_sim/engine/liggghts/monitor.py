@@ -0,0 +1,132 @@
+"""
+Incremental reader of the files written by LIGGGHTS fixes (e.g. ave/time)
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import io
+import os
+
+import numpy
+
+__all__ = ["MonitorReader"]
+
+
+class MonitorReader:
+    """Reads the rows appended to a text file written by a LIGGGHTS fix (e.g. the file of an
+    ave/time fix set up by :meth:`LiggghtsAPI.monitor`) since the last read. The byte offset of
+    the last complete row is remembered, so each read parses only new rows, and rows are
+    stored in an array that grows geometrically instead of being re-loaded after every run.
+    Comment lines (#) are skipped.
+
+    :param fname: file written by LIGGGHTS
+    :type fname: str
+
+    :param growth: factor by which the capacity of the array grows when full
+    :type growth: float
+
+    :Example:
+      reader = MonitorReader("ke.dat")
+      sim.run(1000)
+      reader.read()
+      steps, values = reader.data.T
+    """
+
+    def __init__(self, fname, growth=1.5):
+        self.fname = fname
+        self.growth = growth
+        self.offset = 0  # byte offset of the first row not read yet
+        self.nrows = 0
+        self._buffer = None
+
+    def read(self):
+        """Parses the complete rows appended to the file since the last read. A row that is still being
+        written (no newline yet) is left for the next read.
+
+        :return: number of rows read
+        :rtype: int
+        """
+        if not os.path.exists(self.fname):
+            return 0
+
+        with open(self.fname, "rb") as fp:
+            fp.seek(self.offset)
+            chunk = fp.read()
+
+        end = chunk.rfind(b"\n") + 1
+
+        if not end:
+            return 0
+
+        self.offset += end
+        rows = numpy.loadtxt(io.BytesIO(chunk[:end]), comments="#", ndmin=2)
+
+        if not len(rows):
+            return 0
+
+        self._append(rows)
+
+        return len(rows)
+
+    def _append(self, rows):
+        nrows = self.nrows + len(rows)
+
+        if self._buffer is None:
+            self._buffer = numpy.empty((nrows,) + rows.shape[1:])
+        elif len(self._buffer) < nrows:
+            capacity = max(nrows, int(len(self._buffer) * self.growth))
+            buffer = numpy.empty((capacity,) + self._buffer.shape[1:])
+            buffer[: self.nrows] = self._buffer[: self.nrows]
+            self._buffer = buffer
+
+        self._buffer[self.nrows : nrows] = rows
+        self.nrows = nrows
+
+    @property
+    def data(self):
+        """Rows read so far, as a (nrows, ncols) array (a view, valid until the next read)"""
+        if self._buffer is None:
+            return numpy.empty((0, 0))
+        return self._buffer[: self.nrows]
+
+    @property
+    def nbytes(self):
+        """Memory held by the buffer in bytes"""
+        return 0 if self._buffer is None else self._buffer.nbytes
+
+    def __array__(self, dtype=None, copy=None):
+        return numpy.asarray(self.data, dtype=dtype)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __len__(self):
+        return self.nrows
+
+    def __repr__(self):
+        return "MonitorReader({}, {} rows)".format(self.fname, self.nrows)
@@ -0,0 +1,189 @@
+"""
+A pool of LIGGGHTS library handles and instances reused across consecutive simulations
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import atexit
+import ctypes
+
+from pygran_sim.tools import _fingerprint
+
+try:
+    from mpi4py import MPI
+except Exception:
+    MPI = None
+
+__all__ = ["EnginePool", "pool"]
+
+
+class _Instance:
+    """An idle LIGGGHTS instance along with the library handle (and the fingerprint of the library build)
+    and communicator it was opened with"""
+
+    def __init__(self, lib, lmp, library, comm, cmdargs):
+        self.lib = lib
+        self.lmp = lmp
+        self.library = library
+        self.fingerprint = _fingerprint(library)
+        self.comm = comm
+        self.cmdargs = cmdargs
+
+
+class EnginePool:
+    """Keeps loaded LIGGGHTS libraries and opened instances alive between consecutive simulations
+    run in the same process, e.g. parameter sweeps that create many DEM objects in sequence. A
+    released instance is reset with the 'clear' command, and the next simulation created on an
+    equivalent communicator with the same library build and command-line args picks it up instead of
+    calling lammps_open again. All idle instances are closed when the interpreter exits.
+
+    Every proc of a communicator must acquire and release instances in the same order, which is
+    the case when all procs run the same script.
+
+    :Example:
+      lib = pool.library(path)
+      instance = pool.acquire(path, comm, cmdargs)
+
+      if not instance:
+          ... # open a new instance lmp
+          instance = pool.track(lib, lmp, path, comm, cmdargs)
+      ...
+      pool.release(instance)
+    """
+
+    def __init__(self):
+        self._libraries = {}  # library path -> (fingerprint, CDLL)
+        self._idle = []  # idle _Instance objects
+        self._registered = False
+
+    def library(self, path):
+        """Returns the handle of a shared library, loading it only if it was not loaded before or
+        if it was rebuilt since
+
+        :param path: full path to the shared library
+        :type path: str
+
+        :rtype: ctypes.CDLL
+        """
+        fingerprint = _fingerprint(path)
+        cached = self._libraries.get(path)
+
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        lib = ctypes.CDLL(path, ctypes.RTLD_GLOBAL)
+        self._libraries[path] = (fingerprint, lib)
+
+        return lib
+
+    def track(self, lib, lmp, library, comm, cmdargs=()):
+        """Wraps a newly opened instance so that it can be released to the pool when its simulation ends
+
+        :param lib: library handle the instance was opened with
+        :type lib: ctypes.CDLL
+
+        :param lmp: pointer to the LIGGGHTS instance
+        :type lmp: ctypes.c_void_p
+
+        :param library: full path to the shared library
+        :type library: str
+
+        :param comm: MPI communicator the instance runs on
+        :type comm: MPI Intracomm
+
+        :param cmdargs: command-line arguments the instance was opened with
+        :type cmdargs: tuple
+
+        :rtype: _Instance
+        """
+        return _Instance(lib, lmp, library, comm, tuple(cmdargs))
+
+    def acquire(self, library, comm, cmdargs=()):
+        """Takes an idle instance out of the pool
+
+        :param library: full path to the shared library the instance must be created from, and not
+            rebuilt since (see :func:`pygran_sim.tools._fingerprint`)
+        :type library: str
+
+        :param comm: MPI communicator the instance must run on (an identical or congruent one matches)
+        :type comm: MPI Intracomm
+
+        :param cmdargs: command-line arguments the instance must have been opened with
+        :type cmdargs: tuple
+
+        :return: idle instance or None if no match is found
+        :rtype: _Instance
+        """
+        cmdargs = tuple(cmdargs)
+        fingerprint = _fingerprint(library)
+
+        for i, instance in enumerate(self._idle):
+            if (
+                instance.library == library
+                and instance.fingerprint == fingerprint
+                and instance.cmdargs == cmdargs
+                and self._match(instance.comm, comm)
+            ):
+                return self._idle.pop(i)
+
+        return None
+
+    def release(self, instance):
+        """Resets an instance (deletes all atoms, fixes, computes, etc.) and returns it to the pool
+
+        :param instance: instance to release
+        :type instance: _Instance
+        """
+        instance.lib.lammps_command(instance.lmp, b"clear")
+        self._idle.append(instance)
+
+        if not self._registered:
+            atexit.register(self.drain)
+            self._registered = True
+
+    def drain(self):
+        """Closes all idle instances"""
+        while self._idle:
+            instance = self._idle.pop()
+            instance.lib.lammps_close(instance.lmp)
+
+    def __len__(self):
+        return len(self._idle)
+
+    @staticmethod
+    def _match(comm, other):
+        if comm is other:
+            return True
+
+        if MPI is None:
+            return False
+
+        return MPI.Comm.Compare(comm, other) in (MPI.IDENT, MPI.CONGRUENT)
+
+
+pool = EnginePool()
@@ -0,0 +1,150 @@
+"""
+In-memory time series of LIGGGHTS thermo quantities
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import re
+
+import numpy
+
+__all__ = ["ThermoRecorder"]
+
+
+class ThermoRecorder:
+    """Samples thermo quantities (the keywords of 'thermo_style custom', e.g. time, atoms, ke, or c_ID)
+    into a fixed-size ring buffer of NumPy arrays, without formatting or parsing any text. Every sample
+    is one row of floats, the first of which is the step, and overwrites the oldest row once the buffer
+    is full.
+
+    Values are read through the C API: step, dt, and atoms with extract_global/get_natoms, global scalar
+    computes (c_ID) with extract_compute, and any other keyword through an equal-style variable
+    (pygran_thermo_<keyword>) defined when the recorder is created.
+
+    :param engine: engine the quantities are read from
+    :type engine: pygran_sim.engine.liggghts.engine_liggghts.LiggghtsAPI
+
+    :param keywords: thermo keywords to record
+    :type keywords: sequence of str
+
+    :param every: sample every this many steps during runs (default None: only when :meth:`sample` is called)
+    :type every: int
+
+    :param capacity: number of samples kept
+    :type capacity: int
+
+    :Example:
+      sim = DEM(..., thermo=(1000, 10**4))
+      sim.run(10**5)
+      steps, ke = sim.thermo["step"], sim.thermo["ke"]
+    """
+
+    def __init__(self, engine, keywords, every=None, capacity=10**4):
+        self.keywords = ("step",) + tuple(kw for kw in keywords if kw != "step")
+        self.every = every
+        self.capacity = int(capacity)
+        self.nsamples = 0  # total number of samples, including overwritten ones
+        self._buffer = numpy.full((self.capacity, len(self.keywords)), numpy.nan)
+        self._columns = {kw: i for i, kw in enumerate(self.keywords)}
+        self._readers = [self._reader(engine, kw) for kw in self.keywords]
+
+    @staticmethod
+    def _reader(engine, keyword):
+        """Returns a function that reads the current value of a thermo keyword"""
+        if keyword == "step":
+            return lambda: engine.extract_global("ntimestep", 2)
+        if keyword == "dt":
+            return lambda: engine.extract_global("dt", 1)
+        if keyword == "atoms":
+            return engine.get_natoms
+
+        match = re.fullmatch(r"c_(\w+)", keyword)
+
+        if match:
+            # global scalar of a compute
+            return lambda: engine.extract_compute(match.group(1), 0, 0)
+
+        name = "pygran_thermo_" + re.sub(r"\W", "_", keyword)
+        engine.command("variable {} equal {}".format(name, keyword))
+
+        return lambda: engine.extract_variable(name, "all", 0)
+
+    def sample(self):
+        """Appends the current values of all keywords (O(1), no allocation)"""
+        row = self._buffer[self.nsamples % self.capacity]
+
+        for i, read in enumerate(self._readers):
+            row[i] = read()
+
+        self.nsamples += 1
+
+    @property
+    def data(self):
+        """Samples kept, oldest first, as an array of shape (len(self), len(keywords)): a view
+        until the buffer wraps around, a copy afterwards"""
+        if self.nsamples <= self.capacity:
+            return self._buffer[: self.nsamples]
+
+        start = self.nsamples % self.capacity
+        return numpy.concatenate((self._buffer[start:], self._buffer[:start]))
+
+    def latest(self):
+        """Returns the last sample as a dictionary of keyword -> value
+
+        :rtype: dict
+        """
+        if not self.nsamples:
+            return {}
+
+        row = self._buffer[(self.nsamples - 1) % self.capacity]
+        return dict(zip(self.keywords, row.tolist()))
+
+    def clear(self):
+        """Discards all samples"""
+        self.nsamples = 0
+        self._buffer.fill(numpy.nan)
+
+    def keys(self):
+        return self.keywords
+
+    @property
+    def nbytes(self):
+        """Memory held by the ring buffer in bytes"""
+        return self._buffer.nbytes
+
+    def __getitem__(self, keyword):
+        """Returns the time series of a keyword, oldest first"""
+        return self.data[:, self._columns[keyword]]
+
+    def __len__(self):
+        return min(self.nsamples, self.capacity)
+
+    def __repr__(self):
+        return "ThermoRecorder({}, {} samples)".format(
+            ", ".join(self.keywords), len(self)
+        )
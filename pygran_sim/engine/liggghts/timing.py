@@ -0,0 +1,171 @@
+"""
+Timing breakdowns of LIGGGHTS runs, parsed from its log file
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import os
+import re
+
+__all__ = ["TimingLog", "parse_timing"]
+
+# Section names as printed by LIGGGHTS (older LAMMPS format) -> names used in timing records
+SECTIONS = {"Outpt": "Output", "Modfy": "Modify"}
+
+_LOOP = re.compile(
+    r"^Loop time of (\S+) on (\d+) procs? for (\d+) steps with (\d+) atoms", re.M
+)
+
+# e.g. 'Pair  time (%) = 0.0352 (60.6)'
+_AVERAGE = re.compile(r"^(\w+)\s+time \(%\) = (\S+) \((\S+)\)", re.M)
+
+# e.g. 'Pair    | 1.7979     | 1.8201     | 1.8374     |   1.1 | 64.73'
+_TABLE = re.compile(
+    r"^(\w+)\s*\|\s*(\S*)\s*\|\s*(\S+)\s*\|\s*(\S*)\s*\|\s*\S*\s*\|\s*(\S+)\s*$", re.M
+)
+
+# e.g. 'Nghost:    1956 ave 1956 max 1956 min' for Nlocal, Nghost, and Neighs
+_COUNTS = re.compile(r"^(\w+):\s+(\S+) ave (\S+) max (\S+) min", re.M)
+
+# e.g. 'Total # of neighbors = 19500', 'Neighbor list builds = 12'
+_NEIGHBORS = re.compile(r"^Total # of neighbors = (\d+)", re.M)
+_BUILDS = re.compile(r"^Neighbor list builds = (\d+)", re.M)
+
+# Memory estimate printed by LIGGGHTS at setup, e.g. 'Memory usage per processor = 4.30591 Mbytes', or
+# 'Per MPI rank memory allocation (min/avg/max) = 4.015 | 4.015 | 4.015 Mbytes' in recent LAMMPS versions
+_MEMORY = re.compile(
+    r"^(?:Memory usage per processor = (\S+)|Per MPI rank memory allocation \(min/avg/max\) = \S+ \| \S+ \| (\S+)) Mbytes",
+    re.M,
+)
+
+
+def _float(value):
+    return float(value) if value else None
+
+
+def parse_timing(text):
+    """Parses the timing breakdown printed by LIGGGHTS at the end of the runs in `text` (a log excerpt):
+    the loop time, the time spent in each section (Pair, Neigh, Comm, Output, Modify, Other, ...), the
+    distribution of owned/ghost particles and neighbors across procs, and the memory estimated by LIGGGHTS.
+    Older versions print the average time per section only, in which case min and max are None.
+
+    The loop time and steps are summed over all runs in `text`, e.g. the chunks of a chunked run, while the
+    remaining statistics are those of the last run: LIGGGHTS prints them for the last chunk only ('post no').
+
+    :param text: LIGGGHTS log (or screen) output
+    :type text: str
+
+    :return: breakdown with keys loop_time, nprocs, steps, natoms, sections, which maps section names
+        to dictionaries of min, avg, max (in seconds), and percent (of the loop time), counts, which maps
+        Nlocal, Nghost, and Neighs to dictionaries of min, avg, and max per proc, neighbors (total number of
+        pairs), neighbor_builds, and memory (max Mbytes per proc allocated by LIGGGHTS at setup, None if not
+        found); None if `text` does not contain any run summary
+    :rtype: dict
+    """
+    loops = list(_LOOP.finditer(text))
+
+    if not loops:
+        return None
+
+    loop = loops[-1]
+    summary = text[loop.end() :]
+    sections = {}
+
+    for match in _TABLE.finditer(summary):
+        name, tmin, tavg, tmax, percent = match.groups()
+
+        if name == "Section":
+            continue
+
+        sections[SECTIONS.get(name, name)] = {
+            "min": _float(tmin),
+            "avg": float(tavg),
+            "max": _float(tmax),
+            "percent": float(percent),
+        }
+
+    if not sections:
+        for match in _AVERAGE.finditer(summary):
+            name, tavg, percent = match.groups()
+            sections[SECTIONS.get(name, name)] = {
+                "min": None,
+                "avg": float(tavg),
+                "max": None,
+                "percent": float(percent),
+            }
+
+    counts = {
+        name: {"min": float(vmin), "avg": float(vavg), "max": float(vmax)}
+        for name, vavg, vmax, vmin in _COUNTS.findall(summary)
+    }
+
+    neighbors = _NEIGHBORS.search(summary)
+    builds = _BUILDS.search(summary)
+    memory = list(_MEMORY.finditer(text[: loop.start()]))
+
+    return {
+        "loop_time": sum(float(match.group(1)) for match in loops),
+        "nprocs": int(loop.group(2)),
+        "steps": sum(int(match.group(3)) for match in loops),
+        "natoms": int(loop.group(4)),
+        "sections": sections,
+        "counts": counts,
+        "neighbors": int(neighbors.group(1)) if neighbors else None,
+        "neighbor_builds": int(builds.group(1)) if builds else None,
+        "memory": float(next(filter(None, memory[-1].groups()))) if memory else None,
+    }
+
+
+class TimingLog:
+    """Reads the timing breakdown of the runs logged to a LIGGGHTS log file since the previous read, parsing
+    only the output appended in the meantime
+
+    :param fname: LIGGGHTS log file
+    :type fname: str
+    """
+
+    def __init__(self, fname):
+        self.fname = fname
+        self.offset = 0
+
+    def read(self):
+        """Returns the breakdown of the runs logged since the previous read (see :func:`parse_timing`), or
+        None if no run completed in the meantime
+
+        :rtype: dict
+        """
+        if not os.path.exists(self.fname):
+            return None
+
+        with open(self.fname, "rb") as fp:
+            fp.seek(self.offset)
+            text = fp.read()
+
+        self.offset += len(text)
+
+        return parse_timing(text.decode(errors="replace"))
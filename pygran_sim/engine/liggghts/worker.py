@@ -0,0 +1,153 @@
+"""
+Runs LIGGGHTS on a worker thread, with a guard against concurrent calls into the engine
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mpi4py import MPI
+
+__all__ = ["Worker", "BusyGuard"]
+
+
+def _busy(name):
+    return RuntimeError(
+        "The engine is busy with a run in flight: wait for its future before calling {}.".format(
+            name
+        )
+    )
+
+
+class BusyGuard:
+    """Stands in for the :class:`Bindings` of an engine while a call is in flight on a worker thread:
+    calls into the C API are passed through on the worker thread, and raise a RuntimeError on any other.
+
+    :param api: typed accessors of the C API
+    :type api: pygran_sim.engine.liggghts.bindings.Bindings
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.owner = None  # ident of the worker thread, set once the call starts
+
+    def __getattr__(self, name):
+        if threading.get_ident() != self.owner:
+            raise _busy(name)
+
+        return getattr(self.api, name)
+
+
+class Worker:
+    """Runs calls of an engine (e.g. :meth:`LiggghtsAPI.run`) one at a time on a dedicated thread, and
+    returns their futures. The C API is called through ctypes, which releases the GIL, so the calling
+    thread keeps running Python code while LIGGGHTS integrates. While a call is in flight, the engine's
+    bindings are guarded (see :class:`BusyGuard`), so any call into LIGGGHTS from another thread raises
+    a RuntimeError instead of corrupting the run.
+
+    :param engine: engine whose calls are run on the worker thread
+    :type engine: pygran_sim.engine.liggghts.engine_liggghts.LiggghtsAPI
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.future = None
+        self._executor = None
+        self._owner = None  # ident of the worker thread
+
+    @property
+    def busy(self):
+        """True while a call is in flight"""
+        return self.future is not None and not self.future.done()
+
+    def check(self, name):
+        """Raises a RuntimeError if a call is in flight and this is not the worker thread, e.g. before
+        engine state shared with the call is touched
+
+        :param name: name of the engine method called, for the error message
+        :type name: str
+        """
+        if self.future is not None and threading.get_ident() != self._owner:
+            if not self.future.done():
+                raise _busy(name)
+
+    def submit(self, func, *args, **kwargs):
+        """Runs func(*args, **kwargs) on the worker thread
+
+        :param func: engine method
+        :type func: callable
+
+        :return: future of the call's result
+        :rtype: concurrent.futures.Future
+        """
+        if self.busy:
+            raise RuntimeError("A run is already in flight: wait for its future first.")
+
+        comm = getattr(self.engine, "comm", None)
+
+        # LIGGGHTS calls MPI from the worker thread, while the calling thread may call MPI as well
+        if comm is not None and comm.Get_size() > 1:
+            if MPI.Query_thread() < MPI.THREAD_SERIALIZED:
+                raise RuntimeError(
+                    "Runs on a worker thread need MPI to be initialized with at least THREAD_SERIALIZED."
+                )
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pygran-run"
+            )
+
+        api = getattr(self.engine, "api", None)
+        guard = BusyGuard(api) if api is not None else None
+
+        if guard is not None:
+            self.engine.api = guard
+
+        def call():
+            self._owner = threading.get_ident()
+
+            if guard is not None:
+                guard.owner = threading.get_ident()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # restored before the future is resolved, so the engine is usable as soon as it is
+                if guard is not None:
+                    self.engine.api = api
+
+        self.future = self._executor.submit(call)
+
+        return self.future
+
+    def shutdown(self):
+        """Waits for the call in flight, if any, and stops the worker thread"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,125 @@
+"""
+A module for setting up buffered, non-blocking, per-rank logging of DEM simulations
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import logging
+import os
+import queue
+import weakref
+from logging.handlers import QueueHandler, QueueListener
+
+__all__ = ["getLogger", "closeLogger"]
+
+FORMAT = "%(asctime)s:%(levelname)s: %(message)s"
+
+# Names of the log levels accepted by getLogger (DEM keyword 'log_level'), in any case
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Logger used by engines instantiated without a DEM object: silent unless configured by the user
+logging.getLogger("pygran_sim").addHandler(logging.NullHandler())
+
+
+def getLogger(output, rank=0, sink="root", level="INFO", fname="pygran.log"):
+    """Creates a logger private to a DEM object. Records are put on an in-memory queue by the calling thread,
+    and written to file by a background thread (see :class:`logging.handlers.QueueListener`), so logging never
+    blocks the simulation on file I/O.
+
+    :param output: output dir in which the log file(s) are written
+    :type output: str
+
+    :param rank: rank of this proc in the simulation communicator
+    :type rank: int
+
+    :param sink: 'root' (default): only rank 0 writes to `fname`, 'rank': every proc writes to its own file
+        (e.g. pygran.3.log), None: logging off
+    :type sink: str
+
+    :param level: verbosity, i.e. minimum level of the records written ('DEBUG', 'INFO', 'WARNING', etc.).
+        Calls below this level return immediately.
+    :type level: str or int
+
+    :param fname: log filename for the root proc
+    :type fname: str
+
+    :return: logger; procs without a sink get a disabled logger
+    :rtype: logging.Logger
+
+    :raises ValueError: if `level` is not the name of a logging level
+    """
+    if isinstance(level, str):
+        name, level = level, logging.getLevelName(level.upper())
+
+        if not isinstance(level, int):
+            raise ValueError(
+                "Unknown log_level {!r}: use one of {}".format(name, ", ".join(LEVELS))
+            )
+
+    # Not registered with the logging module, so that loggers of closed DEM objects are not kept alive
+    logger = logging.Logger("pygran_sim", level=level)
+    logger.finalize = None
+
+    if sink == "rank":
+        root, ext = os.path.splitext(fname)
+        fname = "{}.{}{}".format(root, rank, ext)
+    elif sink != "root" or rank:
+        logger.disabled = True
+        return logger
+
+    handler = logging.FileHandler(os.path.join(output, fname))
+    handler.setFormatter(logging.Formatter(FORMAT))
+
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, handler)
+    listener.start()
+
+    logger.addHandler(QueueHandler(records))
+
+    # Flush and close the log file when the logger is closed, garbage collected, or at exit
+    logger.finalize = weakref.finalize(logger, _stop, listener)
+
+    return logger
+
+
+def _stop(listener):
+    listener.stop()
+
+    for handler in listener.handlers:
+        handler.close()
+
+
+def closeLogger(logger):
+    """Writes any pending records and closes the log file(s) of a logger created by :func:`getLogger`.
+    Calling it more than once has no effect.
+
+    :param logger: logger to close
+    :type logger: logging.Logger
+    """
+    if getattr(logger, "finalize", None):
+        logger.finalize()
@@ -0,0 +1,181 @@
+"""
+Reductions over the particles distributed across MPI procs
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import numpy
+from mpi4py import MPI
+
+__all__ = [
+    "count",
+    "reduce_sum",
+    "reduce_mean",
+    "reduce_min",
+    "reduce_max",
+    "histogram",
+]
+
+
+def _allreduce(local, op, comm):
+    """Reduces a (possibly 0-dim) array element-wise across all procs in `comm`"""
+    local = numpy.array(local, order="C")
+
+    if comm is not None:
+        out = numpy.empty_like(local)
+        comm.Allreduce(local, out, op=op)
+        local = out
+
+    return local if local.ndim else local[()]
+
+
+def _identity(values, op):
+    """Returns the identity element of a min (op=MPI.MIN) or max reduction for `values` per column"""
+    values = numpy.asarray(values)
+
+    if numpy.issubdtype(values.dtype, numpy.integer):
+        info = numpy.iinfo(values.dtype)
+        fill = info.max if op is MPI.MIN else info.min
+    else:
+        fill = numpy.inf if op is MPI.MIN else -numpy.inf
+
+    return numpy.full(values.shape[1:], fill, dtype=values.dtype)
+
+
+def count(values, comm=None):
+    """Returns the total number of particles across all procs in `comm` (collective call)
+
+    :param values: per-particle values owned by this proc, e.g. as returned by extract_local
+    :type values: numpy.ndarray
+
+    :param comm: MPI communicator, e.g. DEM.split (default None: this proc only)
+    :type comm: MPI Intracomm
+
+    :rtype: int
+    """
+    return int(_allreduce(numpy.int64(len(values)), MPI.SUM, comm))
+
+
+def reduce_sum(values, comm=None):
+    """Returns the sum of per-particle values over all particles across all procs in `comm`
+    (collective call). Vectors of shape (n, 3) are summed per component.
+
+    :param values: per-particle values owned by this proc, of shape (n,) or (n, ncols)
+    :type values: numpy.ndarray
+
+    :param comm: MPI communicator, e.g. DEM.split (default None: this proc only)
+    :type comm: MPI Intracomm
+
+    :rtype: scalar or numpy.ndarray of shape (ncols,)
+    """
+    return _allreduce(numpy.sum(values, axis=0), MPI.SUM, comm)
+
+
+def reduce_mean(values, comm=None):
+    """Returns the mean of per-particle values over all particles across all procs in `comm`
+    (collective call), or NaN if there are no particles
+
+    :param values: per-particle values owned by this proc, of shape (n,) or (n, ncols)
+    :type values: numpy.ndarray
+
+    :param comm: MPI communicator, e.g. DEM.split (default None: this proc only)
+    :type comm: MPI Intracomm
+
+    :rtype: scalar or numpy.ndarray of shape (ncols,)
+    """
+    n = count(values, comm)
+    total = reduce_sum(numpy.asarray(values, dtype=numpy.float64), comm)
+
+    return total / n if n else total * numpy.nan
+
+
+def reduce_min(values, comm=None):
+    """Returns the minimum of per-particle values over all particles across all procs in `comm`
+    (collective call). Procs that own no particles contribute the identity (inf, or the largest integer),
+    which is also the result if there are no particles at all.
+
+    :param values: per-particle values owned by this proc, of shape (n,) or (n, ncols)
+    :type values: numpy.ndarray
+
+    :param comm: MPI communicator, e.g. DEM.split (default None: this proc only)
+    :type comm: MPI Intracomm
+
+    :rtype: scalar or numpy.ndarray of shape (ncols,)
+    """
+    local = numpy.min(values, axis=0) if len(values) else _identity(values, MPI.MIN)
+    return _allreduce(local, MPI.MIN, comm)
+
+
+def reduce_max(values, comm=None):
+    """Returns the maximum of per-particle values over all particles across all procs in `comm`
+    (collective call). Procs that own no particles contribute the identity (-inf, or the smallest integer),
+    which is also the result if there are no particles at all.
+
+    :param values: per-particle values owned by this proc, of shape (n,) or (n, ncols)
+    :type values: numpy.ndarray
+
+    :param comm: MPI communicator, e.g. DEM.split (default None: this proc only)
+    :type comm: MPI Intracomm
+
+    :rtype: scalar or numpy.ndarray of shape (ncols,)
+    """
+    local = numpy.max(values, axis=0) if len(values) else _identity(values, MPI.MAX)
+    return _allreduce(local, MPI.MAX, comm)
+
+
+def histogram(values, bins=10, range=None, weights=None, comm=None):
+    """Computes the histogram of per-particle scalars (e.g. radii or speeds) over all particles across
+    all procs in `comm` (collective call), like numpy.histogram. Every proc bins its own particles, and
+    only the bin counts are communicated.
+
+    :param values: per-particle scalars owned by this proc, of shape (n,)
+    :type values: numpy.ndarray
+
+    :param bins: number of bins, or bin edges (identical on all procs)
+    :type bins: int or sequence
+
+    :param range: lower and upper range of the bins (default: global min and max of values)
+    :type range: tuple
+
+    :param weights: per-particle weights of shape (n,)
+    :type weights: numpy.ndarray
+
+    :param comm: MPI communicator, e.g. DEM.split (default None: this proc only)
+    :type comm: MPI Intracomm
+
+    :return: counts (or sums of weights) per bin and bin edges
+    :rtype: tuple of numpy.ndarray
+    """
+    values = numpy.asarray(values, dtype=numpy.float64)
+
+    if range is None and numpy.ndim(bins) == 0 and count(values, comm):
+        range = (reduce_min(values, comm), reduce_max(values, comm))
+
+    hist, edges = numpy.histogram(values, bins=bins, range=range, weights=weights)
+
+    return _allreduce(hist, MPI.SUM, comm), edges
@@ -0,0 +1,264 @@
+"""
+A module for profiling the performance of DEM simulations
+
+Created on October 17, 2026
+
+Author: Andrew Abi-Mansour
+
+This is the::
+
+  ██████╗ ██╗   ██╗ ██████╗ ██████╗  █████╗ ███╗   ██╗
+  ██╔══██╗╚██╗ ██╔╝██╔════╝ ██╔══██╗██╔══██╗████╗  ██║
+  ██████╔╝ ╚████╔╝ ██║  ███╗██████╔╝███████║██╔██╗ ██║
+  ██╔═══╝   ╚██╔╝  ██║   ██║██╔══██╗██╔══██║██║╚██╗██║
+  ██║        ██║   ╚██████╔╝██║  ██║██║  ██║██║ ╚████║
+  ╚═╝        ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
+
+DEM simulation and analysis toolkit
+http://www.pygran.org, support@pygran.org
+
+Core developer and main author:
+Andrew Abi-Mansour, andrew.abi.mansour@pygran.org
+
+PyGran is open-source, distributed under the terms of the GNU Public
+License, version 2 or later. It is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty
+of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. You should have
+received a copy of the GNU General Public License along with PyGran.
+If not, see http://www.gnu.org/licenses . See also top-level README
+and LICENSE files.
+"""
+
+import functools
+import inspect
+import json
+import time
+from contextlib import contextmanager
+
+__all__ = ["StartupProfile", "CallProfile"]
+
+
+class StartupProfile:
+    """Records the wall-clock time spent in each phase of a DEM startup (library discovery,
+    MPI splitting, engine instantiation, domain/particle/mesh setup, etc.). Phases can be nested,
+    in which case their names are joined with a '/', e.g. 'initialize/setupParticles'.
+
+    :Example:
+      profile = StartupProfile()
+      with profile.phase("configure"):
+          ...
+      profile.reduce(comm)
+      profile.write("startup.json")
+    """
+
+    def __init__(self):
+        self.phases = {}  # local (per-rank) wall-clock time in seconds per phase
+        self.stats = {}  # min/max/mean per phase across ranks, set by reduce()
+        self.nprocs = 1
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager that times the enclosed block as phase `name`
+
+        :param name: phase name, nested under any enclosing phase
+        :type name: str
+        """
+        self._stack.append(name)
+        name = "/".join(self._stack)
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+            self._stack.pop()
+
+    def reduce(self, comm=None):
+        """Reduces the phase timings across all procs in `comm` (collective call)
+
+        :param comm: MPI communicator (default None: this proc only)
+        :type comm: MPI Intracomm
+
+        :return: min, max, and mean wall-clock time in seconds per phase
+        :rtype: dict
+        """
+        phases = comm.allgather(self.phases) if comm else [self.phases]
+        self.nprocs = len(phases)
+        self.stats = {}
+
+        for name in self.phases:
+            times = [proc.get(name, 0.0) for proc in phases]
+            self.stats[name] = {
+                "min": min(times),
+                "max": max(times),
+                "mean": sum(times) / len(times),
+            }
+
+        return self.stats
+
+    def to_dict(self):
+        """Returns the profile as a JSON-serializable dictionary
+
+        :rtype: dict
+        """
+        return {"nprocs": self.nprocs, "phases": self.stats or self.phases}
+
+    def write(self, fname):
+        """Writes the profile to a JSON file
+
+        :param fname: output filename
+        :type fname: str
+        """
+        with open(fname, "w") as fp:
+            json.dump(self.to_dict(), fp, indent=2)
+
+    def __repr__(self):
+        lines = ["{:<40} {:>10} {:>10} {:>10}".format("phase", "min", "mean", "max")]
+        stats = self.stats or {
+            name: {"min": t, "max": t, "mean": t} for name, t in self.phases.items()
+        }
+
+        for name, stats in stats.items():
+            lines.append(
+                "{:<40} {min:>10.4f} {mean:>10.4f} {max:>10.4f}".format(name, **stats)
+            )
+
+        return "\n".join(lines)
+
+
+class CallProfile:
+    """Records the number of calls, and the cumulative and maximum wall-clock latency, of every public
+    method of an engine (command, gather_atoms, extract_*, insert, importMesh, setupWrite, etc.), and of
+    commands per verb (fix, run, dump, region, ...). Nested calls are included in the latency of their
+    callers, e.g. the commands issued by setupWrite.
+
+    Methods are wrapped on the engine instance by :meth:`attach` only, so an engine that is not
+    profiled runs its methods unchanged at no cost.
+
+    :Example:
+      profile = CallProfile()
+      profile.attach(engine)
+      ...
+      profile.write("profile.json")
+      print(profile)
+    """
+
+    # Methods that are not timed: close exports the profile
+    EXCLUDE = ("close",)
+
+    def __init__(self):
+        self.methods = {}  # method name -> [calls, total, max]
+        self.commands = {}  # command verb -> [calls, total, max]
+        self._attached = []
+
+    @staticmethod
+    def _record(stats, key, elapsed):
+        entry = stats.get(key)
+
+        if entry is None:
+            stats[key] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+
+    def attach(self, engine):
+        """Times all public methods of `engine` from now on, by shadowing them with timed wrappers
+        on the instance
+
+        :param engine: engine to profile
+        :type engine: pygran_sim.engine.api.EngineAPI
+        """
+        for name, func in inspect.getmembers(type(engine), inspect.isfunction):
+            if name.startswith("_") or name in self.EXCLUDE:
+                continue
+
+            method = getattr(engine, name)
+            wrapper = (
+                self._command(method)
+                if name == "command"
+                else self._method(name, method)
+            )
+            setattr(engine, name, wrapper)
+            self._attached.append(name)
+
+    def detach(self, engine):
+        """Restores the methods of `engine` wrapped by :meth:`attach`"""
+        for name in self._attached:
+            engine.__dict__.pop(name, None)
+
+        self._attached = []
+
+    def _method(self, name, method):
+        methods, record = self.methods, self._record
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(methods, name, time.perf_counter() - start)
+
+        return wrapper
+
+    def _command(self, method):
+        methods, commands, record = self.methods, self.commands, self._record
+
+        @functools.wraps(method)
+        def wrapper(cmd, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(cmd, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                record(methods, "command", elapsed)
+                record(commands, cmd.split(None, 1)[0] if cmd.strip() else "", elapsed)
+
+        return wrapper
+
+    def to_dict(self):
+        """Returns the profile as a JSON-serializable dictionary, with calls, total, and max latency
+        (in seconds) per method and per command verb
+
+        :rtype: dict
+        """
+
+        def table(stats):
+            return {
+                key: {"calls": calls, "total": total, "max": tmax}
+                for key, (calls, total, tmax) in sorted(
+                    stats.items(), key=lambda item: -item[1][1]
+                )
+            }
+
+        return {"methods": table(self.methods), "commands": table(self.commands)}
+
+    def write(self, fname):
+        """Writes the profile to a JSON file
+
+        :param fname: output filename
+        :type fname: str
+        """
+        with open(fname, "w") as fp:
+            json.dump(self.to_dict(), fp, indent=2)
+
+    def __repr__(self):
+        lines = []
+        profile = self.to_dict()
+
+        for title in ("methods", "commands"):
+            lines.append(
+                "{:<40} {:>10} {:>12} {:>12}".format(title, "calls", "total", "max")
+            )
+
+            for key, stats in profile[title].items():
+                lines.append(
+                    "{:<40} {calls:>10} {total:>12.6f} {max:>12.6f}".format(
+                        key, **stats
+                    )
+                )
+
+        return "\n".join(lines)
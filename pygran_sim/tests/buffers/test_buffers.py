@@ -0,0 +1,35 @@
+"""Tests the reuse and growth of pooled NumPy buffers."""
+
+import numpy
+
+from pygran_sim.buffers import BufferPool
+
+
+def test_reuse():
+    pool = BufferPool()
+
+    a = pool.get(("x", 1, 3), (10, 3), numpy.float64)
+    b = pool.get(("x", 1, 3), (8, 3), numpy.float64)
+
+    assert a.shape == (10, 3) and b.shape == (8, 3)
+    assert numpy.shares_memory(a, b)
+    assert len(pool) == 1
+
+    c = pool.get(("id", 0, 1), (10,), numpy.int32)
+    assert c.dtype == numpy.int32 and not numpy.shares_memory(a, c)
+    assert pool.nbytes == 10 * 3 * 8 + 10 * 4
+
+
+def test_growth():
+    pool = BufferPool(growth=2)
+
+    a = pool.get("x", (10, 3), numpy.float64)
+    b = pool.get("x", (11, 3), numpy.float64)  # over-allocated to 20 rows
+    c = pool.get("x", (20, 3), numpy.float64)
+
+    assert not numpy.shares_memory(a, b)
+    assert numpy.shares_memory(b, c)
+    assert pool.nbytes == 20 * 3 * 8
+
+    pool.clear()
+    assert not len(pool)
@@ -0,0 +1,121 @@
+"""Compiles the compaction setup into a LIGGGHTS input script without loading the library."""
+
+import os
+
+import numpy
+
+import pygran_sim as simulation
+
+organic = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientFriction": 0.5,
+    "coefficientRollingFriction": 0.0,
+    "cohesionEnergyDensity": 0.0,
+    "coefficientRestitution": 0.9,
+    "coefficientRollingViscousDamping": 0.1,
+    "yieldPress": 2.2e6,
+    "characteristicVelocity": 0.1,
+    "density": 1000.0,
+}
+
+mesh = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "liggghts",
+    "compaction",
+    "mesh",
+    "square.stl",
+)
+
+
+def test_script(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    params = {
+        "engine": simulation.engines.dryrun,
+        "output": "out",
+        "boundary": ("p", "p", "p"),
+        "box": (-0.001, 0.001, -0.001, 0.001, 0, 0.004),
+        "species": ({"material": organic, "radius": ("constant", 2e-4)},),
+        "dt": 1e-6,
+        "gravity": (9.81, 0, 0, -1),
+        "mesh": {
+            "wallZ": {
+                "file": mesh,
+                "mtype": "mesh/surface/stress",
+                "material": organic,
+                "args": {"scale": 1e-3},
+            }
+        },
+    }
+
+    sim = simulation.DEM(**params)
+    insert = sim.insert(species=1, value=200)
+    sim.run(1000, params["dt"])
+    sim.remove(insert)
+    sim.close()
+
+    with open(os.path.join(str(tmp_path), "out", "in.liggghts")) as fp:
+        script = fp.read().splitlines()
+
+    assert script == sim.dem.commands
+    assert script[0] == "units si"
+    assert not [cmd for cmd in script if "pygran_thermo" in cmd]  # no 'thermo' keyword
+    assert "create_box 2 domain" in script
+    assert (
+        "fix wallZ all mesh/surface/stress file {} type 2 scale 0.001 ".format(mesh)
+        in script
+    )
+    assert script[-3:-1] == ["timestep 1e-06", "run 1000"]
+    assert script[-1] == "unfix {}".format(insert)
+
+
+def _sim(**pargs):
+    return simulation.DEM(
+        engine=simulation.engines.dryrun,
+        output="out",
+        boundary=("p", "p", "p"),
+        box=(-0.001, 0.001, -0.001, 0.001, 0, 0.004),
+        species=({"material": organic, "radius": ("constant", 2e-4)},),
+        **pargs
+    )
+
+
+def test_chunks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    sim = _sim(thermo=(500, 10))
+    steps = []
+
+    sim.run(500, 1e-6, every=250, callback=lambda step, atoms: steps.append(step))
+    sim.run(100)
+    sim.close()
+
+    # the chunks are recorded as LIGGGHTS would run them, from the tracked step
+    assert sim.dem.commands[-4:] == [
+        "timestep 1e-06",
+        "run 250 start 0 stop 500 pre yes post no",
+        "run 250 start 0 stop 500 pre no post yes",
+        "run 100 start 500 stop 600 pre yes post yes",
+    ]
+    assert steps == [250, 500]
+
+    # step and dt are known, quantities of the system are not
+    step, time, dt, atoms = sim.thermo.data.T
+    assert step.tolist() == [500, 600] and dt.tolist() == [1e-6, 1e-6]
+    assert numpy.isnan(time).all() and not atoms.any()
+
+
+def test_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    sim = _sim(memory=True)
+    sim.run(100, 1e-6)
+    sim.run(200)
+    sim.close()
+
+    # reports of the Python side only
+    assert [report["step"] for report in sim.memory_reports] == [100, 300]
+    assert sim.memory_reports[-1]["rss"]["max"] > 0
+    assert sim.memory_reports[-1]["nlocal"]["total"] == 0
+    assert sim.memory_reports[-1]["neighbors"] is None
@@ -0,0 +1,48 @@
+"""Guards the cold-start cost of "import pygran_sim", which every MPI rank pays."""
+
+import json
+import os
+import subprocess
+import sys
+
+# Wall-clock budget (in seconds) for a cold "import pygran_sim"
+IMPORT_BUDGET = 0.25
+
+# Modules that must only be imported on first use
+HEAVY_MODULES = ("mpi4py", "scipy", "numpy", "pygran_sim.dem", "pygran_sim.engine")
+
+script = """
+import json, sys, time
+start = time.perf_counter()
+import pygran_sim
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _cold_import():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output([sys.executable, "-c", script], env=env)
+    return json.loads(output)
+
+
+def test_lazy_modules():
+    modules = _cold_import()["modules"]
+
+    for module in HEAVY_MODULES:
+        assert module not in modules, f"{module} imported eagerly"
+
+
+def test_import_budget():
+    # Take the best of a few runs to filter out noise from the OS page cache
+    elapsed = min(_cold_import()["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET, f"import took {elapsed:.3f}s"
+
+
+def test_lazy_attributes():
+    import pygran_sim as simulation
+
+    assert simulation.engines.liggghts == "pygran_sim.engine.liggghts.engine_liggghts"
+    assert simulation.models.SpringDashpot is simulation.SpringDashpot
+    assert simulation.DEM.__name__ == "DEM"
@@ -0,0 +1,78 @@
+"""Benchmarks chunked runs with Python callbacks against one monolithic run (needs LIGGGHTS)."""
+
+import os
+import time
+
+import pytest
+
+import pygran_sim as simulation
+from pygran_sim import tools
+
+# Allowed slowdown of a run split into chunks with a no-op callback
+CHUNK_OVERHEAD = 0.25
+
+# Max time spent per chunk (in s) on top of the steps it runs: the callback and the 'run' command
+CHUNK_COST = 2e-3
+
+organic = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientFriction": 0.5,
+    "coefficientRollingFriction": 0.0,
+    "cohesionEnergyDensity": 0.0,
+    "coefficientRestitution": 0.9,
+    "coefficientRollingViscousDamping": 0.1,
+    "yieldPress": 2.2e6,
+    "characteristicVelocity": 0.1,
+    "density": 1000.0,
+}
+
+
+def _library():
+    """Returns the LIGGGHTS library DEM would use (configured or found in well-known locations), or None"""
+    library = tools._readConfig().get("library")
+
+    if library and os.path.isfile(library):
+        return library
+
+    found = tools._findEngines("libliggghts.so")
+    return found[0] if found else None
+
+
+@pytest.mark.skipif(_library() is None, reason="needs the LIGGGHTS library")
+def test_chunks(tmp_path):
+
+    params = {
+        "boundary": ("p", "p", "f"),
+        "box": (-0.001, 0.001, -0.001, 0.001, 0, 0.004),
+        "species": ({"material": organic, "radius": ("constant", 5e-5)},),
+        "dt": 1e-6,
+        "gravity": (9.81, 0, 0, -1),
+        "output": str(tmp_path / "chunks"),
+    }
+
+    nsteps, every = 10**4, 100
+
+    with simulation.DEM(**params) as sim:
+        sim.setupWall(species=1, wtype="primitive", plane="zplane", peq=0.0)
+        sim.insert(species=1, value=1000)
+        sim.run(nsteps, params["dt"])
+
+        start = time.perf_counter()
+        sim.run(nsteps, params["dt"])
+        monolithic = time.perf_counter() - start
+
+        steps = []
+        start = time.perf_counter()
+        sim.run(
+            nsteps,
+            params["dt"],
+            every=every,
+            callback=lambda step, atoms: steps.append(step),
+        )
+        chunked = time.perf_counter() - start
+
+    assert steps == list(range(every, nsteps + 1, every))
+
+    assert (chunked - monolithic) / len(steps) <= CHUNK_COST, (chunked, monolithic)
+    assert chunked <= monolithic * (1 + CHUNK_OVERHEAD), (chunked, monolithic)
@@ -0,0 +1,39 @@
+"""Micro-benchmark of the typed LIGGGHTS prototypes: a pre-bound call must cost less than setting restype per call."""
+
+import ctypes
+import ctypes.util
+import timeit
+
+from pygran_sim.engine.liggghts.bindings import PROTOTYPES, Bindings
+
+libc = ctypes.CDLL(ctypes.util.find_library("c"))
+
+
+def test_missing_symbols():
+    api = Bindings(libc)
+
+    for name in PROTOTYPES:
+        assert getattr(api, name) is None
+
+
+def test_call_overhead():
+    # Stand-in for e.g. lammps_extract_global(lmp, b"nlocal"): a C function taking a char* and returning a pointer
+    getenv = libc.getenv
+    prebound = ctypes.CFUNCTYPE(ctypes.POINTER(ctypes.c_int), ctypes.c_char_p)(
+        ("getenv", libc)
+    )
+
+    def shared():
+        getenv.restype = ctypes.POINTER(ctypes.c_int)
+        return getenv(b"PATH")
+
+    def typed():
+        return prebound(b"PATH")
+
+    assert ctypes.addressof(shared().contents) == ctypes.addressof(typed().contents)
+
+    number = 10**5
+    shared = min(timeit.repeat(shared, number=number, repeat=5))
+    typed = min(timeit.repeat(typed, number=number, repeat=5))
+
+    assert typed < shared, (typed, shared)
@@ -0,0 +1,80 @@
+"""Tests chunked runs with Python callbacks (with stand-in bindings)."""
+
+import ctypes
+
+import numpy
+import pytest
+
+from conftest import Bindings
+
+double_p = ctypes.POINTER(ctypes.c_double)
+
+
+class AtomBindings(Bindings):
+    """Serves the timestep and positions of 2 particles"""
+
+    def __init__(self):
+        super().__init__(natoms=2)
+        self.globals["ntimestep"].value = 100
+        self.x = numpy.zeros((2, 3))
+        self.rows = (double_p * 2)(*[row.ctypes.data_as(double_p) for row in self.x])
+
+    def extract_atom_double2(self, lmp, name):
+        return ctypes.cast(self.rows, ctypes.POINTER(double_p))
+
+
+def test_chunks(liggghts):
+    lib = AtomBindings()
+    engine = liggghts(lib)
+    steps = []
+
+    def callback(step, atoms):
+        steps.append(step)
+        atoms["x"][:, 0] = step
+
+    engine.integrate(250, every=100, callback=callback)
+
+    assert steps == [100, 200, 250]
+    assert lib.commands == [
+        "run 100 start 100 stop 350 pre yes post no",
+        "run 100 start 100 stop 350 pre no post no",
+        "run 50 start 100 stop 350 pre no post yes",
+    ]
+
+    # the callback writes to LIGGGHTS' memory
+    assert numpy.array_equal(lib.x[:, 0], [250, 250])
+
+
+def test_setup(liggghts):
+    lib = AtomBindings()
+    engine = liggghts(lib)
+
+    def callback(step, atoms):
+        if step == 10:
+            engine.command("fix gravity all gravity 9.81 vector 0 0 -1")
+        return step == 30
+
+    engine.integrate(50, every=10, callback=callback)
+
+    # commands issued by the callback, or a truthy return value, trigger a setup of the next chunk
+    runs = [cmd.split(" pre ")[1] for cmd in lib.commands if cmd.startswith("run")]
+    assert runs == [
+        "yes post no",
+        "yes post no",
+        "no post no",
+        "yes post no",
+        "no post yes",
+    ]
+    assert lib.commands[1].startswith("fix gravity")
+
+
+def test_plain(liggghts):
+    lib = AtomBindings()
+    engine = liggghts(lib)
+
+    engine.integrate(100, dt=1e-6)
+    assert lib.commands == ["timestep 1e-06", "run 100"]
+
+    with pytest.raises(RuntimeError):
+        with engine.batch():
+            engine.integrate(100, every=10, callback=print)
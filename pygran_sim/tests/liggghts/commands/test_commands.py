@@ -0,0 +1,237 @@
+"""Tests batched submission of LIGGGHTS commands (with stand-in bindings)."""
+
+import os
+
+import pytest
+
+from pygran_sim.engine.liggghts.commands import CommandState
+from pygran_sim.engine.liggghts.input_liggghts import SpringDashpot
+
+material = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientRestitution": 0.9,
+    "density": 1000.0,
+}
+
+
+def _setup(engine, n):
+    for i in range(n):
+        engine.command("fix pts{} all particletemplate/sphere {}".format(i, i))
+
+
+def test_batch(liggghts):
+    engine = liggghts()
+    lib = engine.api
+
+    with engine.batch() as batch:
+        engine.command("units si")
+        _setup(engine, 3)
+        assert not lib.calls and len(batch) == 4
+
+    assert lib.calls == [
+        ["units si"]
+        + ["fix pts{} all particletemplate/sphere {}".format(i, i) for i in range(3)]
+    ]
+    assert batch.nflushed == 4
+
+    # every command is preceded by the Python call that issued it
+    lines = lib.scripts[0].splitlines()
+    assert lines[0].startswith("# test_batch (test_commands.py:")
+    assert lines[2].startswith("# _setup (test_commands.py:")
+
+    # the script is removed once run
+    assert not [fname for fname in os.listdir(engine.path) if "batch" in fname]
+
+    # without a batch, commands are submitted one at a time
+    engine.command("run 0")
+    assert lib.calls[-1] == ["run 0"] and engine.api is lib
+
+
+def test_profiled(liggghts):
+    engine = liggghts(profile=True)
+    lib = engine.api
+
+    with engine.batch():
+        _setup(engine, 2)
+        engine.command("run 0")
+
+    # the origin is the caller of the engine, not the wrapper of the profiled method
+    origins = lib.scripts[0].splitlines()[::2]
+    assert [origin.split(" (")[0] for origin in origins] == [
+        "# _setup",
+        "# _setup",
+        "# test_profiled",
+    ]
+    assert engine.profile.commands["fix"][0] == 2
+
+
+def test_initialize(liggghts):
+    # engine params as expanded by the contact model in DEM
+    pargs = SpringDashpot(
+        engine="pygran_sim.engine.liggghts.engine_liggghts",
+        species=({"material": material, "radius": ("constant", 1e-4)},),
+        box=(0, 1, 0, 1, 0, 1),
+        boundary=("p", "p", "p"),
+    ).kwargs
+    del pargs["restart"]
+
+    engine = liggghts(**pargs)
+    lib = engine.api
+
+    with engine.batch():
+        engine.initialize()
+
+    # the origin of every command is the setup method that issued it, not the caller of initialize
+    origins = [line.split(" (")[0] for line in lib.scripts[0].splitlines()[::2]]
+    assert sorted(set(origins), key=origins.index) == [
+        "# createDomain",
+        "# setupPhysics",
+        "# setupNeighbor",
+        "# setupParticles",
+        "# setupIntegrate",
+        "# setupWrite",
+    ]
+
+
+def test_queries(liggghts):
+    engine = liggghts()
+    lib = engine.api
+
+    with engine.batch():
+        engine.command("create_atoms 1 single 0 0 0")
+        engine.get_natoms()
+        assert lib.calls == [["create_atoms 1 single 0 0 0"]]
+
+        # nested batches are merged into the outer one
+        with engine.batch():
+            engine.command("run 1")
+            engine.command("run 2")
+
+        assert len(lib.calls) == 1
+
+    assert lib.calls[-1] == ["run 1", "run 2"]
+
+
+def test_errors(liggghts):
+    engine = liggghts()
+    lib = engine.api
+
+    # commands issued before an exception are still submitted, as they would be without a batch
+    with pytest.raises(ValueError):
+        with engine.batch():
+            engine.command("units si")
+            raise ValueError
+
+    assert lib.calls == [["units si"]] and engine.api is lib
+
+
+def test_state():
+    state = CommandState()
+
+    assert state.update("timestep 1e-6") == ["timestep 1e-6"]
+    assert state.update("timestep  1e-6") == []
+    assert state.update("timestep 2e-6") == ["timestep 2e-6"]
+
+    # computes and dumps must be deleted before they are re-defined
+    assert state.update("compute ke all ke") == ["compute ke all ke"]
+    assert state.update("compute ke all ke") == []
+    assert state.update("compute ke group0 ke") == [
+        "uncompute ke",
+        "compute ke group0 ke",
+    ]
+
+    dump = "dump dump all custom 1000 traj/particles*.dump id x y z"
+    assert state.update(dump) == [dump]
+    assert state.update("dump_modify dump sort id") == ["dump_modify dump sort id"]
+    assert state.update(dump) == state.update("dump_modify dump sort id") == []
+    assert state.update("undump dump") == ["undump dump"]
+    assert state.update(dump) == [dump]
+    assert state.update("dump_modify dump sort id") == ["dump_modify dump sort id"]
+
+    # a fix is replaced in place by one of the same style
+    assert state.update("fix g all gravity 9.81 vector 0 0 -1") == [
+        "fix g all gravity 9.81 vector 0 0 -1"
+    ]
+    assert state.update("fix g all gravity 9.81 vector 0 0 1") == [
+        "fix g all gravity 9.81 vector 0 0 1"
+    ]
+    assert state.update("fix g all viscous 0.1") == ["unfix g", "fix g all viscous 0.1"]
+    assert state.update("unfix g") == ["unfix g"]
+    assert state.update("fix g all viscous 0.1") == ["fix g all viscous 0.1"]
+
+    assert state.update("run 100") == state.update("run 100") == ["run 100"]
+    assert state.nskipped == 4
+
+    state.update("clear")
+    assert state.update("timestep 2e-6") == ["timestep 2e-6"]
+
+
+def test_failed(liggghts):
+    engine = liggghts()
+    lib = engine.api
+    command = lib.command
+
+    def fail(lmp, cmd):
+        raise RuntimeError(cmd)
+
+    # a command that LIGGGHTS did not run is not recorded in the state
+    lib.command = fail
+
+    with pytest.raises(RuntimeError):
+        engine.command("timestep 1e-6")
+
+    lib.command = command
+    engine.command("timestep 1e-6")
+    engine.command("timestep 1e-6")
+
+    assert lib.commands == ["timestep 1e-6"] and engine.state.nskipped == 1
+
+
+def test_failed_batch(liggghts):
+    engine = liggghts()
+    lib = engine.api
+    file = lib.file
+
+    def fail(lmp, fname):
+        raise RuntimeError(fname)
+
+    # buffered commands are recorded in the state only once the batch ran
+    lib.file = fail
+
+    with pytest.raises(RuntimeError):
+        with engine.batch():
+            engine.command("timestep 1e-6")
+            engine.command("timestep 1e-6")  # still skipped within the batch
+
+    assert not engine.state.settings and engine.state.nskipped == 0
+
+    lib.file = file
+
+    with engine.batch() as batch:
+        engine.command("timestep 1e-6")
+        engine.command("timestep 1e-6")
+        assert len(batch) == 1 and not engine.state.settings
+
+    engine.command("timestep 1e-6")
+
+    assert lib.commands == ["timestep 1e-6"] and engine.state.nskipped == 2
+
+
+def test_runs(liggghts):
+    engine = liggghts()
+    lib = engine.api
+    engine.monitorList = [("ke", "all", "ke")]
+
+    engine.integrate(100, dt=1e-6)
+    engine.integrate(100, dt=1e-6)
+    engine.integrate(100, dt=2e-6)
+
+    assert [call[0] for call in lib.calls] == [
+        "compute ke all ke",
+        "timestep 1e-06",
+        "run 100",
+        "run 100",
+        "timestep 2e-06",
+        "run 100",
+    ]
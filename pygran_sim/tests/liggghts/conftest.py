@@ -0,0 +1,119 @@
+"""Stand-in LIGGGHTS bindings, and LiggghtsAPI instances running on them, shared by the LIGGGHTS tests."""
+
+import ctypes
+import os
+
+import pytest
+from mpi4py import MPI
+
+from pygran_sim.engine.liggghts.engine_liggghts import LiggghtsAPI
+from pygran_sim.engine.liggghts.timing import TimingLog
+
+
+class Bindings:
+    """Stand-in for :class:`pygran_sim.engine.liggghts.bindings.Bindings` that records the commands LIGGGHTS
+    would run, whether submitted one by one or as a script, and serves global properties from ctypes values.
+    Tests subclass it to serve per-atom data, or to act on runs."""
+
+    def __init__(self, natoms=0):
+        self.natoms = natoms
+        self.globals = {
+            "nlocal": ctypes.c_int(natoms),
+            "nghost": ctypes.c_int(0),
+            "ntimestep": ctypes.c_int64(0),
+            "dt": ctypes.c_double(1e-6),
+        }
+        self.reset()
+
+    def reset(self):
+        """Forgets the commands run so far"""
+        self.commands = []  # every command, in order
+        self.calls = []  # commands per call into the C API
+        self.scripts = []  # content of the scripts run with lammps_file
+
+    def command(self, lmp, cmd):
+        self.commands.append(cmd.decode())
+        self.calls.append([self.commands[-1]])
+
+    def file(self, lmp, fname):
+        with open(fname) as fp:
+            self.scripts.append(fp.read())
+
+        lines = self.scripts[-1].splitlines()
+        self.calls.append([line for line in lines if not line.startswith("#")])
+        self.commands += self.calls[-1]
+
+    def extract_global_int(self, lmp, name):
+        return ctypes.pointer(self.globals[name.decode()])
+
+    extract_global_double = extract_global_bigint = extract_global_int
+
+    def get_natoms(self, lmp):
+        return self.natoms
+
+    def free(self, ptr):
+        pass
+
+    def close(self, lmp):
+        pass
+
+
+class StandInAPI(LiggghtsAPI):
+    """LiggghtsAPI running on stand-in bindings instead of the LIGGGHTS library, like the dry-run engine
+
+    :param bindings: stand-in bindings
+    :type bindings: Bindings
+    """
+
+    def __init__(self, bindings, **pargs):
+        self._bindings = bindings
+        super().__init__(**pargs)
+
+    def load_library(self, library):
+        self.api = self._bindings
+        return None
+
+    def _open(self, comm, cmdargs=[], ptr=None):
+        logfile = self._logfile(cmdargs)
+
+        self.lmp = None
+        self.opened = True
+        self._timing_log = TimingLog(logfile) if logfile else None
+
+
+@pytest.fixture
+def liggghts(tmp_path):
+    """Factory of LiggghtsAPI instances running on stand-in bindings, created through the engine's own
+    constructor with the output dir tmp_path/out, as liggghts(bindings, log=False, **pargs). The commands
+    issued by the constructor are not recorded. Unless log is True, LIGGGHTS does not write any log file.
+    """
+    engines = []
+
+    # created by DEM before the engine is instantiated (on each proc here, since tmp_path differs per proc)
+    os.makedirs(str(tmp_path / "out"), exist_ok=True)
+
+    def make(bindings=None, log=False, **pargs):
+        bindings = bindings if bindings is not None else Bindings()
+
+        params = {
+            "split": MPI.COMM_WORLD,
+            "output": str(tmp_path / "out"),
+            "species": ({"radius": ("constant", 1e-4)},),
+            "boundary": ("p", "p", "p"),
+            "traj": {"dir": "traj"},
+            "restart": None,
+            "cmdargs": [] if log else ["-log", "none"],
+            "__version__": 3.8,
+        }
+        params.update(pargs)
+
+        engine = StandInAPI(bindings, **params)
+        engines.append(engine)
+        bindings.reset()
+
+        return engine
+
+    yield make
+
+    for engine in engines:
+        engine.close()
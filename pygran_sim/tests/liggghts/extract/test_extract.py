@@ -0,0 +1,166 @@
+"""Tests NumPy extraction of LIGGGHTS per-atom data (with stand-in bindings)."""
+
+import ctypes
+
+import numpy
+import pytest
+
+from conftest import Bindings
+
+double_p = ctypes.POINTER(ctypes.c_double)
+
+
+class AtomBindings(Bindings):
+    """Serves per-atom arrays the way the LIGGGHTS C API does (double** as row pointers into one block),
+    with the typed accessors of pygran_sim.engine.liggghts.bindings. Atoms are stored in local order,
+    i.e. not sorted by ID."""
+
+    def __init__(self, nlocal, nghost=0):
+        n = nlocal + nghost
+        super().__init__(natoms=n)
+        self.globals["nlocal"].value, self.globals["nghost"].value = nlocal, nghost
+        self.atoms = {
+            b"x": numpy.arange(3.0 * n).reshape(n, 3),
+            b"v": -numpy.arange(3.0 * n).reshape(n, 3),
+            b"radius": numpy.linspace(1, 2, n),
+            b"id": numpy.arange(n, 0, -1, dtype=numpy.int32),
+            b"type": numpy.arange(n, dtype=numpy.int32) % 2 + 1,
+        }
+        self.rows = {
+            name: (double_p * n)(*[row.ctypes.data_as(double_p) for row in values])
+            for name, values in self.atoms.items()
+            if values.ndim == 2
+        }
+        self.variables = {}
+        self.scattered = None
+
+    def extract_atom_double2(self, lmp, name):
+        return ctypes.cast(self.rows[name], ctypes.POINTER(double_p))
+
+    def extract_atom_double(self, lmp, name):
+        return self.atoms[name].ctypes.data_as(double_p)
+
+    def extract_atom_int(self, lmp, name):
+        return self.atoms[name].ctypes.data_as(ctypes.POINTER(ctypes.c_int))
+
+    def extract_variable(self, lmp, name, group):
+        return self.variables[name.decode()].ctypes.data_as(double_p)
+
+    def gather_atoms(self, lmp, name, type, count, data):
+        # ordered by atom ID
+        values = self.atoms[name][numpy.argsort(self.atoms[b"id"])]
+        ctypes.memmove(data, values.ctypes.data, values.nbytes)
+
+    def scatter_atoms(self, lmp, name, type, count, data):
+        self.scattered = numpy.ctypeslib.as_array(
+            ctypes.cast(data, double_p), shape=(len(self.atoms[b"id"]), count)
+        ).copy()
+
+
+def test_views(liggghts):
+    lib = AtomBindings(nlocal=4, nghost=2)
+    engine = liggghts(lib)
+
+    x = engine.extract_atom_array("x")
+    assert x.shape == (4, 3)
+    assert numpy.array_equal(x, lib.atoms[b"x"][:4])
+
+    # No copy: writes go to the engine's memory
+    x[1, 2] = -1
+    assert lib.atoms[b"x"][1, 2] == -1
+
+    assert engine.extract_atom_array("x", ghost=True).shape == (6, 3)
+    assert numpy.array_equal(
+        engine.extract_atom_array("radius"), lib.atoms[b"radius"][:4]
+    )
+    assert engine.extract_atom_array("id").dtype == numpy.int32
+
+
+def test_empty(liggghts):
+    engine = liggghts(AtomBindings(nlocal=0))
+
+    assert engine.extract_atom_array("v").shape == (0, 3)
+    assert engine.extract_atom_array("type").shape == (0,)
+
+
+def test_gather_scatter(liggghts):
+    lib = AtomBindings(nlocal=5)
+    engine = liggghts(lib)
+    ordered = lib.atoms[b"x"][::-1]
+
+    x = engine.gather_atoms_array("x", 1, 3)
+    assert numpy.array_equal(x, ordered)
+
+    # The pooled buffer is reused, unless an out array is supplied
+    assert numpy.shares_memory(engine.gather_atoms_array("x", 1, 3), x)
+
+    out = numpy.zeros((5, 3))
+    assert engine.gather_atoms_array("x", 1, 3, out=out) is out
+    assert numpy.array_equal(out, ordered)
+
+    ids = engine.gather_atoms_array("id", 0, 1)
+    assert ids.dtype == numpy.int32 and numpy.array_equal(ids, numpy.arange(1, 6))
+
+    engine.scatter_atoms_array("x", 1, 3, 2 * x)
+    assert numpy.array_equal(lib.scattered, 2 * ordered)
+
+    with pytest.raises(ValueError):
+        engine.gather_atoms_array("x", 1, 3, out=numpy.zeros((4, 3)))
+
+    with pytest.raises(ValueError):
+        engine.scatter_atoms_array("x", 1, 3, numpy.zeros(3))
+
+
+def test_extract(liggghts):
+    lib = AtomBindings(nlocal=6)
+    engine = liggghts(lib)
+
+    x, v = lib.atoms[b"x"], lib.atoms[b"v"]
+
+    coords = engine.extractCoords()
+    assert numpy.array_equal(coords, x[::-1])
+    assert not numpy.shares_memory(coords, engine.extractCoords())
+
+    # local atoms 1, 3, 5 (IDs 5, 3, 1) are of type 2
+    assert numpy.array_equal(engine.extractVelocities(species=2), v[[5, 3, 1]])
+
+    lib.variables["pygran_select"] = numpy.array([1.0, 1, 0, 0, 1, 0])
+    assert numpy.array_equal(engine.extractCoords(group="group0"), x[[4, 1, 0]])
+    assert numpy.array_equal(engine.extractCoords(group="group0", species=1), x[[4, 0]])
+    assert lib.commands[-1] == "variable pygran_select delete"
+
+
+def test_variables(liggghts):
+    lib = AtomBindings(nlocal=4)
+    engine = liggghts(lib)
+
+    lib.variables["a"] = numpy.arange(4.0)
+    lib.variables["b"] = numpy.ones(4)
+
+    assert numpy.array_equal(engine.extract_variable("a", "all", 1), lib.variables["a"])
+
+    a, b = engine.extract_variables(["a", "b"])
+    assert numpy.array_equal(a, lib.variables["a"])
+    assert numpy.array_equal(b, lib.variables["b"])
+
+    out = numpy.empty((2, 4))
+    assert engine.extract_variables(["b", "a"], out=out) is out
+    assert numpy.array_equal(out[1], lib.variables["a"])
+
+    with pytest.raises(ValueError):
+        engine.extract_variables(["a"], out=out)
+
+
+def test_local(liggghts):
+    lib = AtomBindings(nlocal=6, nghost=2)
+    engine = liggghts(lib)
+
+    ids, x = engine.extract_local("x")
+    assert numpy.array_equal(ids, lib.atoms[b"id"][:6])
+    assert numpy.array_equal(x, lib.atoms[b"x"][:6])
+    assert not numpy.shares_memory(x, lib.atoms[b"x"])
+
+    lib.variables["pygran_select"] = numpy.array([1.0, 1, 0, 0, 1, 0])
+    ids, radius = engine.extract_local("radius", group="group0", species=1)
+    assert numpy.array_equal(ids, [8, 4])
+    assert numpy.array_equal(radius, lib.atoms[b"radius"][[0, 4]])
@@ -0,0 +1,139 @@
+"""Tests the memory report of LIGGGHTS simulations (with stand-in bindings)."""
+
+import logging
+
+from mpi4py import MPI
+
+from conftest import Bindings
+from pygran_sim.engine.liggghts import memory
+from pygran_sim.engine.liggghts.timing import parse_timing
+
+# Setup and summary of a run as printed by LIGGGHTS 3.x
+RUN = """Memory usage per processor = 12.5 Mbytes
+Step Atoms KinEng
+       0      200            0
+Loop time of {loop} on 1 procs for {steps} steps with 200 atoms
+
+Pair  time (%) = 0.5 (50)
+Other time (%) = 0.5 (50)
+
+Nlocal:    200 ave 200 max 200 min
+Histogram: 1 0 0 0 0 0 0 0 0 0
+Nghost:    150 ave 150 max 150 min
+Histogram: 1 0 0 0 0 0 0 0 0 0
+Neighs:    1200 ave 1200 max 1200 min
+Histogram: 1 0 0 0 0 0 0 0 0 0
+
+Total # of neighbors = 1200
+Ave neighs/atom = 6
+Neighbor list builds = 3
+Dangerous builds = 0
+"""
+
+
+def test_parse():
+    summary = parse_timing(RUN.format(loop=1.0, steps=1000))
+
+    assert summary["counts"]["Nghost"] == {"min": 150, "avg": 150, "max": 150}
+    assert summary["neighbors"] == 1200 and summary["neighbor_builds"] == 3
+    assert summary["memory"] == 12.5
+
+    # recent LAMMPS versions
+    text = "Per MPI rank memory allocation (min/avg/max) = 4.015 | 4.1 | 4.2 Mbytes\n"
+    text += RUN.split("\n", 1)[1].format(loop=1.0, steps=10)
+    assert parse_timing(text)["memory"] == 4.2
+
+
+def test_summarize():
+    assert memory.rss() > 0
+
+    ranks = [
+        {"rss": 100, "buffers": 0, "nlocal": 10, "nghost": 5},
+        {"rss": 300, "buffers": 8, "nlocal": 30, "nghost": None},
+    ]
+    report = memory.summarize(ranks)
+
+    assert report["rss"] == {
+        "min": 100,
+        "avg": 200,
+        "max": 300,
+        "total": 400,
+        "argmax": 1,
+    }
+    assert report["nlocal"]["total"] == 40
+    assert report["nghost"] is None and report["neighbors"] is None
+
+
+class LogBindings(Bindings):
+    """Advances the timestep and appends a run summary to the log on every run"""
+
+    def __init__(self, log):
+        super().__init__(natoms=200)
+        self.globals["nghost"].value = 150
+        self.log = log
+
+    def command(self, lmp, cmd):
+        super().command(lmp, cmd)
+
+        if cmd.startswith(b"run"):
+            steps = int(cmd.split()[1])
+            self.globals["ntimestep"].value += steps
+
+            with open(self.log, "a") as fp:
+                fp.write(RUN.format(loop=steps * 1e-3, steps=steps))
+
+
+def _engine(tmp_path, liggghts, **pargs):
+    lib = LogBindings(str(tmp_path / "out" / "log.liggghts"))
+    return liggghts(lib, log=True, **pargs)
+
+
+def test_report(tmp_path, liggghts, caplog):
+    engine = _engine(tmp_path, liggghts)
+    engine.buffers.get("x", (100, 3), float)
+
+    report = engine.memory_report()
+    nprocs = MPI.COMM_WORLD.Get_size()
+
+    assert len(report["ranks"]) == nprocs and report["step"] == 0
+    assert report["nghost"]["total"] == 150 * nprocs
+    assert report["buffers"]["max"] == 100 * 3 * 8
+    assert report["rss"]["min"] > 0
+    assert report["neighbors"] is None  # no run yet
+
+    # no report after runs unless requested
+    engine.integrate(100)
+    assert not engine.memory_reports
+
+    with caplog.at_level(logging.WARNING, logger="pygran_sim"):
+        report = engine.memory_report(warn=1)
+
+    assert report["neighbors"] == 1200 and report["liggghts_memory"] == 12.5
+    assert any("exceeds" in record.message for record in caplog.records) == (
+        not MPI.COMM_WORLD.Get_rank()
+    )
+
+
+def test_history(tmp_path, liggghts, caplog):
+    engine = _engine(tmp_path, liggghts, memory=2**50)
+
+    with caplog.at_level(logging.WARNING, logger="pygran_sim"):
+        engine.integrate(100)
+        engine.integrate(200)
+
+    assert [report["step"] for report in engine.memory_reports] == [100, 300]
+    assert engine.memory_reports[-1]["neighs"]["avg"] == 1200
+    assert not caplog.records  # below the threshold
+
+
+def test_threshold(tmp_path, liggghts, caplog):
+    # a threshold of 0 is not read as 'off'
+    engine = _engine(tmp_path, liggghts, memory=0)
+
+    with caplog.at_level(logging.WARNING, logger="pygran_sim"):
+        engine.integrate(100)
+
+    assert len(engine.memory_reports) == 1
+    assert any("exceeds" in record.message for record in caplog.records) == (
+        not MPI.COMM_WORLD.Get_rank()
+    )
@@ -0,0 +1,49 @@
+"""Tests incremental reading of the files written by LIGGGHTS ave/time fixes."""
+
+import numpy
+
+from pygran_sim.engine.liggghts.monitor import MonitorReader
+
+HEADER = "# Time-averaged data for fix myke\n# TimeStep c_ke\n"
+
+
+def test_read(tmp_path):
+    fname = tmp_path / "ke.dat"
+    reader = MonitorReader(str(fname), growth=2)
+
+    # nothing written yet
+    assert reader.read() == 0 and reader.data.shape == (0, 0)
+
+    fname.write_text(HEADER + "1 0.5\n2 0.25\n3 0.1")
+    assert reader.read() == 2
+    assert numpy.array_equal(reader.data, [[1, 0.5], [2, 0.25]])
+
+    # the partial row is read once complete, along with new rows only
+    with open(fname, "a") as fp:
+        fp.write("25\n4 0.05\n")
+
+    offset = reader.offset
+    assert reader.read() == 2 and reader.offset == fname.stat().st_size > offset
+    assert numpy.array_equal(reader[:, 0], [1, 2, 3, 4])
+    assert reader[2, 1] == 0.125
+
+    assert reader.read() == 0 and len(reader) == 4
+
+
+def test_growth(tmp_path):
+    fname = tmp_path / "ke.dat"
+    reader = MonitorReader(str(fname))
+    fname.write_text(HEADER)
+
+    expected = []
+
+    for run in range(50):
+        rows = numpy.column_stack([numpy.arange(10) + 10 * run, numpy.random.rand(10)])
+        expected.append(rows)
+
+        with open(fname, "a") as fp:
+            numpy.savetxt(fp, rows, fmt="%.17g")
+
+        assert reader.read() == 10
+
+    assert numpy.array_equal(numpy.asarray(reader), numpy.concatenate(expected))
@@ -0,0 +1,71 @@
+"""Reuses idle LIGGGHTS instances across consecutive simulations (with a stand-in library)."""
+
+from mpi4py import MPI
+
+from pygran_sim.engine.liggghts.pool import EnginePool
+
+
+class Library:
+    """Records the calls made to the LIGGGHTS C API"""
+
+    def __init__(self):
+        self.calls = []
+
+    def lammps_command(self, lmp, cmd):
+        self.calls.append(("command", lmp, cmd))
+
+    def lammps_close(self, lmp):
+        self.calls.append(("close", lmp))
+
+
+def test_reuse():
+    pool, lib = EnginePool(), Library()
+
+    assert pool.acquire("liblmp.so", MPI.COMM_WORLD) is None
+
+    instance = pool.track(lib, "lmp0", "liblmp.so", MPI.COMM_WORLD, ["-echo", "none"])
+    pool.release(instance)
+
+    assert lib.calls == [("command", "lmp0", b"clear")]
+    assert len(pool) == 1
+
+    # No match for a different library or different cmdargs
+    assert pool.acquire("other.so", MPI.COMM_WORLD, ("-echo", "none")) is None
+    assert pool.acquire("liblmp.so", MPI.COMM_WORLD) is None
+
+    # A congruent communicator (e.g. from a new split) matches
+    comm = MPI.COMM_WORLD.Dup()
+    assert pool.acquire("liblmp.so", comm, ("-echo", "none")) is instance
+    assert len(pool) == 0
+    comm.Free()
+
+
+def test_drain():
+    pool, lib = EnginePool(), Library()
+
+    pool.release(pool.track(lib, "lmp0", "liblmp.so", MPI.COMM_WORLD))
+    pool.release(pool.track(lib, "lmp1", "liblmp.so", MPI.COMM_WORLD))
+    pool.drain()
+
+    assert not len(pool)
+    assert {call for call in lib.calls if call[0] == "close"} == {
+        ("close", "lmp0"),
+        ("close", "lmp1"),
+    }
+
+
+def test_rebuilt(tmp_path):
+    pool, lib = EnginePool(), Library()
+    library = str(tmp_path / "liblmp.so")
+
+    with open(library, "w") as fp:
+        fp.write("build 1")
+
+    pool.release(pool.track(lib, "lmp0", library, MPI.COMM_WORLD))
+
+    # an instance of a library rebuilt in place is not handed out
+    with open(library, "w") as fp:
+        fp.write("build 22")
+
+    assert pool.acquire(library, MPI.COMM_WORLD) is None
+    assert len(pool) == 1
@@ -0,0 +1,83 @@
+"""Tests the in-memory thermo recorder and its sampling during runs (with stand-in bindings)."""
+
+import ctypes
+
+import numpy
+
+from conftest import Bindings
+from pygran_sim.engine.liggghts.thermo import ThermoRecorder
+
+
+class RunBindings(Bindings):
+    """Advances the timestep on 'run N ...' commands, and evaluates equal-style variables as a
+    function of the step"""
+
+    def __init__(self):
+        super().__init__(natoms=100)
+        self.ntimestep = self.globals["ntimestep"]
+        self.ke = ctypes.c_double(0.5)
+        self._values = []
+
+    def command(self, lmp, cmd):
+        super().command(lmp, cmd)
+
+        if cmd.startswith(b"run"):
+            self.ntimestep.value += int(cmd.split()[1])
+
+    def extract_compute_double(self, lmp, id, style, type):
+        return ctypes.pointer(self.ke)
+
+    def extract_variable(self, lmp, name, group):
+        dt = self.globals["dt"].value
+        self._values.append(ctypes.c_double(self.ntimestep.value * dt))
+        return ctypes.pointer(self._values[-1])
+
+
+def test_recorder(liggghts):
+    lib = RunBindings()
+    engine = liggghts(lib)
+
+    thermo = ThermoRecorder(engine, ["time", "dt", "atoms", "c_ke"], capacity=3)
+    assert thermo.keys() == ("step", "time", "dt", "atoms", "c_ke")
+    assert lib.commands == ["variable pygran_thermo_time equal time"]
+    assert len(thermo) == 0 and thermo.latest() == {}
+
+    for step in range(1, 6):
+        lib.ntimestep.value = 10 * step
+        thermo.sample()
+
+    # the oldest samples are overwritten
+    assert len(thermo) == 3 and thermo.nsamples == 5
+    assert numpy.array_equal(thermo["step"], [30, 40, 50])
+    assert numpy.allclose(thermo["time"], [30e-6, 40e-6, 50e-6])
+    assert numpy.array_equal(thermo["atoms"], [100] * 3)
+    assert thermo.latest() == {
+        "step": 50,
+        "time": thermo["time"][-1],
+        "dt": 1e-6,
+        "atoms": 100,
+        "c_ke": 0.5,
+    }
+
+    thermo.clear()
+    assert thermo.data.shape == (0, 5)
+
+
+def test_runs(liggghts):
+    lib = RunBindings()
+    engine = liggghts(lib)
+    engine.thermo = ThermoRecorder(engine, ["atoms"], every=30)
+    steps = []
+
+    engine.integrate(100, callback=lambda step, atoms: steps.append(step), every=20)
+
+    # chunks of gcd(20, 30) steps
+    runs = [cmd for cmd in lib.commands if cmd.startswith("run")]
+    assert len(runs) == 10 and runs[0] == "run 10 start 0 stop 100 pre yes post no"
+
+    assert steps == [20, 40, 60, 80, 100]
+    assert numpy.array_equal(engine.thermo["step"], [30, 60, 90, 100])
+
+    # sampling alone chunks the run too
+    engine.integrate(60)
+    assert numpy.array_equal(engine.thermo["step"][-2:], [130, 160])
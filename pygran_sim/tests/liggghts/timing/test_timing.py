@@ -0,0 +1,144 @@
+"""Tests the timing breakdown of LIGGGHTS runs parsed from its log (with stand-in bindings)."""
+
+import pytest
+
+from conftest import Bindings
+from pygran_sim.engine.liggghts.timing import parse_timing
+
+# Summary of a run as printed by LIGGGHTS 3.x
+AVERAGES = """Loop time of {loop} on 1 procs for {steps} steps with 200 atoms, finish time Sat Oct 17 10:00:00 2026
+LIGGGHTS (Version LIGGGHTS-PUBLIC 3.8.0)
+
+Pair  time (%) = 0.5 (50)
+Neigh time (%) = 0.2 (20)
+Comm  time (%) = 0.05 (5)
+Outpt time (%) = 0.15 (15)
+Modfy time (%) = 0.08 (8)
+Other time (%) = 0.02 (2)
+
+Nlocal:    200 ave 200 max 200 min
+Histogram: 1 0 0 0 0 0 0 0 0 0
+"""
+
+# Summary of a run as printed by recent LAMMPS versions
+TABLE = """Loop time of 2.81192 on 4 procs for 300 steps with 2004 atoms
+
+Performance: 106.689 timesteps/s
+93.6% CPU use with 4 MPI tasks x no OpenMP threads
+
+MPI task timing breakdown:
+Section |  min time  |  avg time  |  max time  |%varavg| %total
+---------------------------------------------------------------
+Pair    | 1.7979     | 1.8201     | 1.8374     |   1.1 | 64.73
+Neigh   | 0.21289    | 0.21616    | 0.2205     |   0.6 |  7.69
+Comm    | 0.1105     | 0.12986    | 0.14834    |   3.9 |  4.62
+Output  | 0.00025487 | 0.0002641  | 0.00028396 |   0.0 |  0.01
+Modify  | 0.61993    | 0.62364    | 0.62639    |   0.3 | 22.18
+Other   |            | 0.02198    |            |       |  0.78
+"""
+
+
+def test_parse():
+    assert parse_timing("Setting up run ...\n") is None
+
+    timing = parse_timing(AVERAGES.format(loop=1.0, steps=1000))
+    assert (
+        timing["loop_time"],
+        timing["nprocs"],
+        timing["steps"],
+        timing["natoms"],
+    ) == (
+        1.0,
+        1,
+        1000,
+        200,
+    )
+    assert list(timing["sections"]) == [
+        "Pair",
+        "Neigh",
+        "Comm",
+        "Output",
+        "Modify",
+        "Other",
+    ]
+    assert timing["sections"]["Output"] == {
+        "min": None,
+        "avg": 0.15,
+        "max": None,
+        "percent": 15.0,
+    }
+
+    timing = parse_timing(TABLE)
+    assert timing["nprocs"] == 4 and timing["natoms"] == 2004
+    assert timing["sections"]["Pair"] == {
+        "min": 1.7979,
+        "avg": 1.8201,
+        "max": 1.8374,
+        "percent": 64.73,
+    }
+    assert timing["sections"]["Other"]["min"] is None
+
+    # loop times add up across runs (e.g. chunks), sections are those of the last run
+    text = AVERAGES.format(loop=1.0, steps=10) + TABLE
+    timing = parse_timing(text)
+    assert timing["steps"] == 310 and timing["loop_time"] == pytest.approx(3.81192)
+    assert timing["nprocs"] == 4 and timing["sections"]["Pair"]["avg"] == 1.8201
+
+
+class LogBindings(Bindings):
+    """Appends a run summary to the log on every run"""
+
+    def __init__(self, log):
+        super().__init__(natoms=200)
+        self.log = log
+
+    def command(self, lmp, cmd):
+        super().command(lmp, cmd)
+
+        if cmd.startswith(b"run"):
+            steps = int(cmd.split()[1])
+
+            with open(self.log, "a") as fp:
+                fp.write(AVERAGES.format(loop=steps * 1e-3, steps=steps))
+
+
+def test_history(tmp_path, liggghts):
+    log = str(tmp_path / "out" / "log.liggghts")
+    lib = LogBindings(log)
+    engine = liggghts(lib, log=True, timing=True)
+
+    engine.integrate(1000)
+    engine.integrate(500)
+
+    assert len(engine.timings) == 2
+    assert lib.commands[1] == "log {} append".format(log)
+
+    record = engine.timings[-1]
+    assert record["steps"] == record["loop_steps"] == 500
+    assert record["loop_time"] == 0.5 and record["natoms"] == 200
+    assert record["sections"]["Pair"]["avg"] == 0.5
+    assert record["wall"]["min"] <= record["wall"]["avg"] <= record["wall"]["max"]
+    assert record["imbalance"] >= 1
+    assert record["particle_steps_per_s"] == pytest.approx(200 * record["steps_per_s"])
+
+
+def test_off(tmp_path, liggghts):
+    lib = LogBindings(str(tmp_path / "out" / "log.liggghts"))
+    engine = liggghts(lib, log=True)
+
+    engine.integrate(1000)
+
+    # no timing unless requested, nor any command besides the run
+    assert not engine.timings
+    assert lib.commands == ["run 1000"]
+
+
+def test_chunks(tmp_path, liggghts):
+    lib = LogBindings(str(tmp_path / "out" / "log.liggghts"))
+    engine = liggghts(lib, log=True, timing=True)
+
+    engine.integrate(1000, every=250, callback=lambda step, atoms: None)
+
+    record = engine.timings[-1]
+    assert record["steps"] == record["loop_steps"] == 1000
+    assert record["loop_time"] == pytest.approx(1.0)
@@ -0,0 +1,95 @@
+"""Tests runs on a worker thread and the guard against concurrent engine calls (with stand-in bindings)."""
+
+import threading
+
+import pytest
+
+from conftest import Bindings
+
+
+class BlockingBindings(Bindings):
+    """Blocks 'run' commands until released, to keep a run in flight"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def command(self, lmp, cmd):
+        if cmd.startswith(b"run"):
+            self.started.set()
+            self.release.wait(timeout=10)
+
+            if cmd == b"run -1":
+                raise ValueError(cmd)
+
+        super().command(lmp, cmd)
+
+
+def _engine(liggghts, lib):
+    engine = liggghts(lib, dt=1e-6)
+    engine.setupIntegrate = lambda itype=None: ["nve"]
+    return engine
+
+
+def test_future(liggghts):
+    lib = BlockingBindings()
+    engine = _engine(liggghts, lib)
+
+    future = engine.run_async(100)
+    assert lib.started.wait(timeout=10)
+    assert not future.done() and engine.worker.busy
+
+    # calls into the engine from this thread are rejected while the run is in flight
+    with pytest.raises(RuntimeError):
+        engine.get_natoms()
+
+    with pytest.raises(RuntimeError):
+        engine.command("run 1")
+
+    with pytest.raises(RuntimeError):
+        engine.run_async(100)
+
+    lib.release.set()
+    assert future.result(timeout=10) == ["nve"]
+    assert lib.commands == ["timestep 1e-06", "run 100"]
+
+    # the engine is usable as soon as the future is done
+    assert engine.get_natoms() == 0 and engine.api is lib
+    engine.worker.shutdown()
+
+
+def test_errors(liggghts):
+    lib = BlockingBindings()
+    lib.release.set()
+    engine = _engine(liggghts, lib)
+
+    future = engine.run_async(-1)
+
+    with pytest.raises(ValueError):
+        future.result(timeout=10)
+
+    assert engine.api is lib
+    assert engine.run_async(10).result(timeout=10) == ["nve"]
+    engine.worker.shutdown()
+
+
+def test_rejected(liggghts):
+    lib = BlockingBindings()
+    engine = _engine(liggghts, lib)
+    gravity = "fix grav all gravity 9.81 vector 0 0 -1"
+
+    future = engine.run_async(100)
+    assert lib.started.wait(timeout=10)
+
+    # a command rejected while busy is not recorded as applied ...
+    with pytest.raises(RuntimeError):
+        engine.command(gravity)
+
+    lib.release.set()
+    future.result(timeout=10)
+
+    # ... so it is issued once re-issued after the run
+    engine.command(gravity)
+    assert lib.commands == ["timestep 1e-06", "run 100", gravity]
+    assert engine.state.nskipped == 0
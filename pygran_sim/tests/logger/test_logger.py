@@ -0,0 +1,77 @@
+"""Tests the queued, per-rank log sinks of DEM objects."""
+
+import logging
+import os
+
+import pytest
+
+import pygran_sim as simulation
+from pygran_sim.logger import closeLogger, getLogger
+
+material = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientRestitution": 0.9,
+    "density": 1000.0,
+}
+
+
+def test_sinks(tmp_path):
+    output = str(tmp_path)
+
+    root = getLogger(output, rank=0)
+    other = getLogger(output, rank=1)
+    rank = getLogger(output, rank=3, sink="rank", level="DEBUG")
+    off = getLogger(output, rank=0, sink=None)
+
+    root.info("info %s", "record")
+    root.debug("debug %s", "record")  # below the default verbosity
+    other.info("not written")
+    rank.debug("debug record")
+    off.info("not written")
+
+    assert not other.isEnabledFor(logging.CRITICAL)
+    assert not off.isEnabledFor(logging.CRITICAL)
+
+    for logger in (root, other, rank, off):
+        closeLogger(logger)
+        closeLogger(logger)
+
+    assert sorted(os.listdir(output)) == ["pygran.3.log", "pygran.log"]
+
+    with open(os.path.join(output, "pygran.log")) as fp:
+        log = fp.read()
+
+    assert "INFO: info record" in log and "debug" not in log
+
+    with open(os.path.join(output, "pygran.3.log")) as fp:
+        assert "DEBUG: debug record" in fp.read()
+
+
+def test_level(tmp_path):
+    with pytest.raises(
+        ValueError, match="'verbose': use one of DEBUG, INFO, WARNING, ERROR, CRITICAL"
+    ):
+        getLogger(str(tmp_path), level="verbose")
+
+    logger = getLogger(str(tmp_path), level="warning")
+    assert logger.level == logging.WARNING
+    closeLogger(logger)
+
+
+def test_dem_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with simulation.DEM(
+        engine="pygran_sim.engine.simple.engine_simple",
+        species=({"material": material, "radius": 1e-4},),
+        box=(0, 1, 0, 1, 0, 1),
+        output="out",
+        log_level="DEBUG",
+    ) as sim:
+        assert "log" not in sim.pargs
+
+    with open(os.path.join(str(tmp_path), "out", "pygran.log")) as fp:
+        log = fp.read()
+
+    assert "Initializing simulation with PyGranSim version" in log
@@ -0,0 +1,61 @@
+"""Tests reductions over particles distributed across MPI procs (run with or without mpirun)."""
+
+import numpy
+from mpi4py import MPI
+
+from pygran_sim import parallel
+
+comm = MPI.COMM_WORLD
+
+
+def _local(nprocs, rank, n=10):
+    """Splits n particles into contiguous chunks over all procs but the last, which owns none"""
+    values = numpy.arange(n, dtype=numpy.float64)
+
+    if nprocs == 1:
+        return values
+
+    chunks = numpy.array_split(values, nprocs - 1) + [values[:0]]
+    return chunks[rank]
+
+
+def test_reductions():
+    values = _local(comm.size, comm.rank)
+    vectors = numpy.stack([values, -values, 2 * values], axis=1)
+
+    assert parallel.count(values, comm) == 10
+    assert parallel.reduce_sum(values, comm) == 45
+    assert parallel.reduce_mean(values, comm) == 4.5
+    assert parallel.reduce_min(values, comm) == 0
+    assert parallel.reduce_max(values, comm) == 9
+
+    assert numpy.array_equal(parallel.reduce_sum(vectors, comm), [45, -45, 90])
+    assert numpy.array_equal(parallel.reduce_min(vectors, comm), [0, -9, 0])
+    assert numpy.array_equal(parallel.reduce_max(vectors, comm), [9, 0, 18])
+
+    ids = values.astype(numpy.int32)
+    assert parallel.reduce_max(ids, comm) == 9
+
+
+def test_histogram():
+    values = _local(comm.size, comm.rank)
+
+    hist, edges = parallel.histogram(values, bins=3, comm=comm)
+    expected = numpy.histogram(numpy.arange(10.0), bins=3)
+
+    assert numpy.array_equal(hist, expected[0])
+    assert numpy.allclose(edges, expected[1])
+
+    hist, _ = parallel.histogram(values, bins=[0, 5, 10], weights=values, comm=comm)
+    assert numpy.array_equal(hist, [10, 35])
+
+
+def test_empty():
+    values = numpy.empty((0, 3))
+
+    assert parallel.count(values, comm) == 0
+    assert numpy.isnan(parallel.reduce_mean(values, comm)).all()
+    assert numpy.array_equal(parallel.reduce_min(values, comm), [numpy.inf] * 3)
+
+    hist, _ = parallel.histogram(values[:, 0], bins=4, comm=comm)
+    assert hist.sum() == 0
@@ -0,0 +1,77 @@
+"""Tests the opt-in profiling of engine calls, with the dry-run engine."""
+
+import json
+import os
+
+import pygran_sim as simulation
+from pygran_sim.profiling import CallProfile
+
+organic = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientFriction": 0.5,
+    "coefficientRollingFriction": 0.0,
+    "cohesionEnergyDensity": 0.0,
+    "coefficientRestitution": 0.9,
+    "coefficientRollingViscousDamping": 0.1,
+    "yieldPress": 2.2e6,
+    "characteristicVelocity": 0.1,
+    "density": 1000.0,
+}
+
+
+def _params(output, **kwargs):
+    return dict(
+        engine=simulation.engines.dryrun,
+        output=output,
+        boundary=("p", "p", "p"),
+        box=(-0.001, 0.001, -0.001, 0.001, 0, 0.004),
+        species=({"material": organic, "radius": ("constant", 2e-4)},),
+        dt=1e-6,
+        **kwargs,
+    )
+
+
+def test_profile(tmp_path):
+    output = str(tmp_path / "out")
+
+    with simulation.DEM(**_params(output, profile=True)) as sim:
+        sim.insert(species=1, value=200)
+        sim.run(1000)
+        sim.run(1000)
+
+        profile = sim.profile
+        assert isinstance(profile, CallProfile)
+
+    methods, commands = profile.methods, profile.commands
+
+    # calls, total and max latency per method and per command verb
+    assert methods["run"][0] == 2
+    assert methods["insert"][0] == 1 and methods["setupWrite"][0] == 1
+    assert methods["command"][0] == sum(calls for calls, _, _ in commands.values())
+    assert commands["run"][0] == 2
+    assert commands["fix"][0] > 0
+    assert all(
+        calls > 0 and total >= tmax >= 0 for calls, total, tmax in methods.values()
+    )
+
+    with open(os.path.join(output, "profile.json")) as fp:
+        exported = json.load(fp)
+
+    assert exported["commands"]["run"] == {
+        "calls": 2,
+        "total": commands["run"][1],
+        "max": commands["run"][2],
+    }
+    assert "setupWrite" in repr(profile)
+
+
+def test_disabled(tmp_path):
+    output = str(tmp_path / "out")
+
+    with simulation.DEM(**_params(output)) as sim:
+        # methods are not wrapped: the engine's own methods are called
+        assert sim.profile is None
+        assert "command" not in vars(sim.dem)
+
+    assert not os.path.exists(os.path.join(output, "profile.json"))
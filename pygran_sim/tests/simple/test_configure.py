@@ -0,0 +1,65 @@
+"""Tests that a configuration failure on the root proc aborts every proc of a DEM run the same way."""
+
+import types
+
+import pytest
+
+import pygran_sim as simulation
+from pygran_sim import dem
+
+material = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientRestitution": 0.9,
+    "density": 1000.0,
+}
+
+
+class Comm:
+    """Stand-in for COMM_WORLD as seen by one proc: bcast returns what the root sent"""
+
+    def __init__(self, rank, sent=None):
+        self.rank, self.sent = rank, sent
+
+    def Get_rank(self):
+        return self.rank
+
+    def Get_size(self):
+        return 2
+
+    def bcast(self, obj, root=0):
+        if self.rank == root:
+            self.sent = obj
+
+        return self.sent
+
+
+def _configure(self, library=None):
+    raise FileNotFoundError("libliggghts.so not found")
+
+
+def _error(monkeypatch, comm):
+    """Message of the error raised by DEM on the proc that sees `comm`"""
+    monkeypatch.setattr(dem, "MPI", types.SimpleNamespace(COMM_WORLD=comm))
+
+    with pytest.raises(RuntimeError) as err:
+        simulation.DEM(
+            engine="pygran_sim.engine.simple.engine_simple",
+            species=({"material": material, "radius": 1e-4},),
+            box=(0, 1, 0, 1, 0, 1),
+        )
+
+    return str(err.value)
+
+
+def test_root_failure(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(dem.DEM, "_configure", _configure)
+
+    root = Comm(rank=0)
+    error = _error(monkeypatch, root)
+    assert "rank 0" in error and "FileNotFoundError" in error
+
+    # the other procs never configure: they raise the error broadcast by the root, instead of hanging
+    monkeypatch.setattr(dem.DEM, "_configure", None)
+    assert _error(monkeypatch, Comm(rank=1, sent=root.sent)) == error
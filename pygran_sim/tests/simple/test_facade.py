@@ -0,0 +1,63 @@
+"""Tests the DEM facade: calls through DEM must reach the engine's own methods, without any indirection."""
+
+import pytest
+
+import pygran_sim as simulation
+
+material = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientRestitution": 0.9,
+    "density": 1000.0,
+}
+
+
+@pytest.fixture
+def dem(tmp_path, monkeypatch):
+    """Factory of DEM instances run in tmp_path, closed on teardown"""
+    monkeypatch.chdir(tmp_path)
+    sims = []
+
+    def make(**pargs):
+        sims.append(simulation.DEM(**pargs))
+        return sims[-1]
+
+    yield make
+
+    for sim in sims:
+        sim.close()
+
+
+def test_facade_binding(dem):
+    sim = dem(
+        engine="pygran_sim.engine.simple.engine_simple",
+        species=({"material": material, "radius": 1e-4},),
+        box=(0, 1, 0, 1, 0, 1),
+    )
+
+    # pass-through methods are the engine's own bound methods
+    assert sim.setupPrint == sim.dem.setupPrint
+    assert sim.resume == sim.dem.resume
+
+
+def test_facade_direct(dem, monkeypatch):
+    # LiggghtsAPI without the library: the dry-run engine records commands instead
+    sim = dem(
+        engine=simulation.engines.dryrun,
+        species=({"material": material, "radius": ("constant", 1e-4)},),
+        box=(0, 1, 0, 1, 0, 1),
+        boundary=("p", "p", "p"),
+        output="out",
+    )
+    engine = sim.dem
+
+    # a call through DEM is a call to LiggghtsAPI.command on this proc's engine
+    assert sim.command.__func__ is type(engine).command
+    assert sim.command.__self__ is engine
+
+    # bound on the instance: resolving it does not go through DEM.__getattr__
+    def unbound(self, name):
+        raise AssertionError("{} resolved through DEM.__getattr__".format(name))
+
+    monkeypatch.setattr(type(sim), "__getattr__", unbound)
+    sim.command("timestep 1e-06")
@@ -0,0 +1,42 @@
+"""Tests that DEM objects write to their own (absolute) output dirs without changing the working dir."""
+
+import os
+
+import pygran_sim as simulation
+
+material = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientRestitution": 0.9,
+    "density": 1000.0,
+}
+
+
+def _sim(output):
+    return simulation.DEM(
+        engine="pygran_sim.engine.simple.engine_simple",
+        species=({"material": material, "radius": 1e-4},),
+        box=(0, 1, 0, 1, 0, 1),
+        output=output,
+    )
+
+
+def test_output(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with _sim("out1") as sim1, _sim("out2") as sim2:
+        assert os.getcwd() == str(tmp_path)
+
+        for sim, output in ((sim1, "out1"), (sim2, "out2")):
+            output = os.path.join(str(tmp_path), output)
+
+            assert sim.pargs["output"] == output
+            assert sim.dem.path == output
+            assert sim.pargs["traj"]["dir"] == os.path.join(output, "traj")
+            assert sim.pfile == os.path.join(output, "traj", "traj.dump")
+            assert os.path.isdir(os.path.join(output, "traj"))
+            assert os.path.isfile(os.path.join(output, "startup.json"))
+
+        sim1.close()
+
+    assert os.getcwd() == str(tmp_path)
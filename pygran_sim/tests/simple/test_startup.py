@@ -0,0 +1,42 @@
+"""Tests the per-phase startup profile of DEM objects."""
+
+import json
+import os
+
+import pygran_sim as simulation
+
+material = {
+    "youngsModulus": 1e7,
+    "poissonsRatio": 0.25,
+    "coefficientRestitution": 0.9,
+    "density": 1000.0,
+}
+
+
+def test_startup_profile(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    sim = simulation.DEM(
+        engine="pygran_sim.engine.simple.engine_simple",
+        species=({"material": material, "radius": 1e-4},),
+        box=(0, 1, 0, 1, 0, 1),
+        output="out",
+    )
+
+    stats = sim.startup_profile.stats
+
+    for phase in (
+        "model",
+        "configure",
+        "split",
+        "engine",
+        "engine/load_library",
+        "initialize",
+    ):
+        assert stats[phase]["min"] <= stats[phase]["mean"] <= stats[phase]["max"]
+
+    with open(os.path.join(str(tmp_path), "out", "startup.json")) as fp:
+        record = json.load(fp)
+
+    assert record["nprocs"] == 1
+    assert set(record["phases"]) == set(stats)
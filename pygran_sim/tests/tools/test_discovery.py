@@ -0,0 +1,100 @@
+"""Tests the discovery and caching of the engine's shared library."""
+
+import os
+
+from pygran_sim import tools
+
+
+def _library(root, *dirs):
+    path = os.path.join(str(root), *dirs)
+    os.makedirs(path)
+    library = os.path.join(path, "libliggghts.so")
+    open(library, "w").close()
+    return library
+
+
+def test_library_path(tmp_path, monkeypatch):
+    library = _library(tmp_path, "lib")
+    monkeypatch.setenv("LD_LIBRARY_PATH", os.path.dirname(library))
+
+    assert tools._findEngines("libliggghts.so") == [os.path.realpath(library)]
+
+
+def test_bounded_search(tmp_path):
+    library = _library(tmp_path, "a", "b")
+
+    # never searched recursively unless requested, and then within maxdepth only
+    assert not tools._findEngines("libliggghts.so", roots=[str(tmp_path)])
+    assert not tools._findEngines("libliggghts.so", roots=[str(tmp_path)], search=1)
+    assert tools._findEngines("libliggghts.so", roots=[str(tmp_path)], search=2) == [
+        os.path.realpath(library)
+    ]
+
+
+def test_config_fingerprint(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    library = _library(tmp_path, "lib")
+
+    assert (
+        tools._setConfig(".", "liggghts", roots=[os.path.dirname(library)])[0]
+        == library
+    )
+    assert tools._readConfig()["fingerprint"] == tools._fingerprint(library)
+
+    # cached: no roots needed anymore
+    assert tools._setConfig(".", "liggghts")[0] == library
+
+    # a rebuilt library invalidates the cached fingerprint
+    with open(library, "w") as fp:
+        fp.write("rebuilt")
+
+    assert tools._setConfig(".", "liggghts")[0] == library
+    assert tools._readConfig()["fingerprint"] == tools._fingerprint(library)
+
+
+def test_version_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    library = _library(tmp_path, "src")
+
+    with open(
+        os.path.join(os.path.dirname(library), "version_liggghts.txt"), "w"
+    ) as fp:
+        fp.write("3.8.0\n")
+
+    assert tools._setConfig(".", "liggghts", library=library) == (
+        library,
+        os.path.dirname(library),
+        3.8,
+    )
+
+    # the version is cached per library build: no probing and no duplicate entries
+    os.remove(os.path.join(os.path.dirname(library), "version_liggghts.txt"))
+    assert tools._libraryVersion(library) == (3.8, os.path.dirname(library))
+
+    with open(tools._configFile()) as fp:
+        assert fp.read().count("version=") == 1
+
+
+def test_version_symbol(tmp_path):
+    library = _library(tmp_path, "lib")
+
+    with open(library, "wb") as fp:
+        fp.write(b"\x00" * 100 + b"Version LIGGGHTS-PUBLIC 3.8.0, compiled" + b"\x00")
+
+    assert tools._probeVersion(library) == (3.8, None)
+
+
+def test_version_malformed(tmp_path):
+    library = _library(tmp_path, "lib")
+
+    with open(library, "wb") as fp:
+        fp.write(b"\x00" * 100 + b"Version LIGGGHTS-PUBLIC 3.7.0, compiled" + b"\x00")
+
+    # a malformed version file falls through to the version compiled into the library
+    for content in ("", "3\n", "3.x.0\n"):
+        with open(
+            os.path.join(os.path.dirname(library), "version_liggghts.txt"), "w"
+        ) as fp:
+            fp.write(content)
+
+        assert tools._probeVersion(library) == (3.7, None)
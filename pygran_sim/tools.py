@@ -27,6 +27,8 @@
 """
 
 import os
+import re
+import subprocess
 import sys
 
 
@@ -88,7 +90,7 @@ def pygranToLIGGGHTS(**material):
     return material
 
 
-def find(fname, path):
+def find(fname, path, maxdepth=None):
     """Finds a filename (fname) along the path `path'
 
     :param fname: filename
@@ -97,13 +99,22 @@ def find(fname, path):
     :param path: search path
     :type path: str
 
+    :param maxdepth: maximum number of directory levels to descend below `path` (default None: unbounded)
+    :type maxdepth: int
+
     :return: absolute path of the fname if found, else None
     :rtype: str/None
     """
+    path = os.path.abspath(path)
+    depth = path.rstrip(os.sep).count(os.sep)
+
     for root, dirs, files in os.walk(path):
         if fname in files:
             return os.path.join(root, fname)
 
+        if maxdepth is not None and root.count(os.sep) - depth >= maxdepth:
+            dirs[:] = []  # prune: do not descend any further
+
     return None
 
 
@@ -119,7 +130,7 @@ def run(program):
     paths = os.environ["PATH"]
 
     for path in paths.split(":"):
-        found = Tools.find(program, path)
+        found = find(program, path, maxdepth=0)
 
         if found:
             print("Launching {}".format(found))
@@ -145,62 +156,293 @@ def configure(path, version=None, src=None):
     _setLIGGGHTS(path, version, src)
 
 
+def _configFile():
+    """Returns the path to the liggghts.ini config file, creating ~/.config/PyGran if needed
+
+    :return: absolute path to liggghts.ini
+    :rtype: str
+    """
+    _configdir = os.path.join(os.path.expanduser("~"), ".config", "PyGran")
+
+    # Make sure ~/.config/PyGran dir exists else create it
+    os.makedirs(_configdir, exist_ok=True)
+
+    return os.path.join(_configdir, "liggghts.ini")
+
+
+def _readConfig():
+    """Reads the key=value entries stored in the liggghts.ini config file
+
+    :return: config entries (library, fingerprint, src, version)
+    :rtype: dict
+    """
+    config = {}
+    liggghts_ini = _configFile()
+
+    if os.path.isfile(liggghts_ini):
+        with open(liggghts_ini, "r") as fp:
+            for line in fp.readlines():
+                if "=" in line:
+                    key, value = line.split("=", 1)
+                    config[key.strip()] = value.rstrip()
+
+    return config
+
+
+def _fingerprint(path):
+    """Computes a cheap fingerprint (size and modification time) of a file. The fingerprint
+    changes whenever the library is rebuilt or replaced.
+
+    :param path: path to file
+    :type path: str
+
+    :return: fingerprint of the form 'size:mtime_ns', or None if the file does not exist
+    :rtype: str/None
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return "{}:{}".format(stat.st_size, stat.st_mtime_ns)
+
+
 def _setLIGGGHTS(path, version=None, src=None):
     """Write libliggghts path to ~/.config/liggghts.ini file
 
     :param path: path to LIGGGHTS library
     :type path: str
 
-    :param version: a set of numbers and/or characters indicating the version of the library, e.g. 1.5a
+    :param version: a set of numbers and/or characters indicating the version of the library, e.g. 1.5a.
+        If not supplied, the version is probed from the library (see :func:`_probeVersion`).
     :type version: str
 
     :param src: path to LIGGGHTS source code
     :type src: str
     """
+    liggghts_ini = _configFile()
+    fingerprint = _fingerprint(path)
 
-    _configdir = os.path.join(os.path.expanduser("~"), ".config", "PyGran")
-    liggghts_ini = os.path.join(_configdir, "liggghts.ini")
+    if version is None:
+        version, probed = _probeVersion(path)
+        src = src or probed
 
     with open(liggghts_ini, "w") as fp:
 
-        fp.seek(0, 0)
         fp.write("library=" + path)
 
+        if fingerprint:
+            fp.write("\nfingerprint=" + fingerprint)
+
         if src:
             fp.write("\nsrc=" + src)
 
-        if version:
-            fp.write("\nversion=" + version)
+        # An unknown version is cached as well so that the probe is not repeated for this build
+        fp.write("\nversion={}".format(version if version is not None else "unknown"))
 
 
-def _findEngines(engine):
-    """Searches for and lists all available libraries for a specific engine
+def _parseVersion(version):
+    """Converts a version entry read from liggghts.ini to a float (major.minor)
 
-    :param engine: DEM engine specification
+    :param version: version entry, e.g. '3.8' or 'unknown'
+    :type version: str
+
+    :return: version or None if unknown
+    :rtype: float/None
+    """
+    try:
+        return float(version)
+    except (TypeError, ValueError):
+        return None
+
+
+def _probeVersion(library):
+    """Determines the version of a LIGGGHTS library without loading it. The version is read from a
+    version_liggghts.txt file next to the library (or in a sibling src dir), else from the version
+    string compiled into the library itself.
+
+    :param library: path to LIGGGHTS library
+    :type library: str
+
+    :return: version (major.minor) and source dir of the library, or (None, None) if not found
+    :rtype: tuple
+    """
+    libdir = os.path.dirname(os.path.abspath(library))
+
+    for src in (libdir, os.path.join(libdir, "src"), os.path.join(libdir, "..", "src")):
+        version_txt = os.path.join(src, "version_liggghts.txt")
+
+        if os.path.isfile(version_txt):
+            with open(version_txt, "r") as fp:
+                fields = fp.readline().strip().split(".")
+
+            try:
+                major, minor = fields[:2]
+                return float(major + "." + minor), os.path.abspath(src)
+            except ValueError:
+                # malformed (e.g. empty or a single component): look further
+                continue
+
+    # e.g. "LIGGGHTS-PUBLIC 3.8.0" or "Version LIGGGHTS-PUBLIC 3.8.0" in the .rodata section
+    pattern = re.compile(rb"LIGGGHTS-[A-Z]+,? (?:Version )?(\d+)\.(\d+)")
+    chunk, overlap = 1 << 20, 64
+
+    try:
+        with open(library, "rb") as fp:
+            tail = b""
+            for block in iter(lambda: fp.read(chunk), b""):
+                match = pattern.search(tail + block)
+
+                if match:
+                    return float(b".".join(match.groups()).decode()), None
+
+                tail = block[-overlap:]
+    except (OSError, ValueError):
+        pass
+
+    return None, None
+
+
+def _libraryVersion(library):
+    """Returns the version of a LIGGGHTS library, probing it (see :func:`_probeVersion`) only once per
+    library build. The result is cached in liggghts.ini along with the library path and fingerprint.
+
+    :param library: path to LIGGGHTS library
+    :type library: str
+
+    :return: version (major.minor) and source dir of the library
+    :rtype: tuple
+    """
+    config = _readConfig()
+    cached = library == config.get("library") and config.get(
+        "fingerprint"
+    ) == _fingerprint(library)
+
+    if cached and "version" in config:
+        return _parseVersion(config["version"]), config.get("src")
+
+    if cached or not config:
+        _setLIGGGHTS(library, src=config.get("src"))
+        config = _readConfig()
+        return _parseVersion(config.get("version")), config.get("src")
+
+    # Not the configured library: probe it without touching the config file
+    return _probeVersion(library)
+
+
+def _libraryPaths(roots=None):
+    """Lists candidate directories in which to look for a shared library, ordered by priority:
+    user-specified roots (`roots` and the PYGRAN_LIBRARY_PATH environment variable), LD_LIBRARY_PATH,
+    and the library dirs of the active conda/venv/python prefixes. None of these is searched recursively.
+
+    :param roots: user-specified directories
+    :type roots: list
+
+    :return: unique candidate directories
+    :rtype: list
+    """
+    paths = list(roots or [])
+
+    for var in ("PYGRAN_LIBRARY_PATH", "LD_LIBRARY_PATH"):
+        paths += [path for path in os.environ.get(var, "").split(os.pathsep) if path]
+
+    for prefix in (
+        os.environ.get("CONDA_PREFIX"),
+        os.environ.get("VIRTUAL_ENV"),
+        sys.prefix,
+    ):
+        if prefix:
+            paths += [os.path.join(prefix, "lib"), os.path.join(prefix, "lib64")]
+
+    unique = []
+    for path in paths:
+        path = os.path.abspath(os.path.expanduser(path))
+        if path not in unique:
+            unique.append(path)
+
+    return unique
+
+
+def _ldconfig(fname):
+    """Looks up a shared library in the ldconfig cache
+
+    :param fname: library filename, e.g. libliggghts.so
+    :type fname: str
+
+    :return: paths of all matching libraries in the cache
+    :rtype: list
+    """
+    for ldconfig in ("ldconfig", "/sbin/ldconfig", "/usr/sbin/ldconfig"):
+        try:
+            output = subprocess.run(
+                [ldconfig, "-p"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+                timeout=10,
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+
+        return [
+            line.split("=>")[-1].strip()
+            for line in output.splitlines()
+            if line.strip().startswith(fname + " ") and "=>" in line
+        ]
+
+    return []
+
+
+def _findEngines(engine, roots=None, search=False):
+    """Searches for and lists all available libraries for a specific engine. Only well-known locations
+    are checked (see :func:`_libraryPaths`) unless a bounded recursive search is requested.
+
+    :param engine: DEM engine library filename, e.g. libliggghts.so
     :type engine: str
 
+    :param roots: user-specified directories to check first
+    :type roots: list
+
+    :param search: recursively search (up to a depth of `search` if int, else 4) under `roots`,
+        the working directory, home, /opt, and /usr/local as a last resort
+    :type search: bool/int
+
     :return: all DEM engines found on the system
     :rtype: list
     """
 
-    engines = [
-        os.path.join(root, engine)
-        for root, dirs, files in os.walk("/")
-        if engine in files
-    ]
+    engines = []
 
-    if engines:
-        print("Engine(s) found:")
-        for engine in engines:
-            print(engine)
-    else:
-        print("No engines found.")
+    def register(path):
+        if path and os.path.isfile(path):
+            path = os.path.realpath(path)
+            if path not in engines:
+                engines.append(path)
+
+    for path in _libraryPaths(roots):
+        register(os.path.join(path, engine))
+
+    for path in _ldconfig(engine):
+        register(path)
+
+    if search and not engines:
+        maxdepth = 4 if search is True else int(search)
+        for root in list(roots or []) + [
+            os.getcwd(),
+            os.path.expanduser("~"),
+            "/opt",
+            "/usr/local",
+        ]:
+            if os.path.isdir(root):
+                register(find(engine, root, maxdepth=maxdepth))
 
     return engines
 
 
-def _setConfig(wdir, engine):
-    """Reads/writes DEM library to config .ini file
+def _setConfig(wdir, engine, library=None, roots=None, search=False):
+    """Reads/writes DEM library to config .ini file. The cached library is used as long as its
+    path and fingerprint (size and mtime) are unchanged; otherwise, the library is looked up again
+    (see :func:`_findEngines`) and the config file is updated.
 
     :param wdir: working directory
     :type wdir: str
@@ -208,70 +450,73 @@ def _setConfig(wdir, engine):
     :param engine: DEM engine specification
     :type engine: str
 
+    :param library: user-specified path to library, takes precedence over the config file
+    :type library: str
+
+    :param roots: user-specified directories to look for the library in
+    :type roots: list
+
+    :param search: allow a bounded recursive search if the library is not found elsewhere
+    :type search: bool/int
+
     :return: path to library, source, and version of DEM library
     :rtype: tuple
 
     .. todo: Make this function platform and liggghts independent
     """
-    library, src, version = "", None, None
-
-    _configdir = os.path.join(os.path.expanduser("~"), ".config", "PyGran")
-    liggghts_ini = os.path.join(_configdir, "liggghts.ini")
-
-    # Make sure ~/.config/PyGran dir exists else create it
-    if not os.path.isdir(_configdir):
-        if not os.path.isdir(os.path.join(os.path.expanduser("~"), ".config")):
-            os.mkdir(os.path.join(os.path.expanduser("~"), ".config"))
-        os.mkdir(_configdir)
-
-    if os.path.isfile(liggghts_ini):
-
-        if os.stat(liggghts_ini).st_size:  # file not empty
-
-            with open(liggghts_ini, "r+") as fp:  # r+ is for reading and writing
-                for line in fp.readlines():
-                    if "library=" in line:
-                        library = line.split("=")[-1].rstrip()
-                    elif "src" in line:
-                        src = line.split("=")[-1].rstrip()
-                    elif "version" in line:
-                        version = float(line.split("=")[-1].rstrip())
-
-            # Make sure the library exists; else, find it somewhere else
-            if not os.path.isfile(library):
-                library = find("lib" + engine + ".so", "/")
-                _setLIGGGHTS(library)
-                print(
-                    "WARNING: Could not find user-specified library. Will use {} instead ...".format(
-                        library
-                    )
-                )
-
-            return library, src, version
-
-    with open(liggghts_ini, "w") as fp:
-        library = find("lib" + engine + ".so", "/")
+    src, version = None, None
+    config = _readConfig()
+
+    library = os.path.abspath(library) if library else config.get("library")
+
+    # Make sure the cached library still exists and was not rebuilt since
+    if (
+        library
+        and library == config.get("library")
+        and config.get("fingerprint") == _fingerprint(library)
+    ):
+        if "version" in config:
+            return library, config.get("src"), _parseVersion(config["version"])
+
+        # Config written by an older PyGran version: probe and cache the version once
+        version, src = _libraryVersion(library)
+        return library, src, version
+
+    if library and os.path.isfile(library):
+        library = os.path.abspath(library)
+    else:
+        found = _findEngines("lib" + engine + ".so", roots=roots, search=search)
 
         if library:
             print(
-                "No config file found. Creating one for {} in {}".format(
-                    library, os.path.abspath(liggghts_ini)
-                )
-            )
-            _setLIGGGHTS(library)
-        else:
-            print(
-                "No installation of {} was found. Make sure your selected DEM engine is properly installed first.".format(
-                    engine
+                "WARNING: Could not find user-specified library {}. Will use {} instead ...".format(
+                    library, found[0] if found else None
                 )
             )
-            print(
-                "PyGran looked for "
-                + "lib"
-                + engine
-                + ".so"
-                + ". If the file exists, make sure it can be executed by the user."
+
+        library = found[0] if found else None
+
+    if library:
+        # The source dir is still valid for a rebuilt library, but its version might not be
+        if library == config.get("library"):
+            src = config.get("src")
+
+        print(
+            "Creating config file for {} in {}".format(
+                library, os.path.abspath(_configFile())
             )
-            sys.exit()
+        )
+
+        # Probe the version once per library build, then cache it along with its fingerprint
+        _setLIGGGHTS(library, src=src)
+        config = _readConfig()
+        src, version = config.get("src"), _parseVersion(config.get("version"))
+    else:
+        raise RuntimeError(
+            "No installation of lib{0}.so was found. PyGran looked in LD_LIBRARY_PATH, PYGRAN_LIBRARY_PATH,"
+            " the ldconfig cache, and the python/conda/venv prefix. Use 'library_roots' to add directories,"
+            " 'library_search' to search them recursively, or pygran_sim.tools.configure to set the"
+            " library path.".format(engine)
+        )
 
     return library, src, version